@@ -1,11 +1,22 @@
-from typing import Any
+from contextlib import contextmanager
+from typing import Any, Iterator
 
 from httpx import Client, URL, QueryParams, Response
 from httpx._types import RequestData, RequestFiles
 import allure
 
+from tools.http.coalescing import STREAMING_EXTENSION
+from tools.http.serialization import JSON_HEADERS
+from tools.http.timings import RequestTracer, timings_collector
+from tools.slo import slo_tracker
+from tools.allure.reporting import step, attach
+
 
 class APIClient:
+    # Трассировка фаз, сводка таймингов и проверка SLO для каждого запроса. Агенты нагрузки выключают их:
+    # на их частотах это заметная доля CPU процесса, а сводки и бюджеты там считает сам сценарий
+    instrumented: bool = True
+
     def __init__(self, client: Client):
         """
         Базовый API клиент, принимающий объект httpx.Client.
@@ -15,6 +26,76 @@ class APIClient:
         self.client = client
 
 
+    def request(self, method: str, url: URL | str, **kwargs) -> Response:
+        """
+        Выполняет HTTP-запрос с трассировкой фаз соединения.
+
+        Разбивка времени (ожидание пула, connect, TLS, отправка, TTFB, чтение тела)
+        прикрепляется к текущему шагу Allure и попадает в сводку сессии.
+
+        :param method: HTTP-метод.
+        :param url: URL-адрес эндпоинта.
+        :param kwargs: Остальные аргументы httpx.Client.request.
+        :return: Объект Response с данными ответа.
+        """
+        if not self.instrumented:
+            return self.client.request(method, url, **kwargs)
+
+        tracer = RequestTracer()
+        response = self.client.request(method, url, extensions={"trace": tracer}, **kwargs)
+
+        self._record_timings(tracer, response)
+        return response
+
+
+    @contextmanager
+    def stream(self, method: str, url: URL | str, **kwargs) -> Iterator[Response]:
+        """
+        Выполняет HTTP-запрос без предварительного чтения тела ответа.
+
+        Шаг Allure накрывает только отправку запроса и получение заголовков,
+        тело читается вызывающим кодом по мере поступления (response.iter_bytes()).
+
+        :param method: HTTP-метод.
+        :param url: URL-адрес эндпоинта.
+        :param kwargs: Остальные аргументы httpx.Client.build_request.
+        :return: Контекстный менеджер с объектом Response, тело которого ещё не прочитано.
+        """
+        tracer = RequestTracer() if self.instrumented else None
+        # Потоковый запрос не объединяется с другими: тело должно читаться по мере поступления
+        extensions = {STREAMING_EXTENSION: True} if tracer is None else {"trace": tracer, STREAMING_EXTENSION: True}
+
+        with step(f"Отправка потокового {method}-запроса на {url}"):
+            request = self.client.build_request(method, url, extensions=extensions, **kwargs)
+            response = self.client.send(request, stream=True)
+
+        try:
+            yield response
+        finally:
+            response.close()
+            if tracer is not None:
+                self._record_timings(tracer, response)
+
+
+    @staticmethod
+    def _record_timings(tracer: RequestTracer, response: Response):
+        timings = tracer.build(response)
+        timings_collector.add(timings)
+        report = timings.render()
+        try:
+            report += f"\nelapsed={response.elapsed.total_seconds() * 1000:.1f}ms"
+        except RuntimeError:
+            # Ответы с заранее прочитанным телом (например, из подменного транспорта) не хранят elapsed
+            pass
+
+        attach(report, "Request timings", allure.attachment_type.TEXT)
+
+        # Для потоковых ответов, закрытых без чтения тела, размер неизвестен и считается нулевым
+        response_size = response.num_bytes_downloaded or (len(response.content) if response.is_stream_consumed else 0)
+        if violations := slo_tracker.check(timings, response_size):
+            attach("\n".join(violations), "SLO violations", allure.attachment_type.TEXT)
+
+
     def get(self, url: URL | str, params: QueryParams | None = None) -> Response:
         """
         Выполняет GET-запрос.
@@ -23,8 +104,8 @@ class APIClient:
         :param params: GET-параметры запроса (например, ?key=value).
         :return: Объект Response с данными ответа.
         """
-        with allure.step(f"Отправка GET-запроса на {url}"):
-            return self.client.get(url, params=params)
+        with step(f"Отправка GET-запроса на {url}"):
+            return self.request("GET", url, params=params)
 
 
     def post(
@@ -32,7 +113,8 @@ class APIClient:
             url: URL | str,
             json: Any | None = None,
             data: RequestData | None = None,
-            files: RequestFiles | None = None
+            files: RequestFiles | None = None,
+            content: bytes | None = None
     ) -> Response:
         """
         Выполняет POST-запрос.
@@ -41,22 +123,30 @@ class APIClient:
         :param json: Данные в формате JSON.
         :param data: Форматированные данные формы (например, application/x-www-form-urlencoded).
         :param files: Файлы для загрузки на сервер.
+        :param content: Заранее сериализованное JSON-тело (см. tools.http.serialization.dump_json_content).
         :return: Объект Response с данными ответа.
         """
-        with allure.step(f"Отправка POST-запроса на {url}"):
-            return self.client.post(url, json=json, data=data, files=files)
+        with step(f"Отправка POST-запроса на {url}"):
+            if content is not None:
+                return self.request("POST", url, content=content, headers=JSON_HEADERS)
+
+            return self.request("POST", url, json=json, data=data, files=files)
 
 
-    def patch(self, url: URL | str, json: Any | None = None) -> Response:
+    def patch(self, url: URL | str, json: Any | None = None, content: bytes | None = None) -> Response:
         """
         Выполняет PATCH-запрос (частичное обновление данных).
 
         :param url: URL-адрес эндпоинта.
         :param json: Данные для обновления в формате JSON.
+        :param content: Заранее сериализованное JSON-тело (см. tools.http.serialization.dump_json_content).
         :return: Объект Response с данными ответа.
         """
-        with allure.step(f"Отправка PATCH-запроса на {url}"):
-            return self.client.patch(url, json=json)
+        with step(f"Отправка PATCH-запроса на {url}"):
+            if content is not None:
+                return self.request("PATCH", url, content=content, headers=JSON_HEADERS)
+
+            return self.request("PATCH", url, json=json)
 
 
     def delete(self, url: URL | str) -> Response:
@@ -66,5 +156,5 @@ class APIClient:
         :param url: URL-адрес эндпоинта.
         :return: Объект Response с данными ответа.
         """
-        with allure.step(f"Отправка DELETE-запроса на {url}"):
-            return self.client.delete(url)
+        with step(f"Отправка DELETE-запроса на {url}"):
+            return self.request("DELETE", url)
@@ -1,3 +1,172 @@
-from swagger_coverage_tool import SwaggerCoverageTracker
+import functools
+import inspect
+import json
+import threading
+import uuid
+from pathlib import Path
+from typing import Callable, Any
 
-tracker = SwaggerCoverageTracker(service="api-course")
\ No newline at end of file
+from httpx import Response
+from pydantic import BaseModel
+
+from tools.logger import get_logger
+
+logger = get_logger("API_COVERAGE")
+
+
+class EndpointHitsSchema(BaseModel):
+    """
+    Агрегированное покрытие одного сочетания (метод, шаблон маршрута, статус-код).
+    """
+    method: str
+    endpoint: str
+    status_code: int
+    count: int = 0
+    query_parameters: set[str] = set()
+    is_request_covered: bool = False
+    is_response_covered: bool = False
+
+    def merge(self, other: "EndpointHitsSchema"):
+        self.count += other.count
+        self.query_parameters |= other.query_parameters
+        self.is_request_covered |= other.is_request_covered
+        self.is_response_covered |= other.is_response_covered
+
+
+class CoverageTracker:
+    """
+    Сборщик покрытия API в памяти.
+
+    На каждый запрос обновляется только счётчик в словаре, без обращений к диску.
+    Результаты воркеров xdist сливаются в конце сессии и сохраняются одним файлом
+    (см. fixtures/coverage.py).
+    """
+
+    def __init__(self, service: str):
+        self.service = service
+        self._lock = threading.Lock()
+        self._hits: dict[tuple[str, str, int], EndpointHitsSchema] = {}
+
+    def track_response(self, endpoint: str, response: Response):
+        """
+        Учитывает ответ в покрытии.
+
+        Тело запроса и ответа не читается: наличие тела определяется по заголовкам,
+        поэтому учёт работает и для потоковых запросов.
+
+        :param endpoint: Шаблон маршрута (например, /api/v1/courses/{course_id}).
+        :param response: Ответ сервера.
+        """
+        request = response.request
+        key = (request.method, endpoint, response.status_code)
+
+        with self._lock:
+            hits = self._hits.get(key)
+            if hits is None:
+                hits = self._hits[key] = EndpointHitsSchema(
+                    method=request.method,
+                    endpoint=endpoint,
+                    status_code=response.status_code
+                )
+
+            hits.count += 1
+            hits.query_parameters.update(request.url.params.keys())
+            hits.is_request_covered |= self._has_body(request.headers)
+            hits.is_response_covered |= self._has_body(response.headers)
+
+    @staticmethod
+    def _has_body(headers) -> bool:
+        return headers.get("content-length", "0") != "0" or "transfer-encoding" in headers
+
+    def track_coverage_httpx(self, endpoint: str):
+        """
+        Декоратор метода API-клиента, учитывающий возвращённый ответ в покрытии.
+
+        :param endpoint: Шаблон маршрута эндпоинта.
+        """
+        def wrapper(func: Callable[..., Response]):
+            signature = inspect.signature(func)
+
+            @functools.wraps(func)
+            def inner(*args, **kwargs):
+                response = func(*args, **kwargs)
+                self.track_response(endpoint, response)
+                return response
+
+            inner.__signature__ = signature
+            return inner
+
+        return wrapper
+
+    def dump(self) -> list[dict[str, Any]]:
+        """
+        Возвращает накопленное покрытие в виде, пригодном для передачи между процессами.
+        """
+        with self._lock:
+            return [hits.model_dump(mode="json") for hits in self._hits.values()]
+
+    def merge(self, results: list[dict[str, Any]]):
+        """
+        Добавляет покрытие, собранное другим процессом (воркером xdist).
+        """
+        with self._lock:
+            for result in results:
+                other = EndpointHitsSchema.model_validate(result)
+                key = (other.method, other.endpoint, other.status_code)
+
+                if key in self._hits:
+                    self._hits[key].merge(other)
+                else:
+                    self._hits[key] = other
+
+    def save(self, results_file: Path):
+        """
+        Сохраняет покрытие одним компактным файлом и выгружает его в формате swagger-coverage-tool,
+        чтобы `swagger-coverage-tool save-report` строил отчёт.
+
+        :param results_file: Путь к итоговому файлу покрытия.
+        """
+        results = sorted(self.dump(), key=lambda item: (item["endpoint"], item["method"], item["status_code"]))
+        if not results:
+            return
+
+        results_file.write_text(json.dumps({"service": self.service, "endpoints": results}, indent=2))
+        logger.info(f"Покрытие API сохранено в {results_file}: {len(results)} сочетаний")
+
+        try:
+            self._export_swagger_coverage()
+        except Exception as error:
+            logger.error(f"Не удалось выгрузить покрытие в формате swagger-coverage-tool: {error}")
+
+    def _export_swagger_coverage(self):
+        """
+        Выгружает покрытие в каталог swagger-coverage-tool: по файлу на каждый учтённый запрос.
+
+        Отчёт swagger-coverage-tool считает запросы (totalCases) по числу файлов, поэтому сочетание
+        с count=N записывается N раз. JSON сочетания сериализуется один раз, а файлы пишутся
+        в конце сессии, а не на каждый запрос.
+        """
+        from swagger_coverage_tool.config import get_settings
+        from swagger_coverage_tool.src.tracker.models import EndpointCoverage
+
+        results_dir = get_settings().results_dir
+        results_dir.mkdir(parents=True, exist_ok=True)
+
+        with self._lock:
+            hits_list = list(self._hits.values())
+
+        for hits in hits_list:
+            content = EndpointCoverage(
+                name=hits.endpoint,
+                method=hits.method,
+                service=self.service,
+                status_code=hits.status_code,
+                query_parameters=sorted(hits.query_parameters),
+                is_request_covered=hits.is_request_covered,
+                is_response_covered=hits.is_response_covered,
+            ).model_dump_json()
+
+            for _ in range(hits.count):
+                results_dir.joinpath(f"{uuid.uuid4()}.json").write_text(content)
+
+tracker = CoverageTracker(service="api-course")
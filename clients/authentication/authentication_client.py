@@ -1,4 +1,3 @@
-import allure
 from httpx import Response
 
 from clients.api_client import APIClient
@@ -6,6 +5,8 @@ from clients.authentication.authentication_schema import LoginRequestSchema, Ref
 from clients.public_http_buider import get_public_http_client
 from tools.routes import APIRoutes
 from clients.api_coverage import tracker
+from tools.allure.reporting import step
+from tools.http.serialization import dump_json_content
 
 
 class AuthenticationClient(APIClient):
@@ -13,7 +14,7 @@ class AuthenticationClient(APIClient):
     Клиент для работы с /api/v1/authentication
     """
 
-    @allure.step("Аутентификация юзера")
+    @step("Аутентификация юзера")
     @tracker.track_coverage_httpx(f"{APIRoutes.AUTHENTICATION}/login")
     def login_api(self, request: LoginRequestSchema) -> Response:
         """
@@ -24,10 +25,10 @@ class AuthenticationClient(APIClient):
         """
         return self.post(
             f"{APIRoutes.AUTHENTICATION}/login",
-            json=request.model_dump(by_alias=True)
+            content=dump_json_content(request)
         )
 
-    @allure.step("Обновление токена аутентификации")
+    @step("Обновление токена аутентификации")
     @tracker.track_coverage_httpx(f"{APIRoutes.AUTHENTICATION}/refresh")
     def refresh_api(self, request: RefreshRequestSchema) -> Response:
         """
@@ -38,7 +39,7 @@ class AuthenticationClient(APIClient):
         """
         return self.post(
             f"{APIRoutes.AUTHENTICATION}/refresh",
-            json=request.model_dump(by_alias=True)
+            content=dump_json_content(request)
         )
 
     def login(self, request: LoginRequestSchema) -> LoginResponseSchema:
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 from tools.fakers import fake
 
@@ -15,7 +15,11 @@ class TokenSchema(BaseModel):
 class LoginRequestSchema(BaseModel):
     """
     Описание структуры запроса на аутентификацию.
+
+    Неизменяемая: при повторных логинах тело запроса берётся из кеша сериализации.
     """
+    model_config = ConfigDict(frozen=True)
+
     email: str = Field(default_factory=fake.email)
     password: str = Field(default_factory=fake.password)
 
@@ -31,4 +35,6 @@ class RefreshRequestSchema(BaseModel):
     """
     Описание структуры запроса для обновления токена.
     """
+    model_config = ConfigDict(frozen=True)
+
     refresh_token: str = Field(alias="refreshToken", default_factory=fake.sentence)
@@ -1,12 +1,17 @@
-import allure
+from typing import Iterator
+
 from httpx import Response
 
 from clients.api_client import APIClient
 from clients.api_coverage import tracker
 from clients.courses.courses_schema import CreateCourseRequestSchema, CreateCourseResponseSchema, \
-    UpdateCourseRequestSchema, GetCoursesQuerySchema
+    UpdateCourseRequestSchema, GetCoursesQuerySchema, CourseSchema, CourseRecord
 from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema
+from tools.columnar import CoursesTable
+from tools.http.json_stream import iter_json_array_items
 from tools.routes import APIRoutes
+from tools.allure.reporting import step
+from tools.http.serialization import dump_json_content
 
 
 class CoursesClient(APIClient):
@@ -14,7 +19,7 @@ class CoursesClient(APIClient):
     Клиент для работы с /api/v1/courses
     """
 
-    @allure.step("Получить список курсов")
+    @step("Получить список курсов")
     @tracker.track_coverage_httpx(APIRoutes.COURSES)
     def get_courses_api(self, query: GetCoursesQuerySchema) -> Response:
         """
@@ -25,6 +30,35 @@ class CoursesClient(APIClient):
         """
         return self.get(APIRoutes.COURSES, params=query.model_dump(by_alias=True))
 
+    def get_courses_stream(self, query: GetCoursesQuerySchema) -> Iterator[CourseSchema]:
+        """
+        Метод потокового получения списка курсов.
+
+        Тело ответа читается кусками, каждый курс валидируется и отдаётся сразу,
+        без загрузки всего GetCoursesResponseSchema в память.
+
+        :param query: Словарь с userId.
+        :return: Итератор по курсам в порядке их следования в ответе.
+        :raises httpx.HTTPStatusError: Если сервер вернул неуспешный статус-код.
+        """
+        with self.stream("GET", APIRoutes.COURSES, params=query.model_dump(by_alias=True)) as response:
+            tracker.track_response(APIRoutes.COURSES, response)
+            response.raise_for_status()
+
+            for item in iter_json_array_items(response.iter_bytes(), "courses"):
+                yield CourseSchema.model_validate_json(item)
+
+    def get_courses_table(self, query: GetCoursesQuerySchema) -> CoursesTable:
+        """
+        Метод получения списка курсов в колоночном виде, без построения моделей Pydantic.
+
+        :param query: Словарь с userId.
+        :return: Объект CoursesTable.
+        :raises httpx.HTTPStatusError: Если сервер вернул неуспешный статус-код.
+        """
+        response = self.get_courses_api(query)
+        response.raise_for_status()
+        return CoursesTable.from_json(response.content, "courses")
 
     @tracker.track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")
     def get_course_api(self, course_id: str) -> Response:
@@ -35,22 +69,22 @@ class CoursesClient(APIClient):
         :return: Ответ от сервера в виде объекта httpx.Response
         """
 
-        with allure.step(f"Получить курс по id = {course_id}"):
+        with step(f"Получить курс по id = {course_id}"):
             return self.get(f"{APIRoutes.COURSES}/{course_id}")
 
-    @allure.step("Создать курс")
+    @step("Создать курс")
     @tracker.track_coverage_httpx(APIRoutes.COURSES)
-    def create_course_api(self, request: CreateCourseRequestSchema) -> Response:
+    def create_course_api(self, request: CreateCourseRequestSchema | bytes) -> Response:
         """
         Метод создания курса.
 
         :param request: Словарь с title, maxScore, minScore, description, estimatedTime,
-        previewFileId, createdByUserId.
+        previewFileId, createdByUserId, либо готовое JSON-тело из шаблона tools.load.templates.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
         return self.post(
             APIRoutes.COURSES,
-            json=request.model_dump(by_alias=True)
+            content=dump_json_content(request)
         )
 
     @tracker.track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")
@@ -63,10 +97,10 @@ class CoursesClient(APIClient):
         :return: Ответ от сервера в виде объекта httpx.Response
         """
 
-        with allure.step(f"Обновить курс по id={course_id}"):
+        with step(f"Обновить курс по id={course_id}"):
             return self.patch(
                 f"{APIRoutes.COURSES}/{course_id}",
-                json=request.model_dump(by_alias=True)
+                content=dump_json_content(request)
             )
 
     @tracker.track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")
@@ -77,13 +111,23 @@ class CoursesClient(APIClient):
         :param course_id: Идентификатор курса.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        with allure.step(f"Удалить курс по id= {course_id}"):
+        with step(f"Удалить курс по id= {course_id}"):
             return self.delete(f"{APIRoutes.COURSES}/{course_id}")
 
     def create_course(self, request: CreateCourseRequestSchema) -> CreateCourseResponseSchema:
         response = self.create_course_api(request)
         return CreateCourseResponseSchema.model_validate_json(response.text)
 
+    def create_course_record(self, request: CreateCourseRequestSchema) -> CourseRecord:
+        """
+        Создаёт курс и возвращает его компактную запись без валидации Pydantic (для больших наборов данных).
+
+        :raises httpx.HTTPStatusError: Если сервер вернул неуспешный статус-код.
+        """
+        response = self.create_course_api(request)
+        response.raise_for_status()
+        return CourseRecord.from_json(response.content, key="course")
+
 
 def get_courses_client(user: AuthenticationUserSchema) -> CoursesClient:
     """
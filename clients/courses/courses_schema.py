@@ -1,3 +1,7 @@
+import json
+from dataclasses import dataclass, field
+from typing import Self
+
 from pydantic import BaseModel, Field, ConfigDict
 from pydantic.alias_generators import to_camel
 
@@ -114,4 +118,49 @@ class UpdateCourseResponseSchema(ApiBaseModel):
 
     Возвращает полные данные обновлённого курса.
     """
-    course: CourseSchema
\ No newline at end of file
+    course: CourseSchema
+
+
+@dataclass(frozen=True, slots=True)
+class CourseRecord:
+    """
+    Компактное представление курса для наборов из тысяч сущностей.
+
+    Хранит только ключевые поля и исходный JSON курса; полная модель CourseSchema
+    строится по требованию (to_schema), например, когда курс нужно передать в assert_course.
+    """
+    id: str
+    title: str
+    max_score: int
+    min_score: int
+    estimated_time: str
+    preview_file_id: str
+    created_by_user_id: str
+    raw: bytes = field(repr=False, compare=False)
+
+    @classmethod
+    def from_json(cls, data: bytes, key: str | None = None) -> Self:
+        """
+        Создаёт запись из JSON курса без валидации Pydantic.
+
+        :param data: JSON курса или ответа, в котором курс лежит под ключом key.
+        :param key: Ключ курса в ответе (например, "course" для ответа на создание).
+        """
+        course = json.loads(data)
+        if key is not None:
+            course = course[key]
+            data = json.dumps(course, separators=(",", ":")).encode()
+
+        return cls(
+            id=course["id"],
+            title=course["title"],
+            max_score=course["maxScore"],
+            min_score=course["minScore"],
+            estimated_time=course["estimatedTime"],
+            preview_file_id=course["previewFile"]["id"],
+            created_by_user_id=course["createdByUser"]["id"],
+            raw=data
+        )
+
+    def to_schema(self) -> CourseSchema:
+        return CourseSchema.model_validate_json(self.raw)
@@ -3,6 +3,7 @@ from httpx import Request, Response
 
 from tools.http.curl import make_curl_from_request
 from tools.logger import get_logger
+from tools.allure.reporting import attach, reporter
 
 logger = get_logger("HTTP_LOGGER")
 
@@ -12,8 +13,11 @@ def curl_event_hook(request: Request):
     Event hook для автоматического прикрепления cURL команды к Allure отчету.
     :param request: HTTP-запрос, переданный в `httpx` клиент.
     """
+    if not reporter.enabled:
+        return
+
     curl_command = make_curl_from_request(request)
-    allure.attach(curl_command, "cURL command", allure.attachment_type.TEXT)
+    attach(curl_command, "cURL command", allure.attachment_type.TEXT)
 
 
 def log_request_event_hook(request: Request):
@@ -1,13 +1,18 @@
-import allure
+from typing import Iterator
+
 from httpx import Response
 
 from clients.api_client import APIClient
 from clients.api_coverage import tracker
 from clients.exercises.exercises_schema import GetExercisesResponseSchema, GetExercisesQuerySchema, \
     GetExerciseResponseSchema, CreateExerciseRequestSchema, UpdateExerciseRequestSchema, CreateExerciseResponseSchema, \
-    UpdateExerciseResponseSchema
+    UpdateExerciseResponseSchema, ExerciseSchema, ExerciseRecord
 from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema
+from tools.columnar import ExercisesTable
+from tools.http.json_stream import iter_json_array_items
 from tools.routes import APIRoutes
+from tools.allure.reporting import step
+from tools.http.serialization import dump_json_content
 
 
 class ExercisesClient(APIClient):
@@ -15,7 +20,7 @@ class ExercisesClient(APIClient):
     Клиент для работы с /api/v1/exercises
     """
 
-    @allure.step("Получить список заданий")
+    @step("Получить список заданий")
     @tracker.track_coverage_httpx(APIRoutes.EXERCISES)
     def get_exercises_api(self, query: GetExercisesQuerySchema) -> Response:
         """
@@ -30,6 +35,36 @@ class ExercisesClient(APIClient):
         response = self.get_exercises_api(query)
         return GetExercisesResponseSchema.model_validate_json(response.text)
 
+    def get_exercises_stream(self, query: GetExercisesQuerySchema) -> Iterator[ExerciseSchema]:
+        """
+        Метод потокового получения списка заданий для определенного курса.
+
+        Тело ответа читается кусками, каждое задание валидируется и отдаётся сразу,
+        без загрузки всего GetExercisesResponseSchema в память.
+
+        :param query: Словарь с courseId.
+        :return: Итератор по заданиям в порядке их следования в ответе.
+        :raises httpx.HTTPStatusError: Если сервер вернул неуспешный статус-код.
+        """
+        with self.stream("GET", APIRoutes.EXERCISES, params=query.model_dump(by_alias=True)) as response:
+            tracker.track_response(APIRoutes.EXERCISES, response)
+            response.raise_for_status()
+
+            for item in iter_json_array_items(response.iter_bytes(), "exercises"):
+                yield ExerciseSchema.model_validate_json(item)
+
+    def get_exercises_table(self, query: GetExercisesQuerySchema) -> ExercisesTable:
+        """
+        Метод получения списка заданий в колоночном виде, без построения моделей Pydantic.
+
+        :param query: Словарь с courseId.
+        :return: Объект ExercisesTable.
+        :raises httpx.HTTPStatusError: Если сервер вернул неуспешный статус-код.
+        """
+        response = self.get_exercises_api(query)
+        response.raise_for_status()
+        return ExercisesTable.from_json(response.content, "exercises")
+
 
     @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
     def get_exercise_api(self, exercise_id: str) -> Response:
@@ -40,31 +75,40 @@ class ExercisesClient(APIClient):
         :return: Ответ от сервера в виде объекта httpx.Response
         """
 
-        with allure.step(f"Получить задание по id={exercise_id}"):
+        with step(f"Получить задание по id={exercise_id}"):
             return self.get(f"{APIRoutes.EXERCISES}/{exercise_id}")
 
     def get_exercise(self, exercise_id: str) -> GetExerciseResponseSchema:
         response = self.get_exercise_api(exercise_id)
         return GetExerciseResponseSchema.model_validate_json(response.text)
 
-    @allure.step("Создать новое задание")
+    @step("Создать новое задание")
     @tracker.track_coverage_httpx(APIRoutes.EXERCISES)
-    def create_exercise_api(self, request: CreateExerciseRequestSchema) -> Response:
+    def create_exercise_api(self, request: CreateExerciseRequestSchema | bytes) -> Response:
         """
         Метод создания задания.
 
-        :param request: Словарь с title, courseId, maxScore, minScore, orderIndex, description, estimatedTime.
+        :param request: Словарь с title, courseId, maxScore, minScore, orderIndex, description, estimatedTime,
+        либо готовое JSON-тело из шаблона tools.load.templates.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
         return self.post(
             APIRoutes.EXERCISES,
-            json=request.model_dump(by_alias=True))
+            content=dump_json_content(request))
 
     def create_exercise(self, request: CreateExerciseRequestSchema) -> CreateExerciseResponseSchema:
         response = self.create_exercise_api(request)
         return CreateExerciseResponseSchema.model_validate_json(response.text)
 
+    def create_exercise_record(self, request: CreateExerciseRequestSchema) -> ExerciseRecord:
+        """
+        Создаёт задание и возвращает его компактную запись без валидации Pydantic (для больших наборов данных).
 
+        :raises httpx.HTTPStatusError: Если сервер вернул неуспешный статус-код.
+        """
+        response = self.create_exercise_api(request)
+        response.raise_for_status()
+        return ExerciseRecord.from_json(response.content, key="exercise")
 
     @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
     def update_exercise_api(self, exercise_id: str, request: UpdateExerciseRequestSchema) -> Response:
@@ -75,8 +119,8 @@ class ExercisesClient(APIClient):
         :param request: Словарь с title, maxScore, minScore, orderIndex, description, estimatedTime.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        with allure.step(f"Обновить задание c id={exercise_id}"):
-            return self.patch(f"{APIRoutes.EXERCISES}/{exercise_id}", json=request.model_dump(by_alias=True))
+        with step(f"Обновить задание c id={exercise_id}"):
+            return self.patch(f"{APIRoutes.EXERCISES}/{exercise_id}", content=dump_json_content(request))
 
     def update_exercise(
             self,
@@ -96,7 +140,7 @@ class ExercisesClient(APIClient):
         :return: Ответ от сервера в виде объекта httpx.Response
         """
 
-        with allure.step(f"Удалить задание c id={exercise_id}"):
+        with step(f"Удалить задание c id={exercise_id}"):
             return self.delete(f"{APIRoutes.EXERCISES}/{exercise_id}")
 
 
@@ -1,3 +1,7 @@
+import json
+from dataclasses import dataclass, field
+from typing import Self
+
 from pydantic import BaseModel, Field, ConfigDict
 
 from tools.fakers import fake
@@ -83,3 +87,48 @@ class UpdateExerciseResponseSchema(BaseModel):
     Описание структуры ответа обновления задания.
     """
     exercise: ExerciseSchema
+
+
+@dataclass(frozen=True, slots=True)
+class ExerciseRecord:
+    """
+    Компактное представление задания для наборов из тысяч сущностей.
+
+    Хранит только ключевые поля и исходный JSON задания; полная модель ExerciseSchema
+    строится по требованию (to_schema).
+    """
+    id: str
+    course_id: str
+    title: str
+    max_score: int
+    min_score: int
+    order_index: int
+    estimated_time: str
+    raw: bytes = field(repr=False, compare=False)
+
+    @classmethod
+    def from_json(cls, data: bytes, key: str | None = None) -> Self:
+        """
+        Создаёт запись из JSON задания без валидации Pydantic.
+
+        :param data: JSON задания или ответа, в котором задание лежит под ключом key.
+        :param key: Ключ задания в ответе (например, "exercise" для ответа на создание).
+        """
+        exercise = json.loads(data)
+        if key is not None:
+            exercise = exercise[key]
+            data = json.dumps(exercise, separators=(",", ":")).encode()
+
+        return cls(
+            id=exercise["id"],
+            course_id=exercise["courseId"],
+            title=exercise["title"],
+            max_score=exercise["maxScore"],
+            min_score=exercise["minScore"],
+            order_index=exercise["orderIndex"],
+            estimated_time=exercise["estimatedTime"],
+            raw=data
+        )
+
+    def to_schema(self) -> ExerciseSchema:
+        return ExerciseSchema.model_validate_json(self.raw)
@@ -1,11 +1,19 @@
+from typing import Iterable
+
 import allure
 from httpx import Response
 
 from clients.api_client import APIClient
 from clients.api_coverage import tracker
-from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema
+from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema, \
+    CreateFileStreamRequestSchema
 from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client
+from tools.http.transfer import ChunkReader, TransferMeter, TransferStatsSchema
+from tools.logger import get_logger
 from tools.routes import APIRoutes
+from tools.allure.reporting import step, attach
+
+logger = get_logger("FILES_CLIENT")
 
 
 class FilesClient(APIClient):
@@ -21,10 +29,10 @@ class FilesClient(APIClient):
         :param file_id: Идентификатор файла.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        with allure.step(f"Получить файл по идентификатору {file_id}"):
+        with step(f"Получить файл по идентификатору {file_id}"):
             return self.get(f"{APIRoutes.FILES}/{file_id}")
 
-    @allure.step("Создать новый файл")
+    @step("Создать новый файл")
     @tracker.track_coverage_httpx(APIRoutes.FILES)
     def create_file_api(self, request) -> Response:
         """
@@ -47,13 +55,77 @@ class FilesClient(APIClient):
         :param file_id: Идентификатор файла.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        with allure.step(f"Удалить файл по идентификатору {file_id}"):
+        with step(f"Удалить файл по идентификатору {file_id}"):
             return self.delete(f"{APIRoutes.FILES}/{file_id}")
 
+    @step("Создать новый файл потоковой загрузкой")
+    @tracker.track_coverage_httpx(APIRoutes.FILES)
+    def create_file_stream_api(self, request: CreateFileStreamRequestSchema, reader: ChunkReader) -> Response:
+        """
+        Метод создания файла с потоковой загрузкой содержимого.
+
+        :param request: Словарь с filename, directory.
+        :param reader: Источник содержимого файла, читается кусками во время отправки.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return self.post(
+            APIRoutes.FILES,
+            data=request.model_dump(by_alias=True),
+            files={"upload_file": (request.filename, reader)}
+        )
+
     def create_file(self, request: CreateFileRequestSchema) -> CreateFileResponseSchema:
         response = self.create_file_api(request)
         return CreateFileResponseSchema.model_validate_json(response.text)
 
+    def create_file_stream(
+            self,
+            request: CreateFileStreamRequestSchema,
+            chunks: Iterable[bytes]
+    ) -> tuple[CreateFileResponseSchema, TransferStatsSchema]:
+        """
+        Загружает файл из итератора кусков (например, iter_file_chunks или генератора).
+
+        :param request: Словарь с filename, directory.
+        :param chunks: Итератор байтовых кусков содержимого файла.
+        :return: Ответ API о созданном файле и итоги загрузки (размер, SHA-256, МБ/с).
+        """
+        reader = ChunkReader(chunks)
+        response = self.create_file_stream_api(request, reader)
+
+        stats = reader.meter.stats()
+        logger.info(f"Загружено {stats.render()}")
+        attach(stats.render(), "Upload stats", allure.attachment_type.TEXT)
+
+        return CreateFileResponseSchema.model_validate_json(response.text), stats
+
+    def download_file(self, url: str, expected_size: int | None = None) -> TransferStatsSchema:
+        """
+        Потоково скачивает сохранённый файл, считая размер и SHA-256 по мере поступления байтов.
+
+        :param url: Адрес файла (например, static/{directory}/{filename} из FileSchema.url).
+        :param expected_size: Ожидаемый размер; чтение прерывается, как только он превышен.
+        :return: Итоги скачивания (размер, SHA-256, МБ/с).
+        :raises httpx.HTTPStatusError: Если сервер вернул неуспешный статус-код.
+        """
+        with step(f"Скачать файл {url}"):
+            meter = TransferMeter()
+
+            with self.stream("GET", url) as response:
+                response.raise_for_status()
+
+                for chunk in response.iter_bytes():
+                    meter.update(chunk)
+
+                    if expected_size is not None and meter.size > expected_size:
+                        break
+
+            stats = meter.stats()
+            logger.info(f"Скачано {stats.render()}")
+            attach(stats.render(), "Download stats", allure.attachment_type.TEXT)
+
+            return stats
+
 
 def get_files_client(user: AuthenticationUserSchema) -> FilesClient:
     """
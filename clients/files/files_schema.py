@@ -22,6 +22,15 @@ class CreateFileRequestSchema(BaseModel):
     upload_file: FilePath
 
 
+class CreateFileStreamRequestSchema(BaseModel):
+    """
+    Описание структуры запроса на потоковое создание файла.
+    Содержимое файла передаётся отдельно, итератором байтовых кусков.
+    """
+    filename: str = Field(default_factory=lambda: f"{fake.uuid4()}.bin")
+    directory: str = Field(default="tests")
+
+
 class CreateFileResponseSchema(BaseModel):
     """
     Описание структуры ответа создания файла.
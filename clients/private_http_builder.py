@@ -6,7 +6,9 @@ from pydantic import BaseModel, ConfigDict
 from clients.authentication.authentication_client import get_authentication_client
 from clients.authentication.authentication_schema import LoginRequestSchema
 from clients.event_hooks import curl_event_hook, log_request_event_hook, log_response_event_hook
+from clients.transports import build_http_transport
 from config import settings
+from tools.token_cache import TokenCache, TokenCacheAuth
 
 
 class AuthenticationUserSchema(BaseModel):
@@ -16,6 +18,50 @@ class AuthenticationUserSchema(BaseModel):
     password: str
 
 
+@lru_cache(maxsize=None)
+def get_token_cache() -> TokenCache | None:
+    """
+    Возвращает общий кеш токенов или None, если он выключен в настройках.
+    """
+    if not settings.token_cache.enabled:
+        return None
+
+    return TokenCache(
+        file=settings.token_cache.file,
+        ttl=settings.token_cache.ttl,
+        min_remaining=settings.token_cache.min_remaining
+    )
+
+
+def login(user: AuthenticationUserSchema) -> str:
+    login_request = LoginRequestSchema(email=user.email, password=user.password)
+    return get_authentication_client().login(login_request).token.access_token
+
+
+def get_access_token(user: AuthenticationUserSchema) -> str:
+    """
+    Возвращает access-токен пользователя: из кеша токенов, если он включён, иначе через login.
+
+    :param user: Объект AuthenticationUserSchema с email и паролем пользователя.
+    """
+    if (token_cache := get_token_cache()) is None:
+        return login(user)
+
+    key = TokenCache.build_key(settings.http_client.client_url, user.email, user.password)
+    return token_cache.get_or_login(key, lambda: login(user))
+
+
+def get_token_auth(user: AuthenticationUserSchema) -> TokenCacheAuth | None:
+    """
+    Возвращает аутентификацию токеном из кеша (с повторным логином на 401) или None, если кеш выключен.
+    """
+    if (token_cache := get_token_cache()) is None:
+        return None
+
+    key = TokenCache.build_key(settings.http_client.client_url, user.email, user.password)
+    return TokenCacheAuth(token_cache, key, lambda: login(user))
+
+
 @lru_cache(maxsize=None)
 def get_private_http_client(user: AuthenticationUserSchema) -> Client:
     """
@@ -23,15 +69,18 @@ def get_private_http_client(user: AuthenticationUserSchema) -> Client:
     :param user: Объект AuthenticationUserSchema с email и паролем пользователя.
     :return: Готовый к использованию объект httpx.Client с установленным заголовком Authorization.
     """
-    authentication_client = get_authentication_client()
-
-    login_request = LoginRequestSchema(email=user.email, password=user.password)
-    login_response = authentication_client.login(login_request)
+    # С кешем токенов заголовок Authorization выставляет TokenCacheAuth: отклонённый сервером токен заменяется
+    if (auth := get_token_auth(user)) is not None:
+        headers = {}
+    else:
+        headers = {"Authorization": f"Bearer {get_access_token(user)}"}
 
     return Client(
         timeout=settings.http_client.timeout,
         base_url=settings.http_client.client_url,
-        headers={"Authorization": f"Bearer {login_response.token.access_token}"},
+        transport=build_http_transport(),
+        auth=auth,
+        headers=headers,
         event_hooks={
             "request": [curl_event_hook, log_request_event_hook],
             "response": [log_response_event_hook]
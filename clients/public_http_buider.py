@@ -1,6 +1,7 @@
 from httpx import Client
 
 from clients.event_hooks import curl_event_hook, log_request_event_hook, log_response_event_hook
+from clients.transports import build_http_transport
 from config import settings
 
 
@@ -13,6 +14,7 @@ def get_public_http_client() -> Client:
     return Client(
         timeout=settings.http_client.timeout,
         base_url=settings.http_client.client_url,
+        transport=build_http_transport(),
         event_hooks={
             "request": [curl_event_hook, log_request_event_hook],
             "response": [log_response_event_hook]
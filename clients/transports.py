@@ -0,0 +1,100 @@
+from functools import lru_cache
+
+from httpx import BaseTransport, HTTPTransport, Limits
+
+from config import settings
+from tools.http.balancing import ReplicaBalancer, BalancedTransport
+from tools.http.coalescing import CoalescingTransport
+from tools.http.faults import FaultInjectionTransport
+from tools.http.caching import CachingTransport, MemoryCacheStore, DiskCacheStore, CacheStore
+from tools.http.timeouts import TimeoutTransport
+from tools.http.timings import TracedTransport
+from tools.http.warmup import SharedTransport
+
+# Параметры TLS и прокси для пула соединений, одинаковые для своего пула клиента и общего пула прогрева:
+# включение прогрева не должно менять проверку сертификатов и маршрут до API.
+# httpx не берёт прокси из окружения, если транспорт передан явно, поэтому trust_env здесь влияет только на TLS
+TRANSPORT_OPTIONS = {"verify": True, "trust_env": True, "proxy": None}
+
+
+@lru_cache(maxsize=None)
+def get_replica_balancer() -> ReplicaBalancer | None:
+    """
+    Возвращает общий для всех клиентов балансировщик реплик или None, если реплика одна.
+    """
+    base_urls = settings.http_client.base_urls
+    if len(base_urls) < 2:
+        return None
+
+    return ReplicaBalancer(
+        urls=base_urls,
+        policy=settings.http_client.balancing_policy,
+        ejection_threshold=settings.http_client.ejection_threshold,
+        ejection_period=settings.http_client.ejection_period
+    )
+
+
+@lru_cache(maxsize=None)
+def get_shared_transport() -> SharedTransport | None:
+    """
+    Возвращает общий пул соединений с кешем DNS или None, если прогрев выключен и у каждого клиента свой пул.
+    """
+    if not settings.http_client.warmup.enabled:
+        return None
+
+    warmup = settings.http_client.warmup
+    return SharedTransport(
+        limits=Limits(
+            max_connections=warmup.max_connections,
+            max_keepalive_connections=warmup.max_keepalive_connections,
+            keepalive_expiry=warmup.keepalive_expiry
+        ),
+        dns_ttl=warmup.dns_ttl,
+        **TRANSPORT_OPTIONS
+    )
+
+
+def build_cache_store() -> CacheStore:
+    """
+    Хранилище HTTP-кеша: общий каталог на диске или отдельный LRU-кеш в памяти каждого клиента.
+    """
+    if directory := settings.http_client.cache.directory:
+        return DiskCacheStore(directory)
+
+    return MemoryCacheStore(max_entries=settings.http_client.cache.max_entries)
+
+
+def build_http_transport() -> BaseTransport:
+    """
+    Собирает транспорт для httpx.Client из включённых в настройках возможностей.
+
+    Внешний слой всегда TimeoutTransport с таймаутами по маршрутам (tools.http.timeouts).
+
+    :return: Транспорт для httpx.Client.
+    """
+    # Внутренний слой отмечает передачу запроса в пул: по этой отметке время клиента отделяется от ожидания пула
+    transport: BaseTransport = TracedTransport(get_shared_transport() or HTTPTransport(**TRANSPORT_OPTIONS))
+
+    # Сбои внедряются ближе всего к сети: балансировщик, кеш и таймауты реагируют на них как на настоящие
+    if settings.http_client.faults.enabled:
+        transport = FaultInjectionTransport(
+            transport,
+            policies=settings.http_client.faults.routes,
+            seed=settings.http_client.faults.seed
+        )
+
+    if balancer := get_replica_balancer():
+        transport = BalancedTransport(balancer, transport)
+
+    if settings.http_client.cache.enabled:
+        transport = CachingTransport(
+            transport,
+            store=build_cache_store(),
+            max_body_size=settings.http_client.cache.max_body_size
+        )
+
+    if settings.http_client.coalescing:
+        transport = CoalescingTransport(transport)
+
+    # Снаружи: срок теста проверяется до отправки, а таймауты маршрута доходят до сетевого уровня
+    return TimeoutTransport(transport, default_timeout=settings.http_client.timeout)
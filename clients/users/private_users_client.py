@@ -1,4 +1,3 @@
-import allure
 from httpx import Response
 
 from clients.api_client import APIClient
@@ -6,6 +5,8 @@ from clients.private_http_builder import get_private_http_client, Authentication
 from clients.users.users_schema import UpdateUserRequestSchema, GetUserResponseSchema
 from tools.routes import APIRoutes
 from clients.api_coverage import tracker
+from tools.allure.reporting import step
+from tools.http.serialization import dump_json_content
 
 
 class PrivateUsersClient(APIClient):
@@ -13,7 +14,7 @@ class PrivateUsersClient(APIClient):
     Клиент для работы с /api/v1/users
     """
 
-    @allure.step("Get user me")
+    @step("Get user me")
     @tracker.track_coverage_httpx(f"{APIRoutes.USERS}/me")
     def get_user_me_api(self) -> Response:
         """
@@ -23,7 +24,7 @@ class PrivateUsersClient(APIClient):
         """
         return self.get(f"{APIRoutes.USERS}/me")
 
-    @allure.step("Get user by id {user_id}")
+    @step("Get user by id {user_id}")
     @tracker.track_coverage_httpx(f"{APIRoutes.USERS}/{{user_id}}")
     def get_user_api(self, user_id: str) -> Response:
         """
@@ -34,7 +35,7 @@ class PrivateUsersClient(APIClient):
         """
         return self.get(f"{APIRoutes.USERS}/{user_id}")
 
-    @allure.step("Update user by id {user_id}")
+    @step("Update user by id {user_id}")
     @tracker.track_coverage_httpx(f"{APIRoutes.USERS}/{{user_id}}")
     def update_user_api(self, user_id: str, request: UpdateUserRequestSchema) -> Response:
         """
@@ -44,9 +45,9 @@ class PrivateUsersClient(APIClient):
         :param request: Словарь с email, lastName, firstName, middleName.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.patch(f"{APIRoutes.USERS}/{user_id}", json=request.model_dump(by_alias=True))
+        return self.patch(f"{APIRoutes.USERS}/{user_id}", content=dump_json_content(request))
 
-    @allure.step("Delete user by id {user_id}")
+    @step("Delete user by id {user_id}")
     @tracker.track_coverage_httpx(f"{APIRoutes.USERS}/{{user_id}}")
     def delete_user_api(self, user_id: str) -> Response:
         """
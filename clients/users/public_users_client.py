@@ -3,10 +3,11 @@ from httpx import Response
 from clients.api_client import APIClient
 from clients.public_http_buider import get_public_http_client
 from clients.users.users_schema import CreateUserRequestSchema, CreateUserResponseSchema
-import allure
 from clients.api_coverage import tracker
 
 from tools.routes import APIRoutes
+from tools.allure.reporting import step
+from tools.http.serialization import dump_json_content
 
 
 class PublicUsersClient(APIClient):
@@ -14,16 +15,17 @@ class PublicUsersClient(APIClient):
     Клиент для работы с /api/v1/users
     """
 
-    @allure.step("Create user")
+    @step("Create user")
     @tracker.track_coverage_httpx(APIRoutes.USERS)
-    def create_user_api(self, request: CreateUserRequestSchema) -> Response:
+    def create_user_api(self, request: CreateUserRequestSchema | bytes) -> Response:
         """
         Метод выполняет создание пользователя.
 
-        :param request: Словарь с email, password, lastName, firstName, middleName.
+        :param request: Словарь с email, password, lastName, firstName, middleName,
+        либо готовое JSON-тело из шаблона tools.load.templates.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.post(APIRoutes.USERS, json=request.model_dump(by_alias=True))
+        return self.post(APIRoutes.USERS, content=dump_json_content(request))
 
     def create_user(self, request: CreateUserRequestSchema) -> CreateUserResponseSchema:
         response = self.create_user_api(request)
@@ -1,20 +1,147 @@
-from typing import Self
+import os
+import random
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Self, Any
 
-from pydantic import BaseModel, HttpUrl, FilePath, DirectoryPath
+from pydantic import BaseModel, HttpUrl, FilePath, DirectoryPath, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class BalancingPolicy(str, Enum):
+    ROUND_ROBIN = "round_robin"
+    LEAST_OUTSTANDING = "least_outstanding"
+    LATENCY_WEIGHTED = "latency_weighted"
+
+    def __str__(self):
+        return self.value
+
+
+class LatencyDistribution(str, Enum):
+    FIXED = "fixed"
+    UNIFORM = "uniform"
+    EXPONENTIAL = "exponential"
+    LOGNORMAL = "lognormal"
+
+
+class FaultPolicySchema(BaseModel):
+    """
+    Деградация сети для маршрута.
+
+    latency — добавочная задержка в миллисекундах (для uniform — середина диапазона latency ± spread,
+    для exponential — среднее, для lognormal — медиана с sigma = spread / latency);
+    drop_rate — доля запросов, на которые «сервер» закрывает соединение без ответа;
+    error_rate — доля ответов с кодом из error_statuses без обращения к серверу;
+    bandwidth — ограничение скорости чтения тела ответа в байтах в секунду (0 — без ограничения).
+    """
+    latency: float = 0.0
+    spread: float = 0.0
+    distribution: LatencyDistribution = LatencyDistribution.FIXED
+    drop_rate: float = 0.0
+    error_rate: float = 0.0
+    error_statuses: list[int] = [500, 502, 503, 504]
+    bandwidth: int = 0
+
+    def sample_latency(self, generator: random.Random) -> float:
+        """
+        Задержка в секундах по распределению политики.
+        """
+        match self.distribution:
+            case LatencyDistribution.FIXED:
+                latency = self.latency
+            case LatencyDistribution.UNIFORM:
+                latency = generator.uniform(self.latency - self.spread, self.latency + self.spread)
+            case LatencyDistribution.EXPONENTIAL:
+                latency = generator.expovariate(1 / self.latency) if self.latency else 0.0
+            case LatencyDistribution.LOGNORMAL:
+                sigma = self.spread / self.latency if self.latency else 0.0
+                latency = self.latency * generator.lognormvariate(0, sigma)
+
+        return max(0.0, latency) / 1000
+
+
+class HTTPCacheConfig(BaseModel):
+    enabled: bool = False
+    # Каталог кеша на диске; если не задан, кеш хранится в памяти клиента
+    directory: Path | None = None
+    max_entries: int = 1024
+    max_body_size: int = 1024 * 1024
+
+
+class HTTPWarmupConfig(BaseModel):
+    # Общий пул соединений с кешем DNS для всех клиентов и его прогрев в начале сессии
+    enabled: bool = False
+    connections: int = 4
+    # Путь для дешёвых HEAD-запросов, которыми открываются соединения
+    path: str = "/"
+    # Лимиты общего пула (по умолчанию как у httpx): прогретые соединения сверх keep-alive лимита закрылись бы сразу
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 5.0
+    # Сколько секунд адреса хоста берутся из кеша DNS общего пула
+    dns_ttl: float = 60.0
+
+    @model_validator(mode="after")
+    def check_connections(self) -> Self:
+        if self.connections > self.max_keepalive_connections:
+            raise ValueError(
+                f"WARMUP.CONNECTIONS={self.connections} больше WARMUP.MAX_KEEPALIVE_CONNECTIONS="
+                f"{self.max_keepalive_connections}: лишние соединения закроются сразу после прогрева"
+            )
+
+        return self
+
+
+class HTTPFaultsConfig(BaseModel):
+    enabled: bool = False
+    seed: int = 0
+    # Политики деградации: ключ — "МЕТОД шаблон", шаблон маршрута или "*" для всех маршрутов
+    routes: dict[str, FaultPolicySchema] = {}
+
+
 class HTTPClientConfig(BaseModel):
     url: HttpUrl
     timeout: float
+    # Дополнительные реплики API; запросы к url распределяются между ним и ними
+    replicas: list[HttpUrl] = []
+    balancing_policy: BalancingPolicy = BalancingPolicy.ROUND_ROBIN
+    ejection_threshold: int = 3
+    ejection_period: float = 30.0
+    cache: HTTPCacheConfig = HTTPCacheConfig()
+    warmup: HTTPWarmupConfig = HTTPWarmupConfig()
+    # Объединять одинаковые одновременные GET/HEAD-запросы в один запрос к серверу
+    coalescing: bool = False
+    faults: HTTPFaultsConfig = HTTPFaultsConfig()
 
     @property
     def client_url(self) -> str:
         return str(self.url)
 
+    @property
+    def base_urls(self) -> list[str]:
+        return list(dict.fromkeys(str(url) for url in [self.url, *self.replicas]))
+
+
+class TokenCacheConfig(BaseModel):
+    enabled: bool = False
+    file: Path = Path("./.token-cache.sqlite3")
+    # Срок жизни токена, если он не JWT и exp из него не прочитать
+    ttl: float = 15 * 60
+    # Токен, истекающий раньше, чем через это время, не берётся из кеша
+    min_remaining: float = 5 * 60
+
+
+class SeedConfig(BaseModel):
+    # Каталог манифестов долгоживущего сида (по файлу на стенд)
+    directory: Path = Path("./.seed")
+    courses: int = 3
+    exercises: int = 5
+
 
 class TestDataConfig(BaseModel):
     image_png_file: FilePath
+    large_file_size: int = 16 * 1024 * 1024
 
 
 class Settings(BaseSettings):
@@ -27,14 +154,48 @@ class Settings(BaseSettings):
 
     test_data: TestDataConfig
     http_client: HTTPClientConfig
+    token_cache: TokenCacheConfig = TokenCacheConfig()
+    seed: SeedConfig = SeedConfig()
     allure_results_dir: DirectoryPath
+    api_coverage_file: Path = Path("./api-coverage.json")
 
     @classmethod
-    def initialize(cls) -> Self:
+    def initialize(cls, worker_id: str | None = None) -> Self:
+        """
+        Создаёт настройки: читает .env и, если задан воркер xdist, накладывает поверх него .env.<worker_id>
+        (например, .env.gw1 с HTTP_CLIENT.URL отдельной реплики бэкенда). Отсутствующий файл оверлея игнорируется.
+
+        :param worker_id: Идентификатор воркера xdist (gw0, gw1, ...) или None.
+        """
         allure_results_dir = DirectoryPath("./allure-results")
         allure_results_dir.mkdir(exist_ok=True)
 
-        return Settings(allure_results_dir=allure_results_dir)
+        env_files = (".env", f".env.{worker_id}") if worker_id else (".env",)
+        return Settings(_env_file=env_files, allure_results_dir=allure_results_dir)
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """
+    Возвращает настройки, создавая их при первом обращении.
+
+    Импорт модулей клиентов и фикстур не читает .env и не трогает файловую систему:
+    это происходит только при первом реальном обращении к настройкам.
+    """
+    return Settings.initialize(worker_id=os.environ.get("PYTEST_XDIST_WORKER"))
+
+
+class LazySettings:
+    """
+    Прокси к настройкам для `from config import settings`: каждое обращение к атрибуту
+    делегируется в get_settings().
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+
+    def __repr__(self) -> str:
+        return repr(get_settings())
 
 
-settings = Settings.initialize()
+settings: Settings = LazySettings()  # type: ignore[assignment]
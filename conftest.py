@@ -4,5 +4,12 @@ pytest_plugins = (
     "fixtures.courses",
     "fixtures.exercises",
     "fixtures.authentication",
-    "fixtures.allure"
+    "fixtures.datasets",
+    "fixtures.seed",
+    "fixtures.allure",
+    "fixtures.profiling",
+    "fixtures.http",
+    "fixtures.coverage",
+    "fixtures.soak",
+    "fixtures.slo"
 )
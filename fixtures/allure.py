@@ -1,6 +1,73 @@
 import pytest
+from _pytest.config import Config
+from _pytest.config.argparsing import Parser
 
 from tools.allure.environment import create_allure_environment_file
+from tools.allure.reporting import reporter, ReportingMode
+
+
+def pytest_addoption(parser: Parser):
+    group = parser.getgroup("allure-reporting", "Объём отчёта Allure")
+    group.addoption(
+        "--allure-reporting",
+        action="store",
+        default=ReportingMode.FULL.value,
+        choices=[mode.value for mode in ReportingMode],
+        help="full — писать все шаги и вложения; compact — только для упавших тестов и выборки; off — не писать"
+    )
+    group.addoption(
+        "--allure-sample-rate",
+        action="store",
+        type=float,
+        default=0.0,
+        help="Доля прошедших тестов (0..1), для которых в режиме compact сохраняется полный отчёт"
+    )
+    group.addoption(
+        "--allure-test-budget",
+        action="store",
+        type=int,
+        default=None,
+        help="Максимальный суммарный размер вложений одного теста, в байтах"
+    )
+    group.addoption(
+        "--allure-session-budget",
+        action="store",
+        type=int,
+        default=None,
+        help="Максимальный суммарный размер вложений за сессию, в байтах"
+    )
+    group.addoption(
+        "--allure-step-budget",
+        action="store",
+        type=int,
+        default=10_000,
+        help="Максимальное число шагов одного теста, которые копятся в памяти в режиме compact"
+    )
+
+
+def pytest_configure(config: Config):
+    reporter.configure(
+        mode=ReportingMode(config.getoption("--allure-reporting")),
+        sample_rate=config.getoption("--allure-sample-rate"),
+        test_budget=config.getoption("--allure-test-budget"),
+        session_budget=config.getoption("--allure-session-budget"),
+        step_budget=config.getoption("--allure-step-budget")
+    )
+
+
+def pytest_runtest_logstart(nodeid: str, location):
+    # В режиме full шаги пишутся сразу, буфер теста не нужен
+    if reporter.mode == ReportingMode.COMPACT:
+        reporter.start_test(nodeid)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    outcome = yield
+    report: pytest.TestReport = outcome.get_result()
+
+    if report.when == "call" or (report.when == "setup" and not report.passed):
+        reporter.finish_test(failed=report.failed)
 
 
 @pytest.fixture(scope='session', autouse=True)
@@ -0,0 +1,23 @@
+import pytest
+
+from clients.api_coverage import tracker
+from config import settings
+
+# Ключ, под которым воркер xdist передаёт покрытие контроллеру
+WORKER_OUTPUT_KEY = "api_coverage"
+
+
+def pytest_sessionfinish(session: pytest.Session):
+    config = session.config
+
+    if hasattr(config, "workerinput"):
+        config.workeroutput[WORKER_OUTPUT_KEY] = tracker.dump()
+        return
+
+    tracker.save(settings.api_coverage_file)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    if results := getattr(node, "workeroutput", {}).get(WORKER_OUTPUT_KEY):
+        tracker.merge(results)
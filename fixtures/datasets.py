@@ -0,0 +1,8 @@
+import pytest
+
+from tools.datasets import DatasetBuilder, get_dataset_builder
+
+
+@pytest.fixture(scope="session")
+def dataset_builder() -> DatasetBuilder:
+    return get_dataset_builder()
@@ -0,0 +1,121 @@
+import os
+
+import allure
+import pytest
+from _pytest.config import Config
+from _pytest.config.argparsing import Parser
+from _pytest.fixtures import FixtureRequest
+from _pytest.terminal import TerminalReporter
+
+from clients.private_http_builder import get_token_cache
+from clients.transports import get_replica_balancer, get_shared_transport
+from config import settings
+from tools.http.caching import cache_stats
+from tools.http.coalescing import coalescing_stats
+from tools.http.faults import fault_stats
+from tools.http.timeouts import test_deadline
+from tools.http.timings import timings_collector
+from tools.http.warmup import WarmupReportSchema, warm_up
+
+warmup_report_key = pytest.StashKey[WarmupReportSchema]()
+
+
+def pytest_addoption(parser: Parser):
+    parser.addoption(
+        "--test-deadline",
+        action="store",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Общий срок на все HTTP-запросы одного теста, включая фикстуры уровня функции (маркер deadline имеет приоритет)"
+    )
+
+
+@pytest.fixture(autouse=True)
+def request_deadline(request: FixtureRequest):
+    """
+    Ограничивает время всех запросов теста: каждый запрос получает таймауты не больше оставшегося срока.
+
+    Срок начинается при настройке этой фикстуры. pytest настраивает фикстуры большей области видимости раньше
+    фикстур функции, поэтому сессионные фикстуры (seed, dataset_builder, прогрев соединений) готовы до начала
+    срока даже в первом тесте, который их запросил. В срок входят фикстуры уровня функции и сам тест.
+    """
+    marker = request.node.get_closest_marker("deadline")
+    seconds = marker.args[0] if marker else request.config.getoption("--test-deadline")
+    if seconds is None:
+        yield
+        return
+
+    test_deadline.start(seconds)
+    try:
+        yield
+    finally:
+        test_deadline.clear()
+
+
+@pytest.fixture(scope='session', autouse=True)
+def warm_up_connections(pytestconfig: Config):
+    """
+    Разрешает DNS и открывает соединения общего пула до первого теста, чтобы установка соединений
+    не попадала в задержки первых запросов воркера. Итог прогрева выводится отдельно от замеров запросов.
+    """
+    if (transport := get_shared_transport()) is None:
+        yield
+        return
+
+    report = warm_up(
+        transport,
+        url=settings.http_client.client_url,
+        connections=settings.http_client.warmup.connections,
+        path=settings.http_client.warmup.path,
+        timeout=settings.http_client.timeout
+    )
+    pytestconfig.stash[warmup_report_key] = report
+    # Вложение попадает в настройку сессионной фикстуры; allure-results содержит только файлы Allure
+    allure.attach(report.render(), "Прогрев соединений", allure.attachment_type.TEXT)
+
+    yield
+
+    transport.shutdown()
+
+
+@pytest.fixture(scope='session', autouse=True)
+def save_request_timings_summary():
+    yield
+
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    if summary := timings_collector.summary():
+        settings.allure_results_dir.joinpath(f"request-timings-{worker}.txt").write_text(summary)
+
+    if balancer := get_replica_balancer():
+        settings.allure_results_dir.joinpath(f"replicas-{worker}.txt").write_text(balancer.summary())
+
+
+def pytest_terminal_summary(terminalreporter: TerminalReporter, config: Config):
+    if report := config.stash.get(warmup_report_key, None):
+        terminalreporter.write_sep("=", "connection warm-up summary")
+        terminalreporter.write_line(report.render())
+
+    if summary := timings_collector.summary():
+        terminalreporter.write_sep("=", "request timings summary")
+        terminalreporter.write_line(summary)
+
+    if balancer := get_replica_balancer():
+        terminalreporter.write_sep("=", "replica latency summary")
+        terminalreporter.write_line(balancer.summary())
+
+    if summary := cache_stats.summary():
+        terminalreporter.write_sep("=", "HTTP cache summary")
+        terminalreporter.write_line(summary)
+
+    if summary := coalescing_stats.summary():
+        terminalreporter.write_sep("=", "request coalescing summary")
+        terminalreporter.write_line(summary)
+
+    if summary := fault_stats.summary():
+        terminalreporter.write_sep("=", "fault injection summary")
+        terminalreporter.write_line(summary)
+
+    if (token_cache := get_token_cache()) and (summary := token_cache.summary()):
+        terminalreporter.write_sep("=", "token cache summary")
+        terminalreporter.write_line(summary)
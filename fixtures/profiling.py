@@ -0,0 +1,87 @@
+import allure
+import pytest
+from _pytest.config import Config
+from _pytest.config.argparsing import Parser
+from _pytest.terminal import TerminalReporter
+
+from config import settings
+from tools.profiling import SessionProfiler, ProfileFormat, parse_profile_option
+
+profiler_key = pytest.StashKey[SessionProfiler]()
+
+
+def pytest_addoption(parser: Parser):
+    group = parser.getgroup("profiling", "Профилирование тестов")
+    group.addoption(
+        "--profile-tests",
+        action="store",
+        default=None,
+        metavar="slowest:N",
+        help="Профилировать тесты вместе с настройкой фикстур и сохранять профили N самых медленных"
+    )
+    group.addoption(
+        "--profile-format",
+        action="store",
+        default=ProfileFormat.PSTATS.value,
+        choices=[profile_format.value for profile_format in ProfileFormat],
+        help="Формат профилей: pstats (cProfile) или collapsed (сэмплирование стеков для flamegraph)"
+    )
+
+
+def pytest_configure(config: Config):
+    if not (value := config.getoption("--profile-tests")):
+        return
+
+    try:
+        limit = parse_profile_option(value)
+    except ValueError as error:
+        raise pytest.UsageError(str(error))
+
+    profiler = SessionProfiler(
+        limit=limit,
+        results_dir=settings.allure_results_dir,
+        profile_format=ProfileFormat(config.getoption("--profile-format"))
+    )
+    config.stash[profiler_key] = profiler
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item: pytest.Item):
+    if profiler := item.config.stash.get(profiler_key, None):
+        profiler.start(item.nodeid)
+
+    yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    yield
+
+    profiler = item.config.stash.get(profiler_key, None)
+    if profiler and (profile := profiler.stop(item.nodeid)):
+        allure.attach(
+            profile.render_top(),
+            name=f"Профиль теста ({profile.duration:.3f}s)",
+            attachment_type=allure.attachment_type.TEXT
+        )
+        allure.attach.file(
+            profile.path,
+            name=f"Профиль теста ({profile.profile_format})",
+            extension=profile.profile_format.value
+        )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item: pytest.Item):
+    # Если упала настройка фикстур, тело теста не выполнялось — профиль закрываем здесь
+    profiler = item.config.stash.get(profiler_key, None)
+    if profiler and profiler.is_active(item.nodeid):
+        profiler.stop(item.nodeid)
+
+    yield
+
+
+def pytest_terminal_summary(terminalreporter: TerminalReporter, config: Config):
+    if profiler := config.stash.get(profiler_key, None):
+        terminalreporter.write_sep("=", "profiling summary")
+        terminalreporter.write_line(profiler.summary())
@@ -0,0 +1,8 @@
+import pytest
+
+from tools.seed import SeedManifestSchema, get_seed
+
+
+@pytest.fixture(scope="session")
+def seed() -> SeedManifestSchema:
+    return get_seed()
@@ -0,0 +1,52 @@
+import pytest
+from _pytest.config import Config
+from _pytest.config.argparsing import Parser
+from _pytest.terminal import TerminalReporter
+
+from config import settings
+from tools.slo import slo_tracker
+
+# Ключ, под которым воркер xdist передаёт замеры SLO контроллеру
+WORKER_OUTPUT_KEY = "slo"
+
+
+def pytest_addoption(parser: Parser):
+    parser.getgroup("slo", "Бюджеты эндпоинтов").addoption(
+        "--slo-gate",
+        action="store_true",
+        default=False,
+        help="Завершать прогон с ошибкой, если p95 задержки или размер ответа маршрута превышает бюджет"
+    )
+
+
+def pytest_sessionfinish(session: pytest.Session):
+    config = session.config
+
+    if hasattr(config, "workerinput"):
+        config.workeroutput[WORKER_OUTPUT_KEY] = slo_tracker.dump()
+        return
+
+    if summary := slo_tracker.summary():
+        settings.allure_results_dir.joinpath("slo-report.txt").write_text(summary)
+
+    if config.getoption("--slo-gate") and slo_tracker.breaches():
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    if results := getattr(node, "workeroutput", {}).get(WORKER_OUTPUT_KEY):
+        slo_tracker.merge(results)
+
+
+def pytest_terminal_summary(terminalreporter: TerminalReporter, config: Config):
+    if hasattr(config, "workerinput") or not (summary := slo_tracker.summary()):
+        return
+
+    terminalreporter.write_sep("=", "SLO summary")
+    terminalreporter.write_line(summary)
+
+    if breaches := slo_tracker.breaches():
+        terminalreporter.write_line("")
+        for breach in breaches:
+            terminalreporter.write_line(f"SLO BREACH {breach}", red=True)
@@ -0,0 +1,111 @@
+import time
+
+import pytest
+from _pytest.config import Config
+from _pytest.config.argparsing import Parser
+from _pytest.main import Session
+from _pytest.terminal import TerminalReporter
+
+from config import settings
+from tools.soak import SoakMonitor, parse_duration, parse_max_slopes
+
+soak_monitor_key = pytest.StashKey[SoakMonitor]()
+soak_duration_key = pytest.StashKey[float]()
+
+
+def pytest_addoption(parser: Parser):
+    group = parser.getgroup("soak", "Soak-прогон")
+    group.addoption(
+        "--soak",
+        action="store",
+        default=None,
+        metavar="DURATION",
+        help="Повторять выбранные тесты по кругу в течение DURATION (например, 30m) и следить за ресурсами"
+    )
+    group.addoption(
+        "--soak-interval",
+        action="store",
+        default="30s",
+        help="Интервал между замерами ресурсов (по умолчанию 30s)"
+    )
+    group.addoption(
+        "--soak-max-slope",
+        action="store",
+        default="rss_mb:5,open_fds:1,http_clients:1",
+        help="Допустимый прирост метрик в минуту: rss_mb, open_fds, http_clients, traced_mb"
+    )
+    group.addoption(
+        "--soak-top-allocations",
+        action="store",
+        type=int,
+        default=10,
+        help="Сколько мест с наибольшими аллокациями tracemalloc сохранять в каждом замере"
+    )
+
+
+def pytest_configure(config: Config):
+    if not (value := config.getoption("--soak")):
+        return
+
+    if config.getoption("numprocesses", None):
+        raise pytest.UsageError("--soak выполняется в одном процессе и несовместим с -n")
+
+    try:
+        config.stash[soak_duration_key] = parse_duration(value)
+        config.stash[soak_monitor_key] = SoakMonitor(
+            interval=parse_duration(config.getoption("--soak-interval")),
+            max_slopes=parse_max_slopes(config.getoption("--soak-max-slope")),
+            top_allocations=config.getoption("--soak-top-allocations")
+        )
+    except ValueError as error:
+        raise pytest.UsageError(str(error))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtestloop(session: Session):
+    monitor = session.config.stash.get(soak_monitor_key, None)
+    if monitor is None or session.config.option.collectonly or not session.items:
+        return None
+
+    deadline = time.monotonic() + session.config.stash[soak_duration_key]
+    items = session.items
+    iterations = 0
+
+    monitor.start()
+    try:
+        while True:
+            for index, item in enumerate(items):
+                last_round = time.monotonic() >= deadline
+                is_last = last_round and index == len(items) - 1
+                # Пока прогон не закончен, следующим для последнего теста считается первый:
+                # так фикстуры уровня сессии и модуля не пересоздаются на каждом круге
+                next_item = None if is_last else items[(index + 1) % len(items)]
+
+                item.config.hook.pytest_runtest_protocol(item=item, nextitem=next_item)
+                iterations += 1
+                monitor.sample(iterations)
+
+                if session.shouldfail or session.shouldstop:
+                    raise session.Interrupted(session.shouldfail or session.shouldstop)
+
+            if last_round:
+                break
+    finally:
+        monitor.stop(iterations)
+
+    return True
+
+
+def pytest_sessionfinish(session: Session):
+    if (monitor := session.config.stash.get(soak_monitor_key, None)) is None or not monitor.samples:
+        return
+
+    monitor.save(settings.allure_results_dir)
+    if monitor.violations():
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter: TerminalReporter, config: Config):
+    if (monitor := config.stash.get(soak_monitor_key, None)) and monitor.samples:
+        terminalreporter.write_sep("=", "soak summary")
+        terminalreporter.write_line(monitor.summary())
@@ -4,7 +4,7 @@ import allure
 import pytest
 from allure_commons.types import Severity
 
-from clients.courses.courses_client import CoursesClient
+from clients.courses.courses_client import CoursesClient, get_courses_client
 from clients.courses.courses_schema import UpdateCourseRequestSchema, UpdateCourseResponseSchema, GetCoursesQuerySchema, \
     GetCoursesResponseSchema, CreateCourseRequestSchema, CreateCourseResponseSchema
 from fixtures.courses import CourseFixture
@@ -16,8 +16,9 @@ from tools.allure.stories import AllureStory
 from tools.allure.tags import AllureTag
 from tools.assertions.base import assert_status_code
 from tools.assertions.courses import assert_update_course_response, assert_get_courses_response, \
-    assert_create_course_response
+    assert_create_course_response, assert_get_courses_stream, assert_courses_table
 from tools.assertions.schema import validate_json_schema
+from tools.seed import SeedManifestSchema
 
 
 @pytest.mark.courses
@@ -46,6 +47,35 @@ class TestCourses:
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_get_courses_response(response_data, [function_course.response])
 
+    @allure.tag(AllureTag.GET_ENTITIES)
+    @allure.story(AllureStory.GET_ENTITIES)
+    @allure.title("Получение списка курсов сида")
+    @allure.severity(Severity.NORMAL)
+    @allure.sub_suite(AllureStory.GET_ENTITIES)
+    def test_get_seed_courses(self, seed: SeedManifestSchema):
+        courses_client = get_courses_client(seed.user.authentication_user)
+        query = GetCoursesQuerySchema(userId=seed.user.id)
+
+        table = courses_client.get_courses_table(query)
+
+        assert_courses_table(table, [course.id for course in seed.courses])
+
+    @allure.tag(AllureTag.GET_ENTITIES)
+    @allure.story(AllureStory.GET_ENTITIES)
+    @allure.title("Потоковое получение списка курсов")
+    @allure.severity(Severity.NORMAL)
+    @allure.sub_suite(AllureStory.GET_ENTITIES)
+    def test_get_courses_stream(
+            self,
+            courses_client: CoursesClient,
+            function_user: UserFixture,
+            function_course: CourseFixture
+    ):
+        query = GetCoursesQuerySchema(userId=function_user.response.user.id)
+        courses = courses_client.get_courses_stream(query)
+
+        assert_get_courses_stream(courses, [function_course.response])
+
     @allure.tag(AllureTag.UPDATE_ENTITY)
     @allure.story(AllureStory.UPDATE_ENTITY)
     @allure.title("Обновление курса")
@@ -5,7 +5,7 @@ import pytest
 from allure_commons.types import Severity
 
 from clients.errors_schema import InternalErrorResponseSchema
-from clients.exercises.exercises_client import ExercisesClient
+from clients.exercises.exercises_client import ExercisesClient, get_exercises_client
 from clients.exercises.exercises_schema import CreateExerciseRequestSchema, CreateExerciseResponseSchema, \
     GetExerciseResponseSchema, UpdateExerciseRequestSchema, GetExercisesQuerySchema, GetExercisesResponseSchema, \
     UpdateExerciseResponseSchema
@@ -17,8 +17,10 @@ from tools.allure.stories import AllureStory
 from tools.allure.tags import AllureTag
 from tools.assertions.base import assert_status_code
 from tools.assertions.exercises import assert_create_exercise_response, assert_get_exercise_response, \
-    assert_update_exercise_response, assert_exercise_not_found_response, assert_get_exercises_response
+    assert_update_exercise_response, assert_exercise_not_found_response, assert_get_exercises_response, \
+    assert_get_exercises_stream, assert_exercises_table
 from tools.assertions.schema import validate_json_schema
+from tools.seed import SeedManifestSchema
 
 
 @pytest.mark.exercises
@@ -126,3 +128,33 @@ class TestExercises:
         assert_get_exercises_response(response_data, [function_exercise.response])
 
         validate_json_schema(response.json(), response_data.model_json_schema())
+
+    @allure.tag(AllureTag.GET_ENTITIES)
+    @allure.story(AllureStory.GET_ENTITIES)
+    @allure.title("Получение списка заданий курса сида")
+    @allure.severity(Severity.NORMAL)
+    @allure.sub_suite(AllureStory.GET_ENTITIES)
+    def test_get_seed_exercises(self, seed: SeedManifestSchema):
+        exercises_client = get_exercises_client(seed.user.authentication_user)
+        course = seed.courses[0]
+        query = GetExercisesQuerySchema(course_id=course.id)
+
+        table = exercises_client.get_exercises_table(query)
+
+        assert_exercises_table(table, course.exercise_ids)
+
+    @allure.tag(AllureTag.GET_ENTITIES)
+    @allure.story(AllureStory.GET_ENTITIES)
+    @allure.title("Потоковое получение списка заданий")
+    @allure.severity(Severity.NORMAL)
+    @allure.sub_suite(AllureStory.GET_ENTITIES)
+    def test_get_exercises_stream(
+            self,
+            exercises_client: ExercisesClient,
+            function_exercise: ExerciseFixture,
+            function_course: CourseFixture
+    ):
+        query = GetExercisesQuerySchema(course_id=function_course.response.course.id)
+        exercises = exercises_client.get_exercises_stream(query)
+
+        assert_get_exercises_stream(exercises, [function_exercise.response])
@@ -6,7 +6,8 @@ from allure_commons.types import Severity
 
 from clients.errors_schema import ValidationErrorResponseSchema, InternalErrorResponseSchema
 from clients.files.files_client import FilesClient
-from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema, GetFileResponseSchema
+from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema, GetFileResponseSchema, \
+    CreateFileStreamRequestSchema
 from config import settings
 from fixtures.files import FileFixture
 from tools.allure.epics import AllureEpic
@@ -16,8 +17,9 @@ from tools.allure.tags import AllureTag
 from tools.assertions.base import assert_status_code
 from tools.assertions.files import assert_create_file_response, assert_get_file_response, \
     assert_create_file_with_empty_filename_response, assert_create_file_with_empty_directory_response, \
-    assert_file_not_found_response, assert_get_file_with_incorrect_file_id_response
+    assert_file_not_found_response, assert_get_file_with_incorrect_file_id_response, assert_file_transfer
 from tools.assertions.schema import validate_json_schema
+from tools.fakers import fake
 
 
 @pytest.mark.files
@@ -123,3 +125,18 @@ class TestFiles:
         assert_get_file_with_incorrect_file_id_response(response_data)
 
         validate_json_schema(response.json(), response_data.model_json_schema())
+
+    @allure.tag(AllureTag.CREATE_ENTITY)
+    @allure.story(AllureStory.CREATE_ENTITY)
+    @allure.title("Потоковая загрузка и скачивание большого файла")
+    @allure.severity(Severity.NORMAL)
+    @allure.sub_suite(AllureStory.CREATE_ENTITY)
+    def test_create_file_stream(self, files_client: FilesClient):
+        request = CreateFileStreamRequestSchema()
+        chunks = fake.binary_chunks(settings.test_data.large_file_size)
+        response_data, upload_stats = files_client.create_file_stream(request, chunks)
+
+        assert_create_file_response(request, response_data)
+
+        download_stats = files_client.download_file(str(response_data.file.url), expected_size=upload_stats.size)
+        assert_file_transfer(download_stats, upload_stats)
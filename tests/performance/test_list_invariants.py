@@ -0,0 +1,49 @@
+import allure
+import pytest
+from allure_commons.types import Severity
+
+from clients.courses.courses_schema import GetCoursesQuerySchema
+from clients.exercises.exercises_schema import GetExercisesQuerySchema
+from tools.allure.epics import AllureEpic
+from tools.allure.features import AllureFeature
+from tools.allure.stories import AllureStory
+from tools.allure.tags import AllureTag
+from tools.assertions.courses import assert_courses_table
+from tools.assertions.exercises import assert_exercises_table
+from tools.datasets import DatasetBuilder
+from tools.scaling import DEFAULT_SCALING_SIZES
+
+
+@pytest.mark.performance
+@allure.tag(AllureTag.PERFORMANCE)
+@allure.epic(AllureEpic.LMS)
+@allure.feature(AllureFeature.PERFORMANCE)
+@allure.parent_suite(AllureEpic.LMS)
+@allure.suite(AllureFeature.PERFORMANCE)
+class TestListInvariants:
+    @allure.tag(AllureTag.GET_ENTITIES)
+    @allure.story(AllureStory.LIST_INVARIANTS)
+    @allure.title("Инварианты большого списка курсов")
+    @allure.severity(Severity.NORMAL)
+    @allure.sub_suite(AllureStory.LIST_INVARIANTS)
+    def test_get_courses_invariants(self, dataset_builder: DatasetBuilder):
+        courses = dataset_builder.ensure_courses(DEFAULT_SCALING_SIZES[-1])
+        query = GetCoursesQuerySchema(userId=dataset_builder.user_id)
+
+        table = dataset_builder.courses_client.get_courses_table(query)
+
+        assert_courses_table(table, [course.id for course in courses])
+
+    @allure.tag(AllureTag.GET_ENTITIES)
+    @allure.story(AllureStory.LIST_INVARIANTS)
+    @allure.title("Инварианты большого списка заданий")
+    @allure.severity(Severity.NORMAL)
+    @allure.sub_suite(AllureStory.LIST_INVARIANTS)
+    def test_get_exercises_invariants(self, dataset_builder: DatasetBuilder):
+        course = dataset_builder.ensure_courses(1)[0]
+        exercises = dataset_builder.ensure_exercises(course.id, DEFAULT_SCALING_SIZES[-1])
+        query = GetExercisesQuerySchema(course_id=course.id)
+
+        table = dataset_builder.exercises_client.get_exercises_table(query)
+
+        assert_exercises_table(table, [exercise.id for exercise in exercises])
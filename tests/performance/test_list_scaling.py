@@ -0,0 +1,56 @@
+import allure
+import pytest
+from allure_commons.types import Severity
+
+from clients.courses.courses_schema import GetCoursesQuerySchema
+from clients.exercises.exercises_schema import GetExercisesQuerySchema
+from tools.allure.epics import AllureEpic
+from tools.allure.features import AllureFeature
+from tools.allure.stories import AllureStory
+from tools.allure.tags import AllureTag
+from tools.assertions.performance import assert_linear_scaling
+from tools.datasets import DatasetBuilder
+from tools.scaling import DEFAULT_SCALING_SIZES, measure_list_endpoint
+
+
+@pytest.mark.performance
+@allure.tag(AllureTag.PERFORMANCE)
+@allure.epic(AllureEpic.LMS)
+@allure.feature(AllureFeature.PERFORMANCE)
+@allure.parent_suite(AllureEpic.LMS)
+@allure.suite(AllureFeature.PERFORMANCE)
+class TestListScaling:
+    @allure.tag(AllureTag.GET_ENTITIES)
+    @allure.story(AllureStory.LIST_SCALING)
+    @allure.title("Масштабирование списка курсов")
+    @allure.severity(Severity.NORMAL)
+    @allure.sub_suite(AllureStory.LIST_SCALING)
+    def test_get_courses_scaling(self, dataset_builder: DatasetBuilder):
+        query = GetCoursesQuerySchema(userId=dataset_builder.user_id)
+
+        points = []
+        for size in DEFAULT_SCALING_SIZES:
+            dataset_builder.ensure_courses(size)
+            points.append(
+                measure_list_endpoint(size, lambda: dataset_builder.courses_client.get_courses_api(query), "courses")
+            )
+
+        assert_linear_scaling(points, "GET /api/v1/courses")
+
+    @allure.tag(AllureTag.GET_ENTITIES)
+    @allure.story(AllureStory.LIST_SCALING)
+    @allure.title("Масштабирование списка заданий")
+    @allure.severity(Severity.NORMAL)
+    @allure.sub_suite(AllureStory.LIST_SCALING)
+    def test_get_exercises_scaling(self, dataset_builder: DatasetBuilder):
+        course = dataset_builder.ensure_courses(1)[0]
+        query = GetExercisesQuerySchema(course_id=course.id)
+
+        points = []
+        for size in DEFAULT_SCALING_SIZES:
+            dataset_builder.ensure_exercises(course.id, size)
+            points.append(
+                measure_list_endpoint(size, lambda: dataset_builder.exercises_client.get_exercises_api(query), "exercises")
+            )
+
+        assert_linear_scaling(points, "GET /api/v1/exercises")
@@ -0,0 +1,80 @@
+import threading
+
+import httpx
+import pytest
+
+from tools.http.coalescing import CoalescingTransport, InFlightRequest
+
+
+class FailingTransport(httpx.BaseTransport):
+    """
+    Транспорт, который ждёт сигнала и завершает запрос заданным исключением.
+    """
+
+    def __init__(self, error: Exception):
+        self.error = error
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.started.set()
+        self.release.wait(5)
+        raise self.error
+
+
+class SignalingCoalescingTransport(CoalescingTransport):
+    """
+    Объединяющий транспорт, который сообщает, что ведомый запрос встал в ожидание ответа ведущего.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport):
+        super().__init__(transport)
+        self.waiting = threading.Event()
+
+    def _wait(self, in_flight: InFlightRequest, request: httpx.Request) -> httpx.Response:
+        self.waiting.set()
+        return super()._wait(in_flight, request)
+
+
+def run_with_follower(transport: FailingTransport) -> tuple[BaseException, BaseException]:
+    coalescing = SignalingCoalescingTransport(transport)
+    leader_request = httpx.Request("GET", "http://api.test/courses")
+    follower_request = httpx.Request("GET", "http://api.test/courses")
+    errors: dict[str, BaseException] = {}
+
+    def send(name: str, request: httpx.Request):
+        try:
+            coalescing.handle_request(request)
+        except BaseException as error:
+            errors[name] = error
+
+    leader = threading.Thread(target=send, args=("leader", leader_request))
+    leader.start()
+    transport.started.wait(5)
+    follower = threading.Thread(target=send, args=("follower", follower_request))
+    follower.start()
+    coalescing.waiting.wait(5)
+    transport.release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert errors["follower"].request is follower_request
+    return errors["leader"], errors["follower"]
+
+
+@pytest.mark.unit
+class TestCoalescing:
+    def test_follower_gets_own_exception(self):
+        leader_error, follower_error = run_with_follower(FailingTransport(httpx.ConnectError("refused")))
+
+        assert type(follower_error) is httpx.ConnectError
+        assert follower_error is not leader_error
+        assert follower_error.__cause__ is leader_error
+        assert str(follower_error) == "refused"
+
+    def test_non_httpx_error_is_wrapped(self):
+        leader_error, follower_error = run_with_follower(FailingTransport(RuntimeError("boom")))
+
+        assert isinstance(leader_error, RuntimeError)
+        assert type(follower_error) is httpx.TransportError
+        assert follower_error.__cause__ is leader_error
@@ -0,0 +1,27 @@
+import pytest
+
+from tools.http.json_stream import iter_json_array_items
+
+BODY = b'{"meta": {"courses": [{"id": "nested"}]}, "title": "courses", "courses": [{"id": "a\\"}"}, {"id": "b"}]}'
+
+
+def split(body: bytes, size: int) -> list[bytes]:
+    return [body[index:index + size] for index in range(0, len(body), size)]
+
+
+@pytest.mark.unit
+class TestIterJsonArrayItems:
+    @pytest.mark.parametrize("size", [1, 2, 7, len(BODY)])
+    def test_root_key_only(self, size: int):
+        items = list(iter_json_array_items(split(BODY, size), "courses"))
+
+        assert items == [b'{"id": "a\\"}"}', b'{"id": "b"}']
+
+    @pytest.mark.parametrize("cut", [10, BODY.index(b'"courses": [{"id": "a') + 5, len(BODY) - 2])
+    def test_truncated_body(self, cut: int):
+        with pytest.raises(ValueError, match="оборвано"):
+            list(iter_json_array_items(split(BODY[:cut], 3), "courses"))
+
+    def test_missing_key(self):
+        with pytest.raises(ValueError, match="нет массива 'exercises'"):
+            list(iter_json_array_items(split(BODY, 5), "exercises"))
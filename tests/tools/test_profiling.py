@@ -0,0 +1,58 @@
+import re
+import socket
+from pathlib import Path
+
+import pytest
+
+from tools.profiling import SessionProfiler, get_entry_group
+
+
+@pytest.mark.unit
+class TestProfiling:
+    @pytest.mark.parametrize(
+        "filename, name, group",
+        [
+            ("~", "<method 'recv_into' of '_socket.socket' objects>", "network"),
+            ("~", "<built-in method _socket.getaddrinfo>", "network"),
+            ("~", "<method 'read' of '_ssl._SSLSocket' objects>", "network"),
+            ("~", "<method 'poll' of 'select.poll' objects>", "network"),
+            ("~", "<method 'validate_json' of 'pydantic_core._pydantic_core.SchemaValidator' objects>", "pydantic"),
+            ("~", "<method 'join' of 'str' objects>", "other"),
+            ("~", "<built-in method builtins.isinstance>", "other"),
+            ("/venv/site-packages/httpcore/_sync/connection.py", "handle_request", "network"),
+            ("/venv/site-packages/jsonschema/validators.py", "iter_errors", "jsonschema"),
+        ]
+    )
+    def test_get_entry_group(self, filename: str, name: str, group: str):
+        assert get_entry_group(filename, name) == group
+
+    def test_builtin_time_is_grouped(self, tmp_path: Path):
+        profiler = SessionProfiler(limit=1, results_dir=tmp_path)
+        left, right = socket.socketpair()
+
+        profiler.start("test_network")
+        with left, right:
+            for _ in range(2_000):
+                left.sendall(b"x" * 1024)
+                right.recv(1024)
+        profiler.stop("test_network")
+
+        groups = profiler.summary().split("Собственное время по группам модулей:\n")[1].split("Горячие точки:")[0]
+        assert re.search(r"\d+\.\d+s  network$", groups, re.MULTILINE)
+
+    def test_evicted_profile_keeps_attached_copy(self, tmp_path: Path):
+        profiler = SessionProfiler(limit=1, results_dir=tmp_path)
+        profiler.start("test_fast")
+        fast = profiler.stop("test_fast")
+        # Копия, которую allure.attach.file сделал бы в allure-results
+        copy = tmp_path.joinpath("fast-attachment.pstats")
+        copy.write_bytes(fast.path.read_bytes())
+
+        profiler.start("test_slow")
+        sum(range(200_000))
+        slow = profiler.stop("test_slow")
+
+        assert slow is not None
+        assert list(profiler.profiles_dir.iterdir()) == [slow.path]
+        assert copy.exists()
+        assert "test_fast" not in profiler.summary()
@@ -0,0 +1,53 @@
+import threading
+
+import pytest
+
+from tools.allure.reporting import AllureReporter, BufferedStep, ReportingMode
+
+
+def run_steps(reporter: AllureReporter, name: str, barrier: threading.Barrier):
+    outer = reporter.enter_step(f"{name}: outer")
+    barrier.wait()
+    inner = reporter.enter_step(f"{name}: inner")
+    barrier.wait()
+    reporter.exit_step(outer, error=None)
+    reporter.exit_step(inner, error=None)
+
+
+@pytest.mark.unit
+class TestAllureReporter:
+    def test_full_mode_does_not_buffer(self):
+        reporter = AllureReporter()
+        reporter.configure(ReportingMode.FULL)
+
+        assert reporter.start_test("test_full") is None
+
+    def test_background_threads_keep_own_steps(self):
+        reporter = AllureReporter()
+        reporter.configure(ReportingMode.COMPACT)
+        buffer = reporter.start_test("test_threads")
+
+        main = reporter.enter_step("main")
+        barrier = threading.Barrier(4)
+        threads = [threading.Thread(target=run_steps, args=(reporter, f"t{index}", barrier)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        reporter.exit_step(main, error=None)
+
+        assert buffer.children == [main]
+        assert sorted(node.title for node in main.children) == [f"t{index}: outer" for index in range(4)]
+        for outer in main.children:
+            assert isinstance(outer, BufferedStep)
+            assert [node.title for node in outer.children] == [outer.title.replace("outer", "inner")]
+
+    def test_step_budget(self):
+        reporter = AllureReporter()
+        reporter.configure(ReportingMode.COMPACT, step_budget=2)
+        buffer = reporter.start_test("test_budget")
+
+        nodes = [reporter.enter_step(f"step {index}") for index in range(3)]
+
+        assert nodes[2] is None
+        assert (buffer.steps_count, buffer.dropped_steps) == (2, 1)
@@ -0,0 +1,19 @@
+import pytest
+
+from tools.seed import get_free_order_indexes
+
+
+@pytest.mark.unit
+class TestSeed:
+    @pytest.mark.parametrize(
+        "used, count, expected",
+        [
+            ([], 3, [0, 1, 2]),
+            ([0, 1, 2], 2, [3, 4]),
+            # Удалено задание из середины: новое занимает его индекс, а не совпадает с последним
+            ([0, 2, 3, 4], 1, [1]),
+            ([0, 2, 4], 3, [1, 3, 5]),
+        ]
+    )
+    def test_get_free_order_indexes(self, used: list[int], count: int, expected: list[int]):
+        assert get_free_order_indexes(used, count) == expected
@@ -0,0 +1,119 @@
+import time
+from typing import Any, Iterator
+
+import httpcore
+import httpx
+import pytest
+
+from tools.http.timeouts import DEADLINE_EXTENSION, DeadlineExceededError, TimeoutTransport, test_deadline
+from tools.http.timings import RequestTracer, TracedTransport
+
+RESPONSE = [b"HTTP/1.1 200 OK\r\n", b"Content-Length: 2\r\n\r\n", b"{}"]
+
+
+class SlowStream(httpx.SyncByteStream):
+    """
+    Тело ответа, чтение которого заканчивается заданным исключением после первого фрагмента.
+    """
+
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield b"{"
+        if self.error is not None:
+            raise self.error
+        yield b"}"
+
+
+class MockPoolTransport(httpx.BaseTransport):
+    """
+    Транспорт поверх настоящего пула httpcore с подменённой сетью: события trace приходят из фаз httpcore.
+    """
+
+    def __init__(self):
+        self.pool = httpcore.ConnectionPool(network_backend=httpcore.MockBackend(RESPONSE))
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self.pool.handle_request(httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions
+        ))
+        return httpx.Response(response.status, headers=response.headers, content=response.read())
+
+
+class SlowPhaseTracer(RequestTracer):
+    """
+    Трассировщик, который задерживает начало отправки заголовков.
+    """
+
+    def __call__(self, event_name: str, info: dict[str, Any]):
+        super().__call__(event_name, info)
+        if event_name == "http11.send_request_headers.started":
+            time.sleep(0.1)
+
+
+@pytest.mark.unit
+class TestTimeoutTransport:
+    @pytest.fixture(autouse=True)
+    def clear_deadline(self):
+        yield
+        test_deadline.clear()
+
+    @staticmethod
+    def build_client(stream: httpx.SyncByteStream) -> httpx.Client:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, stream=stream)
+
+        return httpx.Client(transport=TimeoutTransport(httpx.MockTransport(handler), default_timeout=1))
+
+    def test_read_timeout_in_body_has_breakdown(self):
+        client = self.build_client(SlowStream(httpx.ReadTimeout("timed out")))
+
+        with pytest.raises(httpx.ReadTimeout, match=r"ReadTimeout GET /items .*лимиты: connect=1\.0s"):
+            client.get("http://localhost/items")
+
+    def test_expired_deadline_blocks_request(self):
+        client = self.build_client(SlowStream())
+        test_deadline.start(0)
+
+        with pytest.raises(DeadlineExceededError, match="запрос не отправлен"):
+            client.get("http://localhost/items")
+
+    def test_deadline_expires_during_body(self):
+        test_deadline.start(60)
+        client = self.build_client(SlowStream())
+
+        with client.stream("GET", "http://localhost/items") as response:
+            # Срок истекает после получения заголовков
+            response.request.extensions[DEADLINE_EXTENSION] = 0
+            with pytest.raises(DeadlineExceededError, match="конца чтения тела ответа"):
+                response.read()
+
+    @staticmethod
+    def build_pool_client() -> httpx.Client:
+        return httpx.Client(transport=TimeoutTransport(TracedTransport(MockPoolTransport()), default_timeout=100))
+
+    def test_deadline_expires_between_phases(self):
+        client = self.build_pool_client()
+        test_deadline.start(0.05)
+
+        with pytest.raises(DeadlineExceededError, match=r"фазы: .*connect_tcp\.complete.*до send_request_headers"):
+            client.get("http://localhost/items", extensions={"trace": SlowPhaseTracer()})
+
+    def test_timeouts_are_trimmed_at_pool_entry(self):
+        client = self.build_pool_client()
+        test_deadline.start(5)
+
+        response = client.get("http://localhost/items", extensions={"trace": RequestTracer()})
+
+        assert response.json() == {}
+        assert all(value <= 5 for value in response.request.extensions["timeout"].values())
@@ -6,4 +6,5 @@ class AllureFeature(str, Enum):
     FILES = "Файлы"
     COURSES = "Курсы"
     EXERCISES = "Задания"
-    AUTHENTICATION = "Аутентификация"
\ No newline at end of file
+    AUTHENTICATION = "Аутентификация"
+    PERFORMANCE = "Производительность"
\ No newline at end of file
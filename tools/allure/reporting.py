@@ -0,0 +1,335 @@
+import functools
+import inspect
+import threading
+import time
+import zlib
+from enum import Enum
+from typing import Any, Callable
+
+import allure
+
+from tools.logger import get_logger
+
+logger = get_logger("ALLURE_REPORTING")
+
+
+class ReportingMode(str, Enum):
+    # Каждый шаг и вложение сразу пишутся в allure-results
+    FULL = "full"
+    # Шаги и вложения копятся в памяти и пишутся только для упавших тестов или по выборке
+    COMPACT = "compact"
+    # Шаги и вложения не создаются вовсе (процессы-агенты нагрузки, где отчёта нет)
+    OFF = "off"
+
+    def __str__(self):
+        return self.value
+
+
+class BufferedAttachment:
+    """
+    Отложенное вложение.
+    """
+    __slots__ = ("body", "name", "attachment_type")
+
+    def __init__(self, body: str | bytes, name: str, attachment_type: Any):
+        self.body = body
+        self.name = name
+        self.attachment_type = attachment_type
+
+
+class BufferedStep:
+    """
+    Отложенный шаг: заголовок, длительность (None, пока шаг не закрыт), исключение, с которым шаг завершился,
+    и вложенные шаги и вложения в порядке их появления.
+    """
+    __slots__ = ("title", "started_at", "duration", "error", "children")
+
+    def __init__(self, title: str):
+        self.title = title
+        self.started_at = time.perf_counter()
+        self.duration: float | None = None
+        self.error: BaseException | None = None
+        self.children: list[BufferedStep | BufferedAttachment] = []
+
+
+class TestReportBuffer:
+    """
+    Отложенные шаги и вложения одного теста в виде дерева.
+
+    У каждого потока свой стек открытых шагов: шаги фоновых потоков не перемешиваются друг с другом
+    и со стеком основного потока. Шаг фонового потока без открытого родителя в своём потоке
+    становится дочерним текущего шага основного потока.
+    """
+    __test__ = False
+
+    def __init__(self, nodeid: str):
+        self.nodeid = nodeid
+        self.children: list[BufferedStep | BufferedAttachment] = []
+        self.main_stack: list[BufferedStep] = []
+        self.steps_count = 0
+        self.attachments_count = 0
+        self.attachments_size = 0
+        self.dropped_steps = 0
+        self.dropped_attachments = 0
+
+        self._local = threading.local()
+
+    @property
+    def stack(self) -> list[BufferedStep]:
+        if threading.current_thread() is threading.main_thread():
+            return self.main_stack
+
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @property
+    def current(self) -> list[BufferedStep | BufferedAttachment]:
+        if stack := self.stack or self.main_stack:
+            return stack[-1].children
+
+        return self.children
+
+
+class AllureReporter:
+    """
+    Управляет объёмом данных, которые тесты пишут в allure-results.
+
+    В режиме compact шаги и вложения буферизуются на время теста. Упавшие тесты
+    и тесты из выборки получают их полностью: буфер воспроизводится настоящими шагами Allure
+    с исходной вложенностью, статусом и длительностью (в параметре шага), вложения — внутри своих шагов.
+    Прошедшие тесты получают только краткую сводку в описании, без отдельных файлов.
+
+    Бюджеты ограничивают суммарный размер вложений на тест и на сессию, а step_budget — число
+    буферизованных шагов теста: шаги сверх него не записываются, их содержимое попадает в родительский шаг.
+
+    Шаги и вложения из фоновых потоков в режиме compact буферизуются, а в режиме full не записываются:
+    жизненный цикл Allure не потокобезопасен.
+    """
+
+    def __init__(self):
+        self.mode = ReportingMode.FULL
+        self.sample_rate = 0.0
+        self.test_budget: int | None = None
+        self.session_budget: int | None = None
+        self.step_budget: int | None = None
+        self.session_size = 0
+
+        self._lock = threading.Lock()
+        self._buffer: TestReportBuffer | None = None
+        self._test_size = 0
+
+    def configure(
+            self,
+            mode: ReportingMode,
+            sample_rate: float = 0.0,
+            test_budget: int | None = None,
+            session_budget: int | None = None,
+            step_budget: int | None = None
+    ):
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.test_budget = test_budget
+        self.session_budget = session_budget
+        self.step_budget = step_budget
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != ReportingMode.OFF
+
+    def is_deferred(self) -> bool:
+        if threading.current_thread() is not threading.main_thread():
+            return True
+
+        return self.mode == ReportingMode.COMPACT and self._buffer is not None
+
+    def is_sampled(self, nodeid: str) -> bool:
+        """
+        Детерминированная выборка: один и тот же тест попадает в неё от запуска к запуску.
+        """
+        return zlib.crc32(nodeid.encode()) % 10_000 < self.sample_rate * 10_000
+
+    def start_test(self, nodeid: str) -> TestReportBuffer | None:
+        """
+        Начинает буфер теста. Буфер нужен только в режиме compact, в режиме full вызов ничего не делает.
+
+        :return: Буфер теста или None в режиме full.
+        """
+        self._test_size = 0
+        if self.mode == ReportingMode.COMPACT:
+            self._buffer = TestReportBuffer(nodeid)
+
+        return self._buffer
+
+    def enter_step(self, title: str) -> BufferedStep | None:
+        with self._lock:
+            if (buffer := self._buffer) is None:
+                return None
+
+            if self.step_budget is not None and buffer.steps_count >= self.step_budget:
+                buffer.dropped_steps += 1
+                return None
+
+            node = BufferedStep(title)
+            buffer.current.append(node)
+            buffer.stack.append(node)
+            buffer.steps_count += 1
+            return node
+
+    def exit_step(self, node: BufferedStep | None, error: BaseException | None):
+        with self._lock:
+            if node is None:
+                return
+
+            node.duration = time.perf_counter() - node.started_at
+            node.error = error
+            if (buffer := self._buffer) and node in (stack := buffer.stack):
+                del stack[stack.index(node):]
+
+    def _fits_budget(self, size: int) -> bool:
+        if self.test_budget is not None and self._test_size + size > self.test_budget:
+            return False
+
+        if self.session_budget is not None and self.session_size + size > self.session_budget:
+            return False
+
+        return True
+
+    def attach(self, body: str | bytes, name: str, attachment_type: Any = allure.attachment_type.TEXT) -> bool:
+        """
+        :return: False, если вложение отброшено бюджетом.
+        """
+        if not self.enabled:
+            return False
+
+        size = len(body)
+
+        with self._lock:
+            if self.is_deferred():
+                buffer = self._buffer
+                if buffer is None:
+                    return False
+
+                if self.test_budget is not None and buffer.attachments_size + size > self.test_budget:
+                    buffer.dropped_attachments += 1
+                    return False
+
+                buffer.current.append(BufferedAttachment(body, name, attachment_type))
+                buffer.attachments_count += 1
+                buffer.attachments_size += size
+                return True
+
+            if not self._fits_budget(size):
+                if self._buffer is not None:
+                    self._buffer.dropped_attachments += 1
+                return False
+
+            self._test_size += size
+            self.session_size += size
+
+        allure.attach(body, name, attachment_type)
+        return True
+
+    def _replay(self, buffer: TestReportBuffer, nodes: list[BufferedStep | BufferedAttachment]):
+        for node in nodes:
+            if isinstance(node, BufferedAttachment):
+                if not self.attach(node.body, node.name, node.attachment_type):
+                    buffer.dropped_attachments += 1
+                continue
+
+            # Шаг, который ещё не закрыт (например, шаг фикстуры до её завершения), получает длительность на сейчас
+            duration = node.duration if node.duration is not None else time.perf_counter() - node.started_at
+            context = allure.step(node.title)
+            context.params = {"Длительность": f"{duration * 1000:.1f}ms"}
+            context.__enter__()
+            try:
+                self._replay(buffer, node.children)
+            finally:
+                error = node.error
+                context.__exit__(type(error) if error else None, error, error.__traceback__ if error else None)
+
+    def finish_test(self, failed: bool):
+        """
+        Выгружает отложенные шаги и вложения теста в Allure.
+
+        :param failed: Упал ли тест (на этапе настройки или выполнения).
+        """
+        buffer, self._buffer = self._buffer, None
+        if buffer is None:
+            return
+
+        if failed or self.is_sampled(buffer.nodeid):
+            self._replay(buffer, buffer.children)
+        elif buffer.steps_count or buffer.attachments_count:
+            allure.dynamic.description(
+                f"Шагов: {buffer.steps_count}, вложений: {buffer.attachments_count} "
+                f"({buffer.attachments_size} байт) — не сохранены, тест прошёл"
+            )
+
+        if buffer.dropped_attachments:
+            logger.warning(f"{buffer.nodeid}: отброшено вложений сверх бюджета: {buffer.dropped_attachments}")
+
+        if buffer.dropped_steps:
+            logger.warning(f"{buffer.nodeid}: не записано шагов сверх бюджета: {buffer.dropped_steps}")
+
+
+reporter = AllureReporter()
+
+
+def attach(body: str | bytes, name: str, attachment_type: Any = allure.attachment_type.TEXT):
+    """
+    Прикрепляет вложение к отчёту с учётом режима отчётности и бюджетов.
+
+    :param body: Содержимое вложения.
+    :param name: Название вложения.
+    :param attachment_type: Тип вложения (allure.attachment_type).
+    """
+    reporter.attach(body, name, attachment_type)
+
+
+class step:
+    """
+    Шаг отчёта: замена allure.step с поддержкой отложенной записи.
+
+    Используется так же, как allure.step — контекстным менеджером или декоратором;
+    в заголовке декоратора можно ссылаться на аргументы функции: step("Get user by id {user_id}").
+    """
+
+    def __init__(self, title: str):
+        self.title = title
+        self._context = None
+        self._node: BufferedStep | None = None
+
+    def __enter__(self):
+        if not reporter.enabled:
+            return
+
+        if reporter.is_deferred():
+            self._node = reporter.enter_step(self.title)
+        else:
+            self._context = allure.step(self.title)
+            self._context.__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._context is None:
+            reporter.exit_step(self._node, error=exc_value)
+            return False
+
+        context, self._context = self._context, None
+        return context.__exit__(exc_type, exc_value, traceback)
+
+    def __call__(self, func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def impl(*args, **kwargs):
+            try:
+                arguments = signature.bind(*args, **kwargs).arguments
+                title = self.title.format(**arguments)
+            except (KeyError, IndexError, TypeError):
+                title = self.title
+
+            with step(title):
+                return func(*args, **kwargs)
+
+        return impl
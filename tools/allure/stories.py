@@ -9,4 +9,7 @@ class AllureStory(str, Enum):
     CREATE_ENTITY = "Создание сущности"
     UPDATE_ENTITY = "Обновление сущности"
     DELETE_ENTITY = "Удаление сущности"
-    VALIDATE_ENTITY = "Валидация сущности"
\ No newline at end of file
+    VALIDATE_ENTITY = "Валидация сущности"
+
+    LIST_SCALING = "Масштабирование списков"
+    LIST_INVARIANTS = "Инварианты списков"
\ No newline at end of file
@@ -8,6 +8,7 @@ class AllureTag(str, Enum):
     EXERCISES = "Задания"
     REGRESSION = "Регрессия"
     AUTHENTICATION = "Аутентификация"
+    PERFORMANCE = "Производительность"
 
     GET_ENTITY = "Получение сущности"
     GET_ENTITIES = "Получение списка сущностей"
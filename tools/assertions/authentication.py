@@ -1,12 +1,12 @@
 from clients.authentication.authentication_schema import LoginResponseSchema
 from tools.assertions.base import assert_equal, assert_is_true
-import allure
 from tools.logger import get_logger
+from tools.allure.reporting import step
 
 logger = get_logger("AUTHENTICATION_ASSERTIONS")
 
 
-@allure.step("Проверить ответ сервера при логине")
+@step("Проверить ответ сервера при логине")
 def assert_login_response(response: LoginResponseSchema):
     """
     Проверяет корректность ответа при успешной авторизации.
@@ -1,8 +1,7 @@
 from typing import Any, Sized
 
-import allure
-
 from tools.logger import get_logger
+from tools.allure.reporting import step
 
 logger = get_logger("BASE_ASSERTIONS")
 
@@ -15,7 +14,7 @@ def assert_status_code(actual: int, expected: int):
     :param expected: Ожидаемый статус-код.
     :raises AssertionError: Если статус-коды не совпадают.
     """
-    with allure.step(f"Проверить, что статус код ответа равен {expected}"):
+    with step(f"Проверить, что статус код ответа равен {expected}"):
         logger.info(f"Проверяем, что статус код ответа равен {expected}")
 
         assert actual == expected, (
@@ -35,7 +34,7 @@ def assert_equal(actual: Any, expected: Any, name: str):
     :param name: Название поля для отображения в отчёте (например, 'id', 'url').
     :raises AssertionError: Если значения не совпадают.
     """
-    with allure.step(f"Проверить, что '{name}' равно {expected}"):
+    with step(f"Проверить, что '{name}' равно {expected}"):
         logger.info(f'Проверяем, что "{name}" равно {expected}')
 
         assert actual == expected, (
@@ -53,7 +52,7 @@ def assert_is_true(actual: Any, name: str):
     :param actual: Фактическое значение.
     :raises AssertionError: Если фактическое значение ложно.
     """
-    with allure.step(f"Проверить, что '{name}' равно True"):
+    with step(f"Проверить, что '{name}' равно True"):
         logger.info(f'Проверяем, что "{name}" равно True')
 
         assert actual, (
@@ -72,7 +71,7 @@ def assert_length(actual: Sized, expected: Sized, name: str):
     :raises AssertionError: Если длины не совпадают.
     """
 
-    with allure.step(f"Проверить, что длина '{name}' равна {len(expected)}"):
+    with step(f"Проверить, что длина '{name}' равна {len(expected)}"):
         logger.info(f'Проверяем, что длина "{name}" равна {len(expected)}')
 
         assert len(actual) == len(expected), (
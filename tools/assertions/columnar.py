@@ -0,0 +1,85 @@
+from typing import Iterable, Sequence
+
+from tools.allure.reporting import step
+from tools.columnar import find_greater, find_duplicates, find_missing, find_sequence_gaps
+from tools.logger import get_logger
+
+logger = get_logger("COLUMNAR_ASSERTIONS")
+
+# Сколько нарушений показывать в сообщении об ошибке
+MAX_REPORTED_VIOLATIONS: int = 10
+
+
+def assert_column_not_greater(left: Sequence, right: Sequence, name: str):
+    """
+    Проверяет, что left[i] <= right[i] для всех строк.
+
+    :param left: Колонка, значения которой не должны превышать right.
+    :param right: Колонка верхних границ.
+    :param name: Описание инварианта для отчёта (например, 'min_score <= max_score').
+    :raises AssertionError: Если инвариант нарушен хотя бы в одной строке.
+    """
+    with step(f"Проверить, что '{name}' для всех {len(left)} строк"):
+        logger.info(f'Проверяем, что "{name}" для всех {len(left)} строк')
+
+        violations = find_greater(left, right)
+        assert not violations, (
+            f'Нарушен инвариант "{name}" в {len(violations)} строках. '
+            f'Первые: {[(index, left[index], right[index]) for index in violations[:MAX_REPORTED_VIOLATIONS]]}'
+        )
+
+
+def assert_column_unique(column: Sequence, name: str):
+    """
+    Проверяет, что в колонке нет повторяющихся значений.
+
+    :param column: Проверяемая колонка.
+    :param name: Название колонки для отчёта.
+    :raises AssertionError: Если есть повторы.
+    """
+    with step(f"Проверить, что значения '{name}' уникальны"):
+        logger.info(f'Проверяем, что значения "{name}" уникальны')
+
+        duplicates = find_duplicates(column)
+        assert not duplicates, (
+            f'Повторяющиеся значения "{name}": {len(duplicates)}. '
+            f'Первые: {duplicates[:MAX_REPORTED_VIOLATIONS]}'
+        )
+
+
+def assert_column_contains(column: Sequence, expected: Iterable, name: str):
+    """
+    Проверяет, что колонка содержит все ожидаемые значения.
+
+    :param column: Проверяемая колонка.
+    :param expected: Значения, которые должны присутствовать.
+    :param name: Название колонки для отчёта.
+    :raises AssertionError: Если каких-то значений нет.
+    """
+    with step(f"Проверить, что '{name}' содержит все ожидаемые значения"):
+        logger.info(f'Проверяем, что "{name}" содержит все ожидаемые значения')
+
+        missing = find_missing(column, expected)
+        assert not missing, (
+            f'Отсутствуют значения "{name}": {len(missing)}. '
+            f'Первые: {missing[:MAX_REPORTED_VIOLATIONS]}'
+        )
+
+
+def assert_column_contiguous(groups: Sequence, values: Sequence[int], name: str):
+    """
+    Проверяет, что в каждой группе значения уникальны и идут без пропусков.
+
+    :param groups: Колонка группировки.
+    :param values: Колонка значений.
+    :param name: Описание инварианта для отчёта (например, 'order_index по курсу').
+    :raises AssertionError: Если в какой-то группе есть повторы или пропуски.
+    """
+    with step(f"Проверить, что '{name}' уникален и непрерывен"):
+        logger.info(f'Проверяем, что "{name}" уникален и непрерывен')
+
+        gaps = find_sequence_gaps(groups, values)
+        assert not gaps, (
+            f'Нарушена непрерывность "{name}" в {len(gaps)} группах. '
+            f'Первые: {list(gaps.items())[:MAX_REPORTED_VIOLATIONS]}'
+        )
@@ -1,10 +1,14 @@
+from typing import Iterable
+
 from clients.courses.courses_schema import UpdateCourseRequestSchema, UpdateCourseResponseSchema, CourseSchema, \
     GetCoursesResponseSchema, CreateCourseResponseSchema, CreateCourseRequestSchema
 from tools.assertions.base import assert_equal, assert_length
+from tools.assertions.columnar import assert_column_not_greater, assert_column_unique, assert_column_contains
 from tools.assertions.files import assert_file
 from tools.assertions.users import assert_user
-import allure
+from tools.columnar import CoursesTable
 from tools.logger import get_logger
+from tools.allure.reporting import step
 
 logger = get_logger("COURSES_ASSERTIONS")
 
@@ -23,7 +27,7 @@ def assert_update_course_response(
     Raises:
         AssertionError: Если данные не соответствуют
     """
-    with allure.step("Проверить ответ обновления курса"):
+    with step("Проверить ответ обновления курса"):
         logger.info("Проверяем ответ обновления курса")
 
         assert_equal(response.course.title, request.title, "Название курса")
@@ -44,7 +48,7 @@ def assert_course(actual: CourseSchema, expected: CourseSchema):
     Raises:
         AssertionError: Если данные не совпадают
     """
-    with allure.step("Проверить данные курса"):
+    with step("Проверить данные курса"):
         logger.info("Проверяем данные курса")
 
         assert_equal(actual.id, expected.id, "ID курса")
@@ -54,10 +58,10 @@ def assert_course(actual: CourseSchema, expected: CourseSchema):
         assert_equal(actual.description, expected.description, "Описание")
         assert_equal(actual.estimated_time, expected.estimated_time, "Время прохождения")
 
-        with allure.step("Проверить превью курса"):
+        with step("Проверить превью курса"):
             assert_file(actual.preview_file, expected.preview_file)
 
-        with allure.step("Проверить создателя курса"):
+        with step("Проверить создателя курса"):
             assert_user(actual.created_by_user, expected.created_by_user)
 
 
@@ -75,16 +79,62 @@ def assert_get_courses_response(
     Raises:
         AssertionError: Если списки не соответствуют
     """
-    with allure.step("Проверить список курсов"):
+    with step("Проверить список курсов"):
         logger.info("Проверяем список курсов")
 
         assert_length(get_courses_response.courses, create_course_responses, "Количество курсов")
 
         for index, create_course_response in enumerate(create_course_responses):
-            with allure.step(f"Проверить курс #{index + 1}"):
+            with step(f"Проверить курс #{index + 1}"):
                 assert_course(get_courses_response.courses[index], create_course_response.course)
 
 
+def assert_get_courses_stream(
+        courses: Iterable[CourseSchema],
+        create_course_responses: list[CreateCourseResponseSchema]
+):
+    """
+    Проверяет потоковый список курсов по мере поступления элементов.
+
+    Args:
+        courses: Итератор курсов (например, из CoursesClient.get_courses_stream)
+        create_course_responses: Данные создания курсов
+
+    Raises:
+        AssertionError: Если списки не соответствуют
+    """
+    with step("Проверить потоковый список курсов"):
+        logger.info("Проверяем потоковый список курсов")
+
+        count = 0
+        for index, course in enumerate(courses):
+            count += 1
+            if index < len(create_course_responses):
+                with step(f"Проверить курс #{index + 1}"):
+                    assert_course(course, create_course_responses[index].course)
+
+        assert_equal(count, len(create_course_responses), "Количество курсов")
+
+
+def assert_courses_table(table: CoursesTable, expected_ids: Iterable[str]):
+    """
+    Проверяет инварианты списка курсов по колонкам, без поэлементных проверок.
+
+    Args:
+        table: Колоночное представление списка курсов
+        expected_ids: Идентификаторы курсов, которые должны быть в списке
+
+    Raises:
+        AssertionError: Если инварианты нарушены
+    """
+    with step(f"Проверить инварианты списка из {len(table)} курсов"):
+        logger.info(f"Проверяем инварианты списка из {len(table)} курсов")
+
+        assert_column_unique(table["id"], "id")
+        assert_column_contains(table["id"], expected_ids, "id")
+        assert_column_not_greater(table["min_score"], table["max_score"], "min_score <= max_score")
+
+
 def assert_create_course_response(
         request: CreateCourseRequestSchema,
         response: CreateCourseResponseSchema
@@ -99,7 +149,7 @@ def assert_create_course_response(
     Raises:
         AssertionError: Если данные не соответствуют
     """
-    with allure.step("Проверить созданный курс"):
+    with step("Проверить созданный курс"):
         logger.info("Проверяем созданный курс")
 
         assert_equal(response.course.title, request.title, "Название")
@@ -108,8 +158,8 @@ def assert_create_course_response(
         assert_equal(response.course.description, request.description, "Описание")
         assert_equal(response.course.estimated_time, request.estimated_time, "Время прохождения")
 
-        with allure.step("Проверить превью курса"):
+        with step("Проверить превью курса"):
             assert_equal(response.course.preview_file.id, request.preview_file_id, "ID превью")
 
-        with allure.step("Проверить создателя курса"):
+        with step("Проверить создателя курса"):
             assert_equal(response.course.created_by_user.id, request.created_by_user_id, "ID создателя")
\ No newline at end of file
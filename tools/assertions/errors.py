@@ -1,13 +1,12 @@
-import allure
-
 from clients.errors_schema import ValidationErrorSchema, ValidationErrorResponseSchema, InternalErrorResponseSchema
 from tools.assertions.base import assert_equal, assert_length
 from tools.logger import get_logger
+from tools.allure.reporting import step
 
 logger = get_logger("ERRORS_ASSERTIONS")
 
 
-@allure.step("Проверить ошибку валидации")
+@step("Проверить ошибку валидации")
 def assert_validation_error(actual: ValidationErrorSchema, expected: ValidationErrorSchema):
     """
     Проверяет, что объект ошибки валидации соответствует ожидаемому значению.
@@ -25,7 +24,7 @@ def assert_validation_error(actual: ValidationErrorSchema, expected: ValidationE
     assert_equal(actual.location, expected.location, "location")
 
 
-@allure.step("Проверить ответ с ошибкой валидации")
+@step("Проверить ответ с ошибкой валидации")
 def assert_validation_error_response(
         actual: ValidationErrorResponseSchema,
         expected: ValidationErrorResponseSchema
@@ -46,7 +45,7 @@ def assert_validation_error_response(
         assert_validation_error(actual.details[index], detail)
 
 
-@allure.step("Проверить ответ с внутренней ошибкой")
+@step("Проверить ответ с внутренней ошибкой")
 def assert_internal_error_response(
         actual: InternalErrorResponseSchema,
         expected: InternalErrorResponseSchema
@@ -1,16 +1,21 @@
+from typing import Iterable
+
 from clients.errors_schema import InternalErrorResponseSchema
 from clients.exercises.exercises_schema import CreateExerciseRequestSchema, CreateExerciseResponseSchema, \
     ExerciseSchema, GetExerciseResponseSchema, UpdateExerciseRequestSchema, GetExercisesResponseSchema, \
     UpdateExerciseResponseSchema
 from tools.assertions.base import assert_equal, assert_length
+from tools.assertions.columnar import assert_column_not_greater, assert_column_unique, assert_column_contains, \
+    assert_column_contiguous
 from tools.assertions.errors import assert_internal_error_response
-import allure
+from tools.columnar import ExercisesTable
 from tools.logger import get_logger
+from tools.allure.reporting import step
 
 logger = get_logger("EXERCISES_ASSERTIONS")
 
 
-@allure.step("Проверить задание")
+@step("Проверить задание")
 def assert_exercise(actual: ExerciseSchema, expected: ExerciseSchema):
     """
     Проверяет, что фактические данные задания соответствуют ожидаемым.
@@ -31,7 +36,7 @@ def assert_exercise(actual: ExerciseSchema, expected: ExerciseSchema):
     assert_equal(actual.estimated_time, expected.estimated_time, "estimated_time")
 
 
-@allure.step("Проверить ответ на создание задания")
+@step("Проверить ответ на создание задания")
 def assert_create_exercise_response(
         request: CreateExerciseRequestSchema,
         response: CreateExerciseResponseSchema
@@ -54,7 +59,7 @@ def assert_create_exercise_response(
     assert_equal(response.exercise.estimated_time, request.estimated_time, "estimated_time")
 
 
-@allure.step("Проверить ответ на получение задания")
+@step("Проверить ответ на получение задания")
 def assert_get_exercise_response(
         get_exercise_response: GetExerciseResponseSchema,
         create_exercise_response: CreateExerciseResponseSchema
@@ -71,7 +76,7 @@ def assert_get_exercise_response(
     assert_exercise(get_exercise_response.exercise, create_exercise_response.exercise)
 
 
-@allure.step("Проверить ответ на обновление задания")
+@step("Проверить ответ на обновление задания")
 def assert_update_exercise_response(
         request: UpdateExerciseRequestSchema,
         response: UpdateExerciseResponseSchema
@@ -93,7 +98,7 @@ def assert_update_exercise_response(
     assert_equal(response.exercise.estimated_time, request.estimated_time, "estimated_time")
 
 
-@allure.step("Проверить ответ: задание не найдено")
+@step("Проверить ответ: задание не найдено")
 def assert_exercise_not_found_response(actual: InternalErrorResponseSchema):
     """
     Проверяет, что ответ API соответствует ошибке «Задание не найдено».
@@ -107,7 +112,7 @@ def assert_exercise_not_found_response(actual: InternalErrorResponseSchema):
     assert_internal_error_response(actual, expected)
 
 
-@allure.step("Проверить ответ на получение списка заданий")
+@step("Проверить ответ на получение списка заданий")
 def assert_get_exercises_response(
         get_exercises_response: GetExercisesResponseSchema,
         create_exercise_responses: list[CreateExerciseResponseSchema]
@@ -124,4 +129,44 @@ def assert_get_exercises_response(
     assert_length(get_exercises_response.exercises, create_exercise_responses, "exercises")
 
     for index, create_exercise_response in enumerate(create_exercise_responses):
-        assert_exercise(get_exercises_response.exercises[index], create_exercise_response.exercise)
\ No newline at end of file
+        assert_exercise(get_exercises_response.exercises[index], create_exercise_response.exercise)
+
+
+@step("Проверить потоковый список заданий")
+def assert_get_exercises_stream(
+        exercises: Iterable[ExerciseSchema],
+        create_exercise_responses: list[CreateExerciseResponseSchema]
+):
+    """
+    Проверяет потоковый список заданий по мере поступления элементов.
+
+    :param exercises: Итератор заданий (например, из ExercisesClient.get_exercises_stream).
+    :param create_exercise_responses: Список ответов от API при создании заданий.
+    :raises AssertionError: Если количество или данные заданий не совпадают.
+    """
+    logger.info("Проверка потокового списка заданий")
+
+    count = 0
+    for index, exercise in enumerate(exercises):
+        count += 1
+        if index < len(create_exercise_responses):
+            assert_exercise(exercise, create_exercise_responses[index].exercise)
+
+    assert_equal(count, len(create_exercise_responses), "exercises count")
+
+
+@step("Проверить инварианты списка заданий")
+def assert_exercises_table(table: ExercisesTable, expected_ids: Iterable[str]):
+    """
+    Проверяет инварианты списка заданий по колонкам, без поэлементных проверок.
+
+    :param table: Колоночное представление списка заданий.
+    :param expected_ids: Идентификаторы заданий, которые должны быть в списке.
+    :raises AssertionError: Если инварианты нарушены.
+    """
+    logger.info(f"Проверка инвариантов списка из {len(table)} заданий")
+
+    assert_column_unique(table["id"], "id")
+    assert_column_contains(table["id"], expected_ids, "id")
+    assert_column_not_greater(table["min_score"], table["max_score"], "min_score <= max_score")
+    assert_column_contiguous(table["course_id"], table["order_index"], "order_index по курсу")
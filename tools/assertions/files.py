@@ -1,18 +1,21 @@
-import allure
-
 from clients.errors_schema import ValidationErrorResponseSchema, ValidationErrorSchema, InternalErrorResponseSchema
 from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema, FileSchema, \
-    GetFileResponseSchema
+    GetFileResponseSchema, CreateFileStreamRequestSchema
 from config import settings
 from tools.assertions.base import assert_equal
 from tools.assertions.errors import assert_validation_error_response, assert_internal_error_response
+from tools.http.transfer import TransferStatsSchema
 from tools.logger import get_logger
+from tools.allure.reporting import step
 
 logger = get_logger("FILES_ASSERTIONS")
 
 
-@allure.step("Проверить ответ на создание файла")
-def assert_create_file_response(request: CreateFileRequestSchema, response: CreateFileResponseSchema):
+@step("Проверить ответ на создание файла")
+def assert_create_file_response(
+        request: CreateFileRequestSchema | CreateFileStreamRequestSchema,
+        response: CreateFileResponseSchema
+):
     """
     Проверяет, что ответ на создание файла соответствует отправленному запросу.
 
@@ -29,7 +32,22 @@ def assert_create_file_response(request: CreateFileRequestSchema, response: Crea
     assert_equal(response.file.directory, request.directory, "directory")
 
 
-@allure.step("Проверить файл")
+@step("Проверить целостность переданного файла")
+def assert_file_transfer(actual: TransferStatsSchema, expected: TransferStatsSchema):
+    """
+    Проверяет, что скачанный файл совпадает с загруженным по размеру и SHA-256.
+
+    :param actual: Итоги скачивания файла.
+    :param expected: Итоги загрузки файла.
+    :raises AssertionError: Если размер или контрольная сумма не совпадают.
+    """
+    logger.info("Проверка целостности переданного файла")
+
+    assert_equal(actual.size, expected.size, "size")
+    assert_equal(actual.sha256, expected.sha256, "sha256")
+
+
+@step("Проверить файл")
 def assert_file(actual: FileSchema, expected: FileSchema):
     """
     Проверяет, что фактические данные файла совпадают с ожидаемыми.
@@ -46,7 +64,7 @@ def assert_file(actual: FileSchema, expected: FileSchema):
     assert_equal(actual.directory, expected.directory, "directory")
 
 
-@allure.step("Проверить ответ на получение файла")
+@step("Проверить ответ на получение файла")
 def assert_get_file_response(
         get_file_response: GetFileResponseSchema,
         create_file_response: CreateFileResponseSchema
@@ -63,7 +81,7 @@ def assert_get_file_response(
     assert_file(get_file_response.file, create_file_response.file)
 
 
-@allure.step("Проверить ответ при создании файла с пустым именем")
+@step("Проверить ответ при создании файла с пустым именем")
 def assert_create_file_with_empty_filename_response(actual: ValidationErrorResponseSchema):
     """
     Проверяет, что ответ на попытку создания файла с пустым именем соответствует ожидаемой ошибке валидации.
@@ -87,7 +105,7 @@ def assert_create_file_with_empty_filename_response(actual: ValidationErrorRespo
     assert_validation_error_response(actual, expected)
 
 
-@allure.step("Проверить ответ при создании файла с пустой директорией")
+@step("Проверить ответ при создании файла с пустой директорией")
 def assert_create_file_with_empty_directory_response(actual: ValidationErrorResponseSchema):
     """
     Проверяет, что ответ на попытку создания файла с пустой директорией соответствует ожидаемой ошибке валидации.
@@ -111,7 +129,7 @@ def assert_create_file_with_empty_directory_response(actual: ValidationErrorResp
     assert_validation_error_response(actual, expected)
 
 
-@allure.step("Проверить ответ: файл не найден")
+@step("Проверить ответ: файл не найден")
 def assert_file_not_found_response(actual: InternalErrorResponseSchema):
     """
     Проверяет, что ответ API соответствует ошибке «Файл не найден».
@@ -127,7 +145,7 @@ def assert_file_not_found_response(actual: InternalErrorResponseSchema):
     assert_internal_error_response(actual, expected)
 
 
-@allure.step("Проверить ответ при запросе файла с некорректным ID")
+@step("Проверить ответ при запросе файла с некорректным ID")
 def assert_get_file_with_incorrect_file_id_response(actual: ValidationErrorResponseSchema):
     """
     Проверяет, что ответ на запрос файла с некорректным UUID соответствует ожидаемой ошибке валидации.
@@ -0,0 +1,30 @@
+import allure
+
+from tools.logger import get_logger
+from tools.scaling import ScalingPointSchema, estimate_growth_exponent, render_scaling_table, MAX_GROWTH_EXPONENT
+from tools.allure.reporting import step, attach
+
+logger = get_logger("PERFORMANCE_ASSERTIONS")
+
+
+def assert_linear_scaling(points: list[ScalingPointSchema], name: str, max_exponent: float = MAX_GROWTH_EXPONENT):
+    """
+    Проверяет, что задержка списочного эндпоинта растёт не быстрее заданной степени N.
+
+    :param points: Замеры на разных размерах набора данных.
+    :param name: Название эндпоинта для отчёта.
+    :param max_exponent: Максимально допустимый показатель роста.
+    :raises AssertionError: Если зависимость сверхлинейная.
+    """
+    exponent = estimate_growth_exponent(points)
+    table = render_scaling_table(points)
+
+    with step(f"Проверить, что задержка '{name}' растёт не быстрее N^{max_exponent}"):
+        logger.info(f'Проверяем масштабирование "{name}": показатель роста {exponent:.2f}\n{table}')
+        attach(f"{table}\n\nexponent={exponent:.2f}", f"Масштабирование {name}", allure.attachment_type.TEXT)
+
+        assert exponent <= max_exponent, (
+            f'Сверхлинейный рост задержки: "{name}". '
+            f'Ожидался показатель не выше {max_exponent}. '
+            f'Фактически: {exponent:.2f}'
+        )
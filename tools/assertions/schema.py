@@ -1,14 +1,12 @@
 from typing import Any
 
-from jsonschema import validate
-from jsonschema.validators import Draft202012Validator
-import allure
 from tools.logger import get_logger
+from tools.allure.reporting import step
 
 logger = get_logger("SCHEMA_ASSERTIONS")
 
 
-@allure.step("Проверка соответствия JSON-схеме")
+@step("Проверка соответствия JSON-схеме")
 def validate_json_schema(instance: Any, schema: dict) -> None:
     """
     Проверяет, соответствует ли JSON-объект (instance) указанной JSON-схеме (schema).
@@ -19,6 +17,11 @@ def validate_json_schema(instance: Any, schema: dict) -> None:
     """
     logger.info("Проверка соответствия JSON-схеме")
 
+    # jsonschema импортируется здесь, а не на уровне модуля: он нужен только тестам со схемами,
+    # а его импорт заметно удлиняет сбор тестов в каждом воркере xdist
+    from jsonschema import validate
+    from jsonschema.validators import Draft202012Validator
+
     validate(
         schema=schema,
         instance=instance,
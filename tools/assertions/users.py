@@ -1,4 +1,3 @@
-import allure
 from clients.users.users_schema import (
     CreateUserRequestSchema,
     CreateUserResponseSchema,
@@ -7,6 +6,7 @@ from clients.users.users_schema import (
 )
 from tools.assertions.base import assert_equal
 from tools.logger import get_logger
+from tools.allure.reporting import step
 
 logger = get_logger("USERS_ASSERTIONS")
 
@@ -25,7 +25,7 @@ def assert_create_user_response(
     Raises:
         AssertionError: Если данные не соответствуют запросу
     """
-    with allure.step("Проверить ответ на создание пользователя"):
+    with step("Проверить ответ на создание пользователя"):
         logger.info("Проверяем ответ на создание пользователя")
 
         assert_equal(response.user.email, request.email, "Email пользователя")
@@ -48,7 +48,7 @@ def assert_user(
     Raises:
         AssertionError: Если данные не совпадают
     """
-    with allure.step("Проверить данные пользователя"):
+    with step("Проверить данные пользователя"):
         logger.info("Проверяем данные пользователя")
 
         assert_equal(actual.id, expected.id, "ID пользователя")
@@ -72,6 +72,6 @@ def assert_get_user_response(
     Raises:
         AssertionError: Если данные не совпадают
     """
-    with allure.step("Проверить полученные данные пользователя"):
+    with step("Проверить полученные данные пользователя"):
         logger.info("Проверяем полученные данные пользователя")
         assert_user(get_user_response.user, create_user_response.user)
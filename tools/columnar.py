@@ -0,0 +1,123 @@
+import json
+import operator
+from array import array
+from collections import Counter, defaultdict
+from itertools import compress
+from typing import Any, ClassVar, Iterable, Self, Sequence
+
+
+class ColumnarTable:
+    """
+    Колоночное представление списочного ответа API.
+
+    Каждое поле хранится отдельной колонкой: числовые — в array.array, строковые — в списке.
+    Элементы ответа не превращаются в модели Pydantic, а инварианты проверяются
+    по целым колонкам (см. функции ниже), а не поэлементными assert_equal.
+
+    COLUMNS задаёт колонки наследника: имя колонки -> (ключ в JSON, typecode array или None для строк).
+    """
+    COLUMNS: ClassVar[dict[str, tuple[str, str | None]]] = {}
+
+    def __init__(self):
+        self.columns: dict[str, array | list] = {
+            name: array(typecode) if typecode else []
+            for name, (_, typecode) in self.COLUMNS.items()
+        }
+        # Ключ вложенного поля записывается через точку: "previewFile.id"
+        self._paths = [(self.columns[name], key.split(".")) for name, (key, _) in self.COLUMNS.items()]
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def __getitem__(self, name: str) -> array | list:
+        return self.columns[name]
+
+    def append(self, item: dict[str, Any]):
+        for column, path in self._paths:
+            value = item
+            for part in path:
+                value = value[part]
+
+            column.append(value)
+
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict[str, Any]]) -> Self:
+        table = cls()
+        for item in items:
+            table.append(item)
+
+        return table
+
+    @classmethod
+    def from_json(cls, data: bytes | str, key: str) -> Self:
+        """
+        Строит таблицу из тела списочного ответа.
+
+        :param data: Тело ответа (например, {"courses": [...]}).
+        :param key: Ключ массива элементов в ответе.
+        """
+        return cls.from_dicts(json.loads(data)[key])
+
+
+class CoursesTable(ColumnarTable):
+    COLUMNS = {
+        "id": ("id", None),
+        "max_score": ("maxScore", "q"),
+        "min_score": ("minScore", "q"),
+        "preview_file_id": ("previewFile.id", None),
+        "created_by_user_id": ("createdByUser.id", None),
+    }
+
+
+class ExercisesTable(ColumnarTable):
+    COLUMNS = {
+        "id": ("id", None),
+        "course_id": ("courseId", None),
+        "max_score": ("maxScore", "q"),
+        "min_score": ("minScore", "q"),
+        "order_index": ("orderIndex", "q"),
+    }
+
+
+def find_greater(left: Sequence, right: Sequence) -> list[int]:
+    """
+    Возвращает индексы, где left[i] > right[i]. Сравнение выполняется map/compress без цикла на Python.
+    """
+    return list(compress(range(len(left)), map(operator.gt, left, right)))
+
+
+def find_duplicates(column: Iterable) -> list:
+    """
+    Возвращает значения, встречающиеся в колонке больше одного раза.
+    """
+    return [value for value, count in Counter(column).items() if count > 1]
+
+
+def find_missing(column: Iterable, expected: Iterable) -> list:
+    """
+    Возвращает ожидаемые значения, которых нет в колонке.
+    """
+    present = set(column)
+    return [value for value in expected if value not in present]
+
+
+def find_sequence_gaps(groups: Sequence, values: Sequence[int]) -> dict[Any, list[int]]:
+    """
+    Проверяет, что в каждой группе значения образуют непрерывную последовательность без повторов.
+
+    :param groups: Колонка группировки (например, course_id).
+    :param values: Колонка значений (например, order_index).
+    :return: Группы с нарушением -> отсортированные значения группы.
+    """
+    grouped: dict[Any, list[int]] = defaultdict(list)
+    for group, value in zip(groups, values):
+        grouped[group].append(value)
+
+    gaps = {}
+    for group, group_values in grouped.items():
+        group_values.sort()
+        expected = range(group_values[0], group_values[0] + len(group_values))
+        if group_values != list(expected):
+            gaps[group] = group_values
+
+    return gaps
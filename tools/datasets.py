@@ -0,0 +1,134 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from clients.courses.courses_client import CoursesClient, get_courses_client
+from clients.courses.courses_schema import CreateCourseRequestSchema, CourseRecord
+from clients.exercises.exercises_client import ExercisesClient, get_exercises_client
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema, ExerciseRecord
+from clients.files.files_client import get_files_client
+from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema
+from clients.private_http_builder import AuthenticationUserSchema
+from clients.users.public_users_client import get_public_users_client
+from clients.users.users_schema import CreateUserRequestSchema, CreateUserResponseSchema
+from config import settings
+from tools.logger import get_logger
+from tools.allure.reporting import step
+
+logger = get_logger("DATASETS")
+
+# Сколько запросов на создание сущностей выполняется параллельно
+DEFAULT_CONCURRENCY: int = 8
+
+
+class DatasetBuilder:
+    """
+    Наполняет одного пользователя курсами, а курсы — заданиями.
+
+    Набор растёт инкрементально: повторный вызов ensure_* досоздаёт только недостающее,
+    поэтому прогон по возрастающим размерам строит сид один раз.
+    Сущности создаются параллельно через общий пул соединений клиента и хранятся
+    компактными записями (CourseRecord, ExerciseRecord); полные модели Pydantic
+    строятся из них по требованию через to_schema().
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY):
+        self.concurrency = concurrency
+
+        self.user_request = CreateUserRequestSchema()
+        self.user_response: CreateUserResponseSchema = get_public_users_client().create_user(self.user_request)
+        self.authentication_user = AuthenticationUserSchema(
+            email=self.user_request.email,
+            password=self.user_request.password
+        )
+
+        self.courses_client: CoursesClient = get_courses_client(self.authentication_user)
+        self.exercises_client: ExercisesClient = get_exercises_client(self.authentication_user)
+        self.preview_file: CreateFileResponseSchema = get_files_client(self.authentication_user).create_file(
+            CreateFileRequestSchema(upload_file=settings.test_data.image_png_file)
+        )
+
+        self.courses: list[CourseRecord] = []
+        self.exercises: dict[str, list[ExerciseRecord]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def user_id(self) -> str:
+        return self.user_response.user.id
+
+    def _create_course(self, _: int) -> CourseRecord:
+        request = CreateCourseRequestSchema(
+            preview_file_id=self.preview_file.file.id,
+            created_by_user_id=self.user_id
+        )
+        return self.courses_client.create_course_record(request)
+
+    def _create_exercise(self, course_id: str, order_index: int) -> ExerciseRecord:
+        request = CreateExerciseRequestSchema(courseId=course_id, orderIndex=order_index)
+        return self.exercises_client.create_exercise_record(request)
+
+    def ensure_courses(self, count: int) -> list[CourseRecord]:
+        """
+        Досоздаёт курсы пользователя до нужного количества.
+
+        :param count: Требуемое количество курсов.
+        :return: Первые count курсов пользователя.
+        """
+        with self._lock:
+            missing = count - len(self.courses)
+            if missing > 0:
+                with step(f"Досоздать {missing} курсов (всего {count})"):
+                    logger.info(f"Досоздаём {missing} курсов (всего {count})")
+
+                    with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                        self.courses.extend(executor.map(self._create_course, range(missing)))
+
+            return self.courses[:count]
+
+    def ensure_exercises(self, course_id: str, count: int) -> list[ExerciseRecord]:
+        """
+        Досоздаёт задания курса до нужного количества.
+
+        :param course_id: Идентификатор курса.
+        :param count: Требуемое количество заданий.
+        :return: Первые count заданий курса.
+        """
+        with self._lock:
+            exercises = self.exercises.setdefault(course_id, [])
+            missing = count - len(exercises)
+            if missing > 0:
+                with step(f"Досоздать {missing} заданий курса {course_id} (всего {count})"):
+                    logger.info(f"Досоздаём {missing} заданий курса {course_id} (всего {count})")
+
+                    with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                        exercises.extend(executor.map(
+                            lambda order_index: self._create_exercise(course_id, order_index),
+                            range(len(exercises), count)
+                        ))
+
+            return exercises[:count]
+
+    def ensure(self, courses_count: int, exercises_count: int) -> list[CourseRecord]:
+        """
+        Гарантирует набор из courses_count курсов по exercises_count заданий в каждом.
+
+        :param courses_count: Количество курсов.
+        :param exercises_count: Количество заданий в каждом курсе.
+        :return: Курсы набора.
+        """
+        courses = self.ensure_courses(courses_count)
+        for course in courses:
+            self.ensure_exercises(course.id, exercises_count)
+
+        return courses
+
+
+@lru_cache(maxsize=None)
+def get_dataset_builder(concurrency: int = DEFAULT_CONCURRENCY) -> DatasetBuilder:
+    """
+    Возвращает общий на процесс DatasetBuilder, чтобы сид строился один раз за сессию.
+
+    :param concurrency: Количество параллельных запросов на создание.
+    :return: Готовый к использованию DatasetBuilder.
+    """
+    return DatasetBuilder(concurrency=concurrency)
@@ -1,5 +1,7 @@
-from faker import Faker
-from typing import Final
+from typing import Final, Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from faker import Faker
 
 
 class Fake:
@@ -18,14 +20,27 @@ class Fake:
     DEFAULT_MIN_SCORE_RANGE: Final[tuple[int, int]] = (1, 30)
     DEFAULT_ESTIMATED_TIME_RANGE: Final[tuple[int, int]] = (1, 10)
 
-    def __init__(self, faker: Faker = Faker()) -> None:
+    def __init__(self, faker: "Faker | None" = None) -> None:
         """
         Инициализирует генератор тестовых данных.
 
         Args:
-            faker: Экземпляр Faker (по умолчанию создается новый)
+            faker: Экземпляр Faker (по умолчанию создается при первой генерации данных)
+        """
+        self._faker = faker
+
+    @property
+    def faker(self) -> "Faker":
+        """
+        Экземпляр Faker. Импорт faker и загрузка провайдеров занимают десятки миллисекунд,
+        поэтому откладываются до первого использования, а не выполняются при импорте модуля.
         """
-        self.faker = faker
+        if self._faker is None:
+            from faker import Faker
+
+            self._faker = Faker()
+
+        return self._faker
 
     def text(self) -> str:
         """Генерирует случайный текст (1 абзац)."""
@@ -97,6 +112,20 @@ class Fake:
         """Генерирует случайный минимальный балл (1-30 по умолчанию)."""
         return self.integer(*self.DEFAULT_MIN_SCORE_RANGE)
 
+    def binary_chunks(self, size: int, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """
+        Генерирует случайное двоичное содержимое заданного размера кусками.
+
+        Args:
+            size: Общий размер содержимого в байтах
+            chunk_size: Размер одного куска в байтах
+
+        Returns:
+            Итератор по кускам; в памяти одновременно находится не больше одного куска
+        """
+        for offset in range(0, size, chunk_size):
+            yield self.faker.binary(length=min(chunk_size, size - offset))
+
 
 # Создаем экземпляр по умолчанию для удобного импорта
 fake = Fake()
\ No newline at end of file
@@ -0,0 +1,254 @@
+import itertools
+import random
+import threading
+import time
+from typing import Iterator
+
+from httpx import BaseTransport, HTTPTransport, Request, Response, SyncByteStream, TransportError, URL
+
+from config import BalancingPolicy
+from tools.http.timeouts import DeadlineExceededError
+from tools.load.histogram import HdrHistogram
+from tools.logger import get_logger
+
+logger = get_logger("REPLICA_BALANCER")
+
+# Статусы, которые говорят о недоступности реплики, а не об ошибке в запросе
+UNHEALTHY_STATUS_CODES: frozenset[int] = frozenset({502, 503, 504})
+# Коэффициент сглаживания скользящей средней задержки
+LATENCY_EWMA_ALPHA: float = 0.2
+
+
+class Replica:
+    """
+    Состояние одной реплики API: активные запросы, задержки и здоровье.
+
+    Задержки успешных запросов копятся в гистограмме (в микросекундах): память не растёт с числом запросов.
+    """
+
+    def __init__(self, url: URL):
+        self.url = url
+        self.outstanding = 0
+        self.latencies = HdrHistogram(significant_digits=2)
+        self.latency_ewma: float | None = None
+        self.errors = 0
+        self.consecutive_failures = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+
+    @property
+    def name(self) -> str:
+        return str(self.url.copy_with(query=None)).rstrip("/")
+
+    def is_healthy(self, now: float) -> bool:
+        return now >= self.ejected_until
+
+
+class ReplicaBalancer:
+    """
+    Выбирает реплику для каждого запроса по заданной политике.
+
+    Реплика исключается из выбора на ejection_period секунд после ejection_threshold
+    подряд неудачных запросов (ошибка соединения или 502/503/504). Если исключены все реплики,
+    запросы распределяются по всем: лучше получить ошибку в тесте, чем не отправить запрос вовсе.
+    """
+
+    def __init__(
+            self,
+            urls: list[str],
+            policy: BalancingPolicy = BalancingPolicy.ROUND_ROBIN,
+            ejection_threshold: int = 3,
+            ejection_period: float = 30.0,
+            seed: int | None = None
+    ):
+        self.replicas = [Replica(URL(url)) for url in urls]
+        self.policy = policy
+        self.ejection_threshold = ejection_threshold
+        self.ejection_period = ejection_period
+
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+        self._random = random.Random(seed)
+
+    @property
+    def primary(self) -> Replica:
+        return self.replicas[0]
+
+    def acquire(self) -> Replica:
+        """
+        Выбирает реплику и учитывает на ней новый активный запрос.
+        """
+        with self._lock:
+            now = time.monotonic()
+            candidates = [replica for replica in self.replicas if replica.is_healthy(now)] or self.replicas
+
+            replica = self._select(candidates)
+            replica.outstanding += 1
+            return replica
+
+    def _select(self, candidates: list[Replica]) -> Replica:
+        if self.policy == BalancingPolicy.LEAST_OUTSTANDING:
+            # При равенстве начинаем с разных реплик, чтобы не нагружать всегда первую
+            offset = next(self._counter) % len(candidates)
+            rotated = candidates[offset:] + candidates[:offset]
+            return min(rotated, key=lambda replica: replica.outstanding)
+
+        if self.policy == BalancingPolicy.LATENCY_WEIGHTED:
+            known = [replica.latency_ewma for replica in candidates if replica.latency_ewma is not None]
+            # Реплики без замеров получают лучшую известную задержку, чтобы на них тоже шёл трафик
+            default = min(known) if known else 1.0
+            weights = [1 / max(replica.latency_ewma or default, 1e-3) for replica in candidates]
+            return self._random.choices(candidates, weights=weights)[0]
+
+        return candidates[next(self._counter) % len(candidates)]
+
+    def release(self, replica: Replica, latency: float, failed: bool):
+        """
+        Завершает запрос на реплике.
+
+        :param replica: Реплика, выбранная в acquire().
+        :param latency: Время запроса в миллисекундах.
+        :param failed: Признак того, что реплика не смогла обработать запрос.
+        """
+        with self._lock:
+            replica.outstanding -= 1
+
+            if failed:
+                replica.errors += 1
+                replica.consecutive_failures += 1
+
+                if replica.consecutive_failures >= self.ejection_threshold:
+                    replica.consecutive_failures = 0
+                    replica.ejections += 1
+                    replica.ejected_until = time.monotonic() + self.ejection_period
+                    logger.warning(f"Реплика {replica.name} исключена на {self.ejection_period} с")
+                return
+
+            replica.consecutive_failures = 0
+            replica.latencies.record(round(latency * 1000))
+            replica.latency_ewma = latency if replica.latency_ewma is None else (
+                    LATENCY_EWMA_ALPHA * latency + (1 - LATENCY_EWMA_ALPHA) * replica.latency_ewma
+            )
+
+    def cancel(self, replica: Replica):
+        """
+        Завершает запрос, прерванный не по вине реплики: без учёта задержки и здоровья.
+
+        :param replica: Реплика, выбранная в acquire().
+        """
+        with self._lock:
+            replica.outstanding -= 1
+
+    def rewrite(self, request: Request, replica: Replica):
+        """
+        Перенаправляет запрос, адресованный основной реплике, на выбранную.
+
+        Базовый путь основной реплики в пути запроса заменяется базовым путём выбранной:
+        http://a/v2/api/v1/users -> http://b/api/v1/users для реплик http://a/v2 и http://b.
+        """
+        path = request.url.path.removeprefix(self.primary.url.path.rstrip("/"))
+        request.url = request.url.copy_with(
+            scheme=replica.url.scheme,
+            host=replica.url.host,
+            port=replica.url.port,
+            path=replica.url.path.rstrip("/") + path
+        )
+        request.headers["Host"] = request.url.netloc.decode("ascii")
+
+    def targets(self, request: Request) -> bool:
+        primary = self.primary.url
+        return (
+                (request.url.scheme, request.url.host, request.url.port) == (primary.scheme, primary.host, primary.port)
+                and request.url.path.startswith(primary.path.rstrip("/"))
+        )
+
+    def summary(self) -> str:
+        """
+        Возвращает сводку по репликам: число запросов, ошибок, исключений, медиана и p95 задержки.
+        """
+        lines = [f"policy={self.policy}"]
+        with self._lock:
+            for replica in self.replicas:
+                latencies = replica.latencies
+                if latencies.total_count:
+                    median = latencies.value_at_percentile(50) / 1000
+                    p95 = latencies.value_at_percentile(95) / 1000
+                    latency = f"median={median:8.1f}ms  p95={p95:8.1f}ms"
+                else:
+                    latency = "нет успешных запросов"
+
+                lines.append(
+                    f"  {replica.name}: {latencies.total_count} запросов, ошибок: {replica.errors}, "
+                    f"исключений: {replica.ejections}, {latency}"
+                )
+
+        return "\n".join(lines)
+
+
+class ReplicaResponseStream(SyncByteStream):
+    """
+    Тело ответа реплики: запрос считается завершённым, когда тело дочитано и закрыто.
+    """
+
+    def __init__(self, stream: SyncByteStream, on_close):
+        self._stream = stream
+        self._on_close = on_close
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self):
+        try:
+            self._stream.close()
+        finally:
+            on_close, self._on_close = self._on_close, None
+            if on_close is not None:
+                on_close()
+
+
+class BalancedTransport(BaseTransport):
+    """
+    Транспорт httpx, распределяющий запросы к базовому URL клиента между репликами.
+
+    Клиент создаётся с base_url основной (первой) реплики; запросы на другие хосты
+    (например, на внешние ссылки) передаются без изменений.
+    """
+
+    def __init__(self, balancer: ReplicaBalancer, transport: BaseTransport | None = None):
+        self.balancer = balancer
+        self.transport = transport or HTTPTransport()
+
+    def handle_request(self, request: Request) -> Response:
+        if not self.balancer.targets(request):
+            return self.transport.handle_request(request)
+
+        replica = self.balancer.acquire()
+        self.balancer.rewrite(request, replica)
+        started_at = time.perf_counter()
+
+        try:
+            response = self.transport.handle_request(request)
+        except BaseException as error:
+            # Любое исключение завершает запрос, иначе outstanding реплики не уменьшится никогда.
+            # Неудачей реплики считаются только сетевые ошибки; истёкший срок теста — не её вина
+            if isinstance(error, TransportError) and not isinstance(error, DeadlineExceededError):
+                self.balancer.release(replica, (time.perf_counter() - started_at) * 1000, failed=True)
+            else:
+                self.balancer.cancel(replica)
+            raise
+
+        failed = response.status_code in UNHEALTHY_STATUS_CODES
+
+        def on_close():
+            self.balancer.release(replica, (time.perf_counter() - started_at) * 1000, failed=failed)
+
+        if response.is_closed:
+            # Тело уже прочитано транспортом (например, MockTransport)
+            on_close()
+        else:
+            response.stream = ReplicaResponseStream(response.stream, on_close)
+
+        return response
+
+    def close(self):
+        self.transport.close()
@@ -0,0 +1,321 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Protocol
+
+from httpx import BaseTransport, ByteStream, Request, Response
+
+# Методы, которые изменяют ресурс и сбрасывают его записи в кеше
+INVALIDATING_METHODS: frozenset[str] = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+# Заголовки, которые всегда входят в ключ: ответы разных пользователей не смешиваются, даже если сервер не прислал Vary
+KEY_HEADERS: tuple[str, ...] = ("authorization", "cookie")
+
+
+class CachedResponse:
+    """
+    Запись кеша: сырой ответ (тело до декодирования content-encoding) и валидаторы.
+    """
+    __slots__ = ("path", "status_code", "headers", "content", "stored_at", "max_age", "etag", "last_modified", "vary")
+
+    def __init__(
+            self,
+            path: str,
+            status_code: int,
+            headers: list[tuple[str, str]],
+            content: bytes,
+            stored_at: float,
+            max_age: float | None,
+            etag: str | None,
+            last_modified: str | None,
+            vary: dict[str, str | None] | None = None
+    ):
+        self.path = path
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.stored_at = stored_at
+        self.max_age = max_age
+        self.etag = etag
+        self.last_modified = last_modified
+        # Значения заголовков запроса из Vary ответа: запись подходит только запросу с теми же значениями
+        self.vary = vary or {}
+
+    def matches(self, request: Request) -> bool:
+        return all(request.headers.get(header) == value for header, value in self.vary.items())
+
+    def is_fresh(self, now: float) -> bool:
+        return self.max_age is not None and now - self.stored_at < self.max_age
+
+    def to_response(self, request: Request, cache_status: str) -> Response:
+        return Response(
+            self.status_code,
+            headers=self.headers,
+            stream=ByteStream(self.content),
+            request=request,
+            extensions={"cache_status": cache_status}
+        )
+
+
+class CacheStore(Protocol):
+    def get(self, key: str) -> CachedResponse | None: ...
+
+    def put(self, key: str, entry: CachedResponse): ...
+
+    def invalidate(self, paths: set[str]) -> int: ...
+
+
+class MemoryCacheStore:
+    """
+    LRU-кеш в памяти процесса.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: CachedResponse):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, paths: set[str]) -> int:
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry.path in paths]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+
+class DiskCacheStore:
+    """
+    Кеш на диске: заголовки и валидаторы в <key>.json, тело в <key>.body.
+
+    Переживает перезапуск процесса и может использоваться несколькими воркерами. Оба файла пишутся
+    через временный файл и replace, а в метаданных хранится SHA-256 тела: читатель не увидит
+    наполовину записанный файл, а тело от другой записи того же ключа отбрасывается как промах.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> CachedResponse | None:
+        try:
+            meta = json.loads((self.directory / f"{key}.json").read_text())
+            content = (self.directory / f"{key}.body").read_bytes()
+            if meta.pop("sha256") != hashlib.sha256(content).hexdigest():
+                return None
+
+            return CachedResponse(content=content, headers=[tuple(header) for header in meta.pop("headers")], **meta)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write(self, path: Path, data: bytes):
+        # Временный файл уникален для процесса и потока: одновременные записи одного ключа не мешают друг другу
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temporary.write_bytes(data)
+        temporary.replace(path)
+
+    def put(self, key: str, entry: CachedResponse):
+        meta = {slot: getattr(entry, slot) for slot in CachedResponse.__slots__ if slot != "content"}
+        meta["sha256"] = hashlib.sha256(entry.content).hexdigest()
+
+        self._write(self.directory / f"{key}.body", entry.content)
+        self._write(self.directory / f"{key}.json", json.dumps(meta).encode())
+
+    def invalidate(self, paths: set[str]) -> int:
+        invalidated = 0
+        for meta_path in self.directory.glob("*.json"):
+            try:
+                if json.loads(meta_path.read_text())["path"] not in paths:
+                    continue
+            except (OSError, ValueError, KeyError):
+                continue
+
+            meta_path.unlink(missing_ok=True)
+            meta_path.with_suffix(".body").unlink(missing_ok=True)
+            invalidated += 1
+
+        return invalidated
+
+
+class CacheStats:
+    """
+    Счётчики кеша за сессию: hit (свежая запись без запроса), revalidated (304),
+    miss, stored, invalidated.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Counter[str] = Counter()
+
+    def add(self, name: str, count: int = 1):
+        with self._lock:
+            self._counters[name] += count
+
+    def summary(self) -> str:
+        with self._lock:
+            return ", ".join(f"{name}={count}" for name, count in sorted(self._counters.items()))
+
+
+cache_stats = CacheStats()
+
+
+def parse_cache_control(value: str) -> dict[str, str | None]:
+    directives = {}
+    for part in filter(None, (item.strip() for item in value.split(","))):
+        name, _, argument = part.partition("=")
+        directives[name.lower()] = argument.strip('"') or None
+
+    return directives
+
+
+def get_max_age(headers, now: float) -> float | None:
+    """
+    Время свежести ответа: max-age из Cache-Control или Expires. None — ответ нужно ревалидировать.
+    """
+    directives = parse_cache_control(headers.get("cache-control", ""))
+    if "no-cache" in directives:
+        return None
+
+    if (max_age := directives.get("s-maxage") or directives.get("max-age")) is not None:
+        try:
+            return float(max_age)
+        except ValueError:
+            return None
+
+    if expires := headers.get("expires"):
+        try:
+            return parsedate_to_datetime(expires).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+
+    return None
+
+
+class CachingTransport(BaseTransport):
+    """
+    Транспорт httpx с HTTP-кешем GET-ответов по ETag/Last-Modified/Cache-Control.
+
+    Свежая по max-age запись отдаётся без запроса. Устаревшая ревалидируется условным запросом
+    (If-None-Match/If-Modified-Since): на 304 возвращается тело из кеша. PATCH/DELETE (а также POST/PUT)
+    сбрасывают записи ресурса и его коллекции. В extensions ответа пишется cache_status:
+    hit, revalidated, miss или bypass.
+
+    Ключ учитывает заголовки KEY_HEADERS (Authorization, Cookie): клиенты разных пользователей не видят
+    кеш друг друга, даже если хранилище общее. Заголовки из Vary ответа сохраняются в записи, и запись
+    отдаётся только запросу с теми же их значениями; ответы с Vary: * не кешируются.
+    """
+
+    def __init__(self, transport: BaseTransport, store: CacheStore, max_body_size: int = 1024 * 1024):
+        self.transport = transport
+        self.store = store
+        self.max_body_size = max_body_size
+
+    @staticmethod
+    def get_cache_key(request: Request) -> str:
+        headers = "\n".join(request.headers.get(header, "") for header in KEY_HEADERS)
+        return hashlib.sha256(f"{request.url}\n{headers}".encode()).hexdigest()
+
+    def handle_request(self, request: Request) -> Response:
+        if request.method in INVALIDATING_METHODS:
+            path = request.url.path.rstrip("/")
+            response = self.transport.handle_request(request)
+            if response.status_code < 400:
+                cache_stats.add("invalidated", self.store.invalidate({path, path.rsplit("/", 1)[0]}))
+            return response
+
+        if request.method != "GET":
+            return self.transport.handle_request(request)
+
+        key = self.get_cache_key(request)
+        path = request.url.path.rstrip("/")
+        entry = self.store.get(key)
+        if entry is not None and not entry.matches(request):
+            entry = None
+        now = time.time()
+
+        if entry is not None and entry.is_fresh(now):
+            cache_stats.add("hit")
+            return entry.to_response(request, "hit")
+
+        if entry is not None:
+            if entry.etag:
+                request.headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request.headers["If-Modified-Since"] = entry.last_modified
+
+        response = self.transport.handle_request(request)
+
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            cache_stats.add("revalidated")
+            # Сервер мог обновить валидаторы и срок свежести
+            entry.stored_at = now
+            entry.max_age = get_max_age(response.headers, now)
+            entry.etag = response.headers.get("etag", entry.etag)
+            entry.last_modified = response.headers.get("last-modified", entry.last_modified)
+            self.store.put(key, entry)
+            return entry.to_response(request, "revalidated")
+
+        return self._store(key, path, request, response, now)
+
+    def _store(self, key: str, path: str, request: Request, response: Response, now: float) -> Response:
+        directives = parse_cache_control(response.headers.get("cache-control", ""))
+        max_age = get_max_age(response.headers, now)
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        vary = [header.strip().lower() for header in response.headers.get("vary", "").split(",") if header.strip()]
+
+        content_length = int(response.headers.get("content-length", -1))
+        cacheable = (
+                response.status_code == 200
+                and "no-store" not in directives
+                and "*" not in vary
+                and (etag or last_modified or max_age)
+                # Тело читается в память целиком, поэтому большие и потоковые ответы не кешируются
+                and 0 <= content_length <= self.max_body_size
+        )
+        if not cacheable:
+            cache_stats.add("miss")
+            response.extensions = {**response.extensions, "cache_status": "bypass"}
+            return response
+
+        try:
+            content = b"".join(response.stream)
+        finally:
+            response.stream.close()
+
+        entry = CachedResponse(
+            path=path,
+            status_code=response.status_code,
+            headers=response.headers.multi_items(),
+            content=content,
+            stored_at=now,
+            max_age=max_age,
+            etag=etag,
+            last_modified=last_modified,
+            vary={header: request.headers.get(header) for header in vary}
+        )
+        self.store.put(key, entry)
+        cache_stats.add("miss")
+        cache_stats.add("stored")
+
+        return entry.to_response(request, "miss")
+
+    def close(self):
+        self.transport.close()
@@ -0,0 +1,170 @@
+import threading
+from collections import Counter
+
+from httpx import BaseTransport, ByteStream, PoolTimeout, Request, RequestError, Response, TransportError
+
+from tools.http.timeouts import get_remaining
+
+# Идемпотентные методы без тела, которые можно объединять
+COALESCED_METHODS: frozenset[str] = frozenset({"GET", "HEAD"})
+# Заголовки, от которых зависит ответ: запросы с разными значениями не объединяются
+VARY_HEADERS: tuple[str, ...] = ("authorization", "accept", "accept-encoding", "accept-language", "range", "cookie")
+# Расширение запроса, которым APIClient.stream помечает потоковое чтение: такие запросы не объединяются
+STREAMING_EXTENSION: str = "streaming"
+
+
+class InFlightRequest:
+    """
+    Запрос, который уже выполняется: ведущий запрос заполняет результат, остальные ждут event.
+    """
+    __slots__ = ("event", "status_code", "headers", "content", "extensions", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.status_code = 0
+        self.headers: list[tuple[str, str]] = []
+        self.content = b""
+        self.extensions: dict = {}
+        self.error: Exception | None = None
+
+    def to_response(self, request: Request, role: str) -> Response:
+        return Response(
+            self.status_code,
+            headers=self.headers,
+            stream=ByteStream(self.content),
+            request=request,
+            extensions={**self.extensions, "coalesced": role}
+        )
+
+
+class CoalescingStats:
+    """
+    Счётчики объединения за сессию: leader — запросы, ушедшие на сервер,
+    coalesced — запросы, получившие ответ ведущего, bypass — запросы, которые не объединяются,
+    timeout — запросы, не дождавшиеся ответа ведущего.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Counter[str] = Counter()
+
+    def add(self, name: str, count: int = 1):
+        with self._lock:
+            self._counters[name] += count
+
+    def summary(self) -> str:
+        with self._lock:
+            if not self._counters:
+                return ""
+
+            requests = self._counters["leader"] + self._counters["coalesced"]
+            ratio = self._counters["coalesced"] / requests * 100 if requests else 0.0
+            counters = ", ".join(f"{name}={count}" for name, count in sorted(self._counters.items()))
+            return f"{counters}, объединено {ratio:.1f}% GET/HEAD"
+
+
+coalescing_stats = CoalescingStats()
+
+
+class CoalescingTransport(BaseTransport):
+    """
+    Транспорт httpx, который объединяет одинаковые одновременные GET/HEAD-запросы (singleflight).
+
+    Пока запрос с тем же методом, URL и значимыми заголовками (VARY_HEADERS, в том числе Authorization)
+    выполняется, новые такие же запросы не уходят на сервер, а ждут его ответ и получают копию.
+    Ответ ведущего запроса читается целиком, поэтому запросы с расширением STREAMING_EXTENSION
+    (APIClient.stream: get_courses_stream, get_exercises_stream, download_file) не объединяются и читают тело
+    по мере поступления. Ожидающий запрос ждёт не дольше суммы своих таймаутов (extensions["timeout"])
+    и оставшегося срока теста, после чего получает PoolTimeout. Если ведущий запрос упал, каждый ожидающий получает
+своё исключение того же типа со своим запросом (причина — исключение ведущего). В extensions ответа пишется coalesced: leader, follower или bypass.
+    """
+
+    def __init__(self, transport: BaseTransport):
+        self.transport = transport
+        self._lock = threading.Lock()
+        self._in_flight: dict[tuple, InFlightRequest] = {}
+
+    @staticmethod
+    def get_key(request: Request) -> tuple | None:
+        if request.method not in COALESCED_METHODS or request.headers.get("content-length", "0") != "0":
+            return None
+
+        if request.extensions.get(STREAMING_EXTENSION):
+            return None
+
+        return request.method, str(request.url), *(request.headers.get(header) for header in VARY_HEADERS)
+
+    def handle_request(self, request: Request) -> Response:
+        if (key := self.get_key(request)) is None:
+            coalescing_stats.add("bypass")
+            response = self.transport.handle_request(request)
+            response.extensions = {**response.extensions, "coalesced": "bypass"}
+            return response
+
+        with self._lock:
+            in_flight = self._in_flight.get(key)
+            is_leader = in_flight is None
+            if is_leader:
+                in_flight = self._in_flight[key] = InFlightRequest()
+
+        if not is_leader:
+            return self._wait(in_flight, request)
+
+        try:
+            response = self.transport.handle_request(request)
+            try:
+                in_flight.content = b"".join(response.stream)
+            finally:
+                response.stream.close()
+
+            in_flight.status_code = response.status_code
+            in_flight.headers = response.headers.multi_items()
+            # Поток соединения уже закрыт, остальные расширения (http_version, cache_status) общие для всех
+            in_flight.extensions = {
+                name: value for name, value in response.extensions.items() if name != "network_stream"
+            }
+        except Exception as error:
+            in_flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            in_flight.event.set()
+            coalescing_stats.add("leader")
+
+        return in_flight.to_response(request, "leader")
+
+    @staticmethod
+    def get_wait_timeout(request: Request) -> float | None:
+        """
+        Сколько ждать ответ ведущего: столько же, сколько занял бы собственный запрос по всем фазам,
+        но не дольше оставшегося срока теста.
+        """
+        timeouts = request.extensions.get("timeout") or {}
+        timeout = sum(timeouts.values()) if timeouts and None not in timeouts.values() else None
+
+        if (remaining := get_remaining(request)) is not None:
+            timeout = remaining if timeout is None else min(timeout, remaining)
+
+        return None if timeout is None else max(0.0, timeout)
+
+    def _wait(self, in_flight: InFlightRequest, request: Request) -> Response:
+        timeout = self.get_wait_timeout(request)
+        if not in_flight.event.wait(timeout):
+            coalescing_stats.add("timeout")
+            raise PoolTimeout(f"Ответ ведущего запроса не получен за {timeout:.1f}s", request=request)
+
+        coalescing_stats.add("coalesced")
+
+        if (error := in_flight.error) is not None:
+            # Исключение ведущего общее для всех ждущих потоков: каждый ведомый поднимает своё с собственным
+            # запросом, а исключение ведущего становится причиной
+            if isinstance(error, RequestError):
+                raise type(error)(str(error), request=request) from error
+
+            raise TransportError(f"Ведущий запрос завершился ошибкой: {error!r}", request=request) from error
+
+        return in_flight.to_response(request, "follower")
+
+    def close(self):
+        self.transport.close()
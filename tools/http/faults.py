@@ -0,0 +1,151 @@
+import itertools
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Iterator
+
+from httpx import BaseTransport, ByteStream, Request, Response, SyncByteStream, ReadTimeout, RemoteProtocolError
+
+from config import FaultPolicySchema
+from tools.http.timeouts import get_remaining
+from tools.routes import get_route_template
+
+
+class FaultStats:
+    """
+    Счётчики внедрённых сбоев за сессию.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Counter[str] = Counter()
+        self._latency: float = 0.0
+
+    def add(self, name: str, latency: float = 0.0):
+        with self._lock:
+            self._counters[name] += 1
+            self._latency += latency
+
+    def summary(self) -> str:
+        with self._lock:
+            if not self._counters:
+                return ""
+
+            counters = ", ".join(f"{name}={count}" for name, count in sorted(self._counters.items()))
+            return f"{counters}, добавлено задержки {self._latency:.1f}s"
+
+
+fault_stats = FaultStats()
+
+
+class ThrottledStream(SyncByteStream):
+    """
+    Тело ответа, которое отдаётся не быстрее bandwidth байт в секунду.
+
+    Паузы не выходят за срок теста: фрагмент, который не успевает к сроку, заканчивается ReadTimeout.
+    """
+
+    def __init__(self, stream: SyncByteStream, bandwidth: int, request: Request):
+        self._stream = stream
+        self._bandwidth = bandwidth
+        self._request = request
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            delay = len(chunk) / self._bandwidth
+            if (remaining := get_remaining(self._request)) is not None and delay > remaining:
+                time.sleep(max(0.0, remaining))
+                raise ReadTimeout("Ограничение скорости не укладывается в срок теста", request=self._request)
+
+            time.sleep(delay)
+            yield chunk
+
+    def close(self):
+        self._stream.close()
+
+
+class FaultInjectionTransport(BaseTransport):
+    """
+    Транспорт httpx, который деградирует сеть по маршрутам: задержки, обрывы соединений, 5xx и медленное тело.
+
+    Политика ищется по "МЕТОД шаблон", затем по шаблону маршрута, затем по "*". Решения детерминированы:
+    n-й запрос маршрута получает генератор random.Random(f"{seed}:{маршрут}:{n}"), поэтому при том же seed
+    последовательность сбоев каждого маршрута повторяется независимо от того, как запросы распределились
+    по потокам.
+
+    Задержка больше read-таймаута запроса или оставшегося срока теста заканчивается ReadTimeout через
+    это время, как при реальной сети.
+    """
+
+    def __init__(self, transport: BaseTransport, policies: dict[str, FaultPolicySchema], seed: int = 0):
+        self.transport = transport
+        self.policies = policies
+        self.seed = seed
+
+        self._lock = threading.Lock()
+        self._sequences: dict[str, Iterator[int]] = defaultdict(itertools.count)
+
+    def get_policy(self, request: Request) -> tuple[str, FaultPolicySchema | None]:
+        route = f"{request.method} {get_route_template(request.url.path)}"
+        policy = (
+                self.policies.get(route)
+                or self.policies.get(route.split(" ", 1)[1])
+                or self.policies.get("*")
+        )
+        return route, policy
+
+    def get_generator(self, route: str) -> random.Random:
+        with self._lock:
+            number = next(self._sequences[route])
+
+        return random.Random(f"{self.seed}:{route}:{number}")
+
+    def handle_request(self, request: Request) -> Response:
+        route, policy = self.get_policy(request)
+        if policy is None:
+            return self.transport.handle_request(request)
+
+        generator = self.get_generator(route)
+        # Все случайные величины берутся сразу и в одном порядке: решения не зависят от того, какие ветки сработали
+        latency = policy.sample_latency(generator)
+        dropped = generator.random() < policy.drop_rate
+        failed = generator.random() < policy.error_rate
+        status_code = generator.choice(policy.error_statuses) if policy.error_statuses else 503
+
+        limits = [(request.extensions.get("timeout") or {}).get("read"), get_remaining(request)]
+        limit = min((max(0.0, value) for value in limits if value is not None), default=None)
+        if limit is not None and latency > limit:
+            time.sleep(limit)
+            fault_stats.add("timeout", limit)
+            raise ReadTimeout(
+                f"Внедрённая задержка {latency * 1000:.0f}ms больше read-таймаута или оставшегося срока теста",
+                request=request
+            )
+
+        if latency:
+            time.sleep(latency)
+            fault_stats.add("delayed", latency)
+
+        if dropped:
+            fault_stats.add("dropped")
+            raise RemoteProtocolError("Server disconnected without sending a response (fault injection)", request=request)
+
+        if failed:
+            fault_stats.add(f"http_{status_code}")
+            return Response(
+                status_code,
+                headers={"X-Fault-Injected": "true"},
+                stream=ByteStream(b'{"detail": "Fault injected"}'),
+                request=request
+            )
+
+        response = self.transport.handle_request(request)
+        if policy.bandwidth:
+            fault_stats.add("throttled")
+            response.stream = ThrottledStream(response.stream, policy.bandwidth, request)
+
+        return response
+
+    def close(self):
+        self.transport.close()
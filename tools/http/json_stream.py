@@ -0,0 +1,221 @@
+import json
+import re
+from typing import Iterable, Iterator
+
+# Символы, меняющие вложенность JSON, и начало строки
+_STRUCTURAL_PATTERN = re.compile(rb'[{}\[\]"]')
+# Конец строки или экранирование внутри строки
+_STRING_PATTERN = re.compile(rb'["\\]')
+# Двоеточие и открывающая скобка массива после ключа
+_ARRAY_START_PATTERN = re.compile(rb'\s*:\s*\[')
+# Начало _ARRAY_START_PATTERN, оборванное концом куска: решение откладывается до следующего куска
+_ARRAY_START_PREFIX_PATTERN = re.compile(rb'\s*(:\s*)?')
+
+
+class JsonArrayStreamParser:
+    """
+    Инкрементальный парсер массива внутри JSON-объекта.
+
+    Принимает тело ответа кусками и отдаёт сырые байты каждого элемента массива по ключу,
+    как только элемент полностью получен. Память ограничена размером одного элемента
+    и одного куска тела, а не всего ответа.
+
+    Элементы массива должны быть объектами или массивами (как в списках курсов и заданий).
+    Ключ ищется только среди ключей корневого объекта: одноимённые ключи вложенных объектов
+    и строки-значения не подходят.
+
+    Пример:
+    >>> parser = JsonArrayStreamParser("courses")
+    >>> list(parser.feed(b'{"courses": [{"id": "1"}, {"i'))
+    [b'{"id": "1"}']
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self._key = json.dumps(key, ensure_ascii=False).encode()
+        self._buffer = bytearray()
+        self._position = 0
+        self._item_start: int | None = None
+        self._string_start = 0
+        self._depth = 0
+        self._in_string = False
+        self._started = False
+        self._root_closed = False
+        self.finished = False
+
+    def feed(self, chunk: bytes) -> Iterator[bytes]:
+        """
+        Добавляет очередной кусок тела и возвращает завершённые элементы массива.
+
+        :param chunk: Очередной кусок тела ответа.
+        :return: Итератор по байтам полностью полученных элементов.
+        """
+        if self.finished or self._root_closed:
+            return
+
+        self._buffer += chunk
+
+        if not self._started and not self._find_array():
+            return
+
+        yield from self._scan()
+
+    def close(self):
+        """
+        Проверяет, что массив был найден и прочитан до закрывающей скобки.
+
+        :raises ValueError: Ключа нет в корневом объекте или тело оборвалось.
+        """
+        if self.finished:
+            return
+
+        if not self._started:
+            raise ValueError(f"В корневом объекте JSON нет массива {self.key!r} или тело ответа оборвано до него")
+
+        raise ValueError(f"Тело ответа оборвано внутри массива {self.key!r}")
+
+    def _find_array(self) -> bool:
+        """
+        Ищет массив по ключу среди ключей корневого объекта.
+
+        :return: True, если массив найден: буфер начинается сразу после его открывающей скобки.
+        """
+        buffer = self._buffer
+        position = self._position
+        found = False
+
+        while True:
+            if self._in_string:
+                match = _STRING_PATTERN.search(buffer, position)
+                if not match:
+                    position = len(buffer)
+                    break
+
+                if match.group() == b"\\":
+                    if match.end() >= len(buffer):
+                        position = match.start()
+                        break
+
+                    position = match.end() + 1
+                    continue
+
+                self._in_string = False
+                position = match.end()
+                if self._depth != 1 or buffer[self._string_start:position] != self._key:
+                    continue
+
+                if array := _ARRAY_START_PATTERN.match(buffer, position):
+                    position = array.end()
+                    found = True
+                    break
+
+                if _ARRAY_START_PREFIX_PATTERN.fullmatch(buffer, position):
+                    # После ключа пока только пробелы и двоеточие: строка разбирается заново со следующим куском
+                    position = self._string_start
+                    break
+
+                continue
+
+            match = _STRUCTURAL_PATTERN.search(buffer, position)
+            if not match:
+                position = len(buffer)
+                break
+
+            char = match.group()
+            position = match.end()
+
+            if char == b'"':
+                self._in_string = True
+                self._string_start = match.start()
+            elif char in b"{[":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._root_closed = True
+                    break
+
+        keep_from = self._string_start if self._in_string else position
+        del buffer[:keep_from]
+        self._position = position - keep_from
+        self._string_start -= min(keep_from, self._string_start)
+
+        if found:
+            self._started = True
+            self._depth = 0
+
+        return found
+
+    def _scan(self) -> Iterator[bytes]:
+        buffer = self._buffer
+        position = self._position
+
+        while not self.finished:
+            if self._in_string:
+                match = _STRING_PATTERN.search(buffer, position)
+                if not match:
+                    position = len(buffer)
+                    break
+
+                if match.group() == b"\\":
+                    if match.end() >= len(buffer):
+                        # Экранированный символ придёт в следующем куске
+                        position = match.start()
+                        break
+
+                    position = match.end() + 1
+                    continue
+
+                self._in_string = False
+                position = match.end()
+                continue
+
+            match = _STRUCTURAL_PATTERN.search(buffer, position)
+            if not match:
+                position = len(buffer)
+                break
+
+            char = match.group()
+            position = match.end()
+
+            if char == b'"':
+                self._in_string = True
+            elif char in b"{[":
+                if self._depth == 0:
+                    self._item_start = match.start()
+                self._depth += 1
+            elif self._depth == 0:
+                # Закрылся сам массив
+                self.finished = True
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    yield bytes(buffer[self._item_start:position])
+                    self._item_start = None
+
+        # Отбрасываем уже разобранную часть буфера
+        keep_from = position if self._item_start is None else self._item_start
+        del buffer[:keep_from]
+        self._position = position - keep_from
+        if self._item_start is not None:
+            self._item_start = 0
+
+
+def iter_json_array_items(chunks: Iterable[bytes], key: str) -> Iterator[bytes]:
+    """
+    Потоково извлекает элементы массива по ключу из JSON-объекта.
+
+    :param chunks: Куски тела ответа (например, response.iter_bytes()).
+    :param key: Ключ массива в корневом объекте (например, "courses").
+    :return: Итератор по сырым байтам элементов массива.
+    :raises ValueError: Ключа нет в корневом объекте или тело оборвалось до конца массива.
+    """
+    parser = JsonArrayStreamParser(key)
+
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+
+        if parser.finished:
+            break
+
+    parser.close()
@@ -0,0 +1,33 @@
+from functools import lru_cache
+
+from pydantic import BaseModel
+
+# Заголовки запроса с заранее сериализованным JSON-телом
+JSON_HEADERS: dict[str, str] = {"Content-Type": "application/json"}
+
+
+@lru_cache(maxsize=1024)
+def _dump_frozen_model(model: BaseModel) -> bytes:
+    return model.model_dump_json(by_alias=True).encode()
+
+
+def dump_json_content(model: BaseModel | bytes) -> bytes:
+    """
+    Сериализует модель запроса в JSON-тело.
+
+    Тело строится через model_dump_json(by_alias=True) в pydantic-core и не собирается сначала в dict, который httpx затем кодирует через json.dumps.
+    Неизменяемые модели (frozen=True) хешируемы, и их тела кешируются: при многократной
+    отправке одного и того же запроса сериализация выполняется один раз.
+
+    Готовое тело в байтах (например, собранное из шаблона tools.load.templates) передаётся как есть.
+
+    :param model: Модель запроса или готовое JSON-тело.
+    :return: JSON-тело в байтах.
+    """
+    if isinstance(model, bytes):
+        return model
+
+    if model.model_config.get("frozen"):
+        return _dump_frozen_model(model)
+
+    return model.model_dump_json(by_alias=True).encode()
@@ -0,0 +1,258 @@
+import time
+from typing import Any, Callable, Iterator
+
+from httpx import BaseTransport, Request, Response, SyncByteStream, TimeoutException
+from pydantic import BaseModel
+
+from tools.http.timings import RequestTracer
+from tools.routes import APIRoutes, get_route_template
+
+
+class TimeoutPolicySchema(BaseModel):
+    """
+    Таймауты фаз запроса в секундах. Незаданная фаза берёт общий HTTP_CLIENT.TIMEOUT.
+    """
+    connect: float | None = None
+    read: float | None = None
+    write: float | None = None
+    pool: float | None = None
+
+
+# Политики по шаблонам маршрутов. Ключ — "МЕТОД шаблон" или только шаблон (для всех методов);
+# политика с методом имеет приоритет
+ROUTE_TIMEOUTS: dict[str, TimeoutPolicySchema] = {
+    f"POST {APIRoutes.AUTHENTICATION}/login": TimeoutPolicySchema(connect=5, read=10, write=5, pool=5),
+    f"POST {APIRoutes.AUTHENTICATION}/refresh": TimeoutPolicySchema(connect=5, read=10, write=5, pool=5),
+    f"{APIRoutes.USERS}/me": TimeoutPolicySchema(connect=5, read=10, write=5, pool=5),
+    f"{APIRoutes.USERS}/{{user_id}}": TimeoutPolicySchema(connect=5, read=10, write=5, pool=5),
+    f"{APIRoutes.FILES}/{{file_id}}": TimeoutPolicySchema(connect=5, read=10, write=5, pool=5),
+    # Загрузка файлов: тело передаётся долго, а ответ приходит только после сохранения файла
+    f"POST {APIRoutes.FILES}": TimeoutPolicySchema(connect=5, read=60, write=120, pool=5),
+    f"GET {APIRoutes.COURSES}": TimeoutPolicySchema(connect=5, read=30, write=5, pool=5),
+    f"GET {APIRoutes.EXERCISES}": TimeoutPolicySchema(connect=5, read=30, write=5, pool=5),
+}
+
+
+# Расширение запроса: момент истечения срока теста по time.monotonic(). Его учитывают слои, которые ждут
+# внутри транспорта (объединение запросов, внедрённые задержки)
+DEADLINE_EXTENSION: str = "deadline"
+# Фазы httpcore, перед началом которых срок проверяется заново, а таймауты урезаются до оставшегося времени.
+# httpcore 1.0 читает таймаут connect до события connect_tcp.started, поэтому урезание здесь действует
+# только на write и read; pool и connect урезаются раньше, по отметке transport.started (DeadlineTrace.mark).
+# Закрытие ответа (response_closed) не прерывается: оно освобождает соединение после ошибки
+DEADLINE_PHASES: frozenset[str] = frozenset({
+    "connect_tcp", "start_tls", "send_request_headers", "send_request_body",
+    "receive_response_headers", "receive_response_body"
+})
+
+
+def get_route_timeout(method: str, route: str) -> TimeoutPolicySchema | None:
+    return ROUTE_TIMEOUTS.get(f"{method} {route}") or ROUTE_TIMEOUTS.get(route)
+
+
+class TestDeadline:
+    """
+    Общий срок на все запросы текущего теста (по time.monotonic()).
+
+    Каждый запрос получает таймауты не больше оставшегося времени, а после истечения срока
+    запросы не отправляются вовсе.
+    """
+    __test__ = False
+
+    def __init__(self):
+        self.expires_at: float | None = None
+        self.seconds: float | None = None
+
+    def start(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def clear(self):
+        self.seconds = None
+        self.expires_at = None
+
+    def remaining(self) -> float | None:
+        return None if self.expires_at is None else self.expires_at - time.monotonic()
+
+
+test_deadline = TestDeadline()
+
+
+class DeadlineExceededError(TimeoutException):
+    """
+    Срок теста истёк до отправки запроса или во время его выполнения.
+    """
+
+
+def get_remaining(request: Request) -> float | None:
+    """
+    Время до истечения срока теста для запроса, прошедшего через TimeoutTransport. None — срока нет.
+    """
+    expires_at = request.extensions.get(DEADLINE_EXTENSION)
+    return None if expires_at is None else expires_at - time.monotonic()
+
+
+def check_deadline(request: Request, stage: str):
+    """
+    Бросает DeadlineExceededError, если срок теста истёк.
+
+    :param request: Запрос, прошедший через TimeoutTransport.
+    :param stage: Что не успело выполниться, для сообщения об ошибке.
+    """
+    if (remaining := get_remaining(request)) is not None and remaining <= 0:
+        raise DeadlineExceededError(f"срок теста истёк до {stage}", request=request)
+
+
+class DeadlineTrace:
+    """
+    trace-расширение httpcore, которое перед каждой фазой соединения проверяет срок теста и урезает
+    таймауты запроса до оставшегося времени. События передаются исходному трассировщику запроса.
+
+    httpcore берёт таймауты pool и connect в локальные переменные до первого события trace, поэтому их
+    урезает отметка transport.started: TracedTransport ставит её непосредственно перед передачей запроса
+    в пул. Соединение, которое открывается после ожидания пула, может пережить срок на время этого ожидания.
+    Таймауты write и read урезаются перед каждой фазой отправки и получения.
+    """
+
+    def __init__(self, request: Request, tracer: Callable[[str, dict[str, Any]], Any] | None):
+        self.request = request
+        self.tracer = tracer
+
+    def __call__(self, event_name: str, info: dict[str, Any]):
+        if self.tracer is not None:
+            self.tracer(event_name, info)
+
+        # "http11.send_request_headers.started" -> "send_request_headers"
+        phase, _, stage = event_name.partition(".")[2].rpartition(".")
+        if stage != "started" or phase not in DEADLINE_PHASES:
+            return
+
+        # httpcore читает таймауты write и read из словаря extensions["timeout"] после события started
+        self._trim(phase)
+
+    def mark(self, name: str):
+        if isinstance(self.tracer, RequestTracer):
+            self.tracer.mark(name)
+
+        # Последний момент перед пулом, когда ещё можно урезать таймауты pool и connect
+        self._trim(name)
+
+    def _trim(self, stage: str):
+        if (remaining := get_remaining(self.request)) <= 0:
+            raise DeadlineExceededError(f"срок теста истёк до {stage}", request=self.request)
+
+        timeouts = self.request.extensions["timeout"]
+        for name, value in timeouts.items():
+            timeouts[name] = remaining if value is None else min(value, remaining)
+
+
+class TimeoutStream(SyncByteStream):
+    """
+    Тело ответа, при чтении которого таймаут получает ту же разбивку, что и таймаут до заголовков,
+    а срок теста проверяется после каждого фрагмента.
+    """
+
+    def __init__(self, stream: SyncByteStream, request: Request, describe: Callable[[TimeoutException], TimeoutException]):
+        self._stream = stream
+        self._request = request
+        self._describe = describe
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            for chunk in self._stream:
+                yield chunk
+                check_deadline(self._request, "конца чтения тела ответа")
+        except TimeoutException as error:
+            raise self._describe(error) from error
+
+    def close(self):
+        self._stream.close()
+
+
+def render_partial_timings(tracer: object) -> str:
+    """
+    Фазы, которые запрос успел пройти до таймаута: событие httpcore -> время от начала запроса.
+    """
+    if not isinstance(tracer, RequestTracer) or not tracer.events:
+        return "запрос не дошёл до сети"
+
+    return ", ".join(
+        f"{name}=+{(moment - tracer.started_at) * 1000:.1f}ms"
+        for name, moment in sorted(tracer.events.items(), key=lambda item: item[1])
+    )
+
+
+class TimeoutTransport(BaseTransport):
+    """
+    Транспорт httpx, который выставляет таймауты запроса по политике его маршрута и сроку теста.
+
+    Таймауты каждой фазы (connect, read, write, pool) берутся из ROUTE_TIMEOUTS, незаданные —
+    из default_timeout, и ограничиваются оставшимся временем test_deadline. Срок теста — ограничение
+    по часам: он проверяется заново при передаче запроса в пул и перед каждой фазой соединения
+    (DeadlineTrace), после каждого фрагмента тела (TimeoutStream), а момент его истечения передаётся
+    внутренним слоям в extensions[DEADLINE_EXTENSION]. Отдельное чтение из сокета всё равно может ждать
+    до read-таймаута, урезанного в начале фазы, а установка соединения после ожидания пула — до
+    connect-таймаута, урезанного при входе в пул.
+
+    При таймауте, в том числе во время чтения тела, исключение того же типа (ConnectTimeout, ReadTimeout, ...)
+    дополняется маршрутом, применёнными лимитами и разбивкой по фазам, которые запрос успел пройти.
+    """
+
+    def __init__(self, transport: BaseTransport, default_timeout: float):
+        self.transport = transport
+        self.default_timeout = default_timeout
+
+    def get_timeouts(self, request: Request) -> dict[str, float]:
+        policy = get_route_timeout(request.method, get_route_template(request.url.path)) or TimeoutPolicySchema()
+        timeouts = {
+            phase: value if value is not None else self.default_timeout
+            for phase, value in policy.model_dump().items()
+        }
+
+        if (remaining := test_deadline.remaining()) is not None:
+            if remaining <= 0:
+                raise DeadlineExceededError(
+                    f"{request.method} {request.url.path}: срок теста {test_deadline.seconds:g}s истёк, "
+                    f"запрос не отправлен",
+                    request=request
+                )
+
+            timeouts = {phase: min(value, remaining) for phase, value in timeouts.items()}
+
+        return timeouts
+
+    def handle_request(self, request: Request) -> Response:
+        timeouts = self.get_timeouts(request)
+        # Лимиты для сообщения фиксируются до того, как DeadlineTrace урежет их по ходу запроса
+        limits = ", ".join(f"{phase}={value:.1f}s" for phase, value in timeouts.items())
+        tracer = request.extensions.get("trace")
+
+        extensions = {**request.extensions, "timeout": timeouts}
+        if test_deadline.expires_at is not None:
+            extensions[DEADLINE_EXTENSION] = test_deadline.expires_at
+            extensions["trace"] = DeadlineTrace(request, tracer)
+        request.extensions = extensions
+
+        started_at = time.perf_counter()
+
+        def describe(error: TimeoutException) -> TimeoutException:
+            elapsed = (time.perf_counter() - started_at) * 1000
+            deadline = f", срок теста {test_deadline.seconds:g}s" if test_deadline.seconds is not None else ""
+
+            return type(error)(
+                f"{type(error).__name__} {request.method} {get_route_template(request.url.path)} "
+                f"через {elapsed:.1f}ms (лимиты: {limits}{deadline}); "
+                f"фазы: {render_partial_timings(tracer)}; ошибка: {error}",
+                request=request
+            )
+
+        try:
+            response = self.transport.handle_request(request)
+        except TimeoutException as error:
+            raise describe(error) from error
+
+        response.stream = TimeoutStream(response.stream, request, describe)
+        return response
+
+    def close(self):
+        self.transport.close()
@@ -0,0 +1,177 @@
+import threading
+import time
+from typing import Any
+
+from httpx import BaseTransport, Request, Response
+from pydantic import BaseModel
+
+from tools.load.histogram import HdrHistogram
+from tools.routes import get_route_template
+
+# Фазы запроса в порядке их следования
+TIMING_PHASES: tuple[str, ...] = ("client", "pool_wait", "connect", "tls", "send", "ttfb", "body_read", "total")
+# Точность гистограмм сводки: 2 значащие цифры (ошибка процентиля не больше 1%) при ~26 КБ на фазу маршрута
+SUMMARY_SIGNIFICANT_DIGITS: int = 2
+
+
+class RequestTimingsSchema(BaseModel):
+    """
+    Разбивка времени одного HTTP-запроса по фазам, в миллисекундах.
+
+    connect включает разрешение DNS: httpcore не выделяет его в отдельное событие.
+    client — время от вызова клиента до передачи запроса в пул httpcore: сборка запроса, event hooks
+    и верхние слои транспорта (кеш, балансировщик, ожидание объединённого запроса). У ответов из кеша
+    и объединённых запросов всё время приходится на client.
+    pool_wait — ожидание свободного соединения в пуле httpcore.
+    """
+    method: str
+    route: str
+    status_code: int
+    client: float = 0.0
+    pool_wait: float = 0.0
+    connect: float = 0.0
+    tls: float = 0.0
+    send: float = 0.0
+    ttfb: float = 0.0
+    body_read: float = 0.0
+    total: float = 0.0
+    reused_connection: bool = True
+
+    def render(self) -> str:
+        phases = ", ".join(f"{phase}={getattr(self, phase):.1f}ms" for phase in TIMING_PHASES)
+        return f"{self.method} {self.route} -> {self.status_code}: {phases}"
+
+
+class RequestTracer:
+    """
+    Обработчик trace-расширения httpcore: запоминает момент каждого события соединения.
+
+    Передаётся в запрос через extensions={"trace": tracer}.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.events: dict[str, float] = {}
+
+    def __call__(self, event_name: str, info: dict[str, Any]):
+        # "http11.send_request_headers.started" -> "send_request_headers.started"
+        _, _, name = event_name.partition(".")
+        self.events.setdefault(name, time.perf_counter())
+
+    def mark(self, name: str):
+        """
+        Отмечает событие слоя транспорта httpx, которого нет среди событий httpcore.
+        """
+        self.events.setdefault(name, time.perf_counter())
+
+    def _span(self, start: str, end: str) -> float:
+        if start in self.events and end in self.events:
+            return (self.events[end] - self.events[start]) * 1000
+
+        return 0.0
+
+    def build(self, response: Response) -> RequestTimingsSchema:
+        """
+        Собирает разбивку по фазам после получения ответа.
+
+        :param response: Ответ, полученный с этим трассировщиком.
+        :return: Объект RequestTimingsSchema.
+        """
+        finished_at = self.events.get("receive_response_body.complete", time.perf_counter())
+        first_event = min(
+            self.events.get("connect_tcp.started", finished_at),
+            self.events.get("send_request_headers.started", finished_at),
+        )
+        # Без отметки TracedTransport (транспорт собран не через build_http_transport) ожидание пула не отделить
+        transport_started = self.events.get("transport.started", first_event)
+
+        return RequestTimingsSchema(
+            method=response.request.method,
+            route=get_route_template(response.request.url.path),
+            status_code=response.status_code,
+            client=(transport_started - self.started_at) * 1000,
+            pool_wait=(first_event - transport_started) * 1000,
+            connect=self._span("connect_tcp.started", "connect_tcp.complete"),
+            tls=self._span("start_tls.started", "start_tls.complete"),
+            send=self._span("send_request_headers.started", "send_request_body.complete"),
+            ttfb=self._span("send_request_body.complete", "receive_response_headers.complete"),
+            body_read=self._span("receive_response_body.started", "receive_response_body.complete"),
+            total=(finished_at - self.started_at) * 1000,
+            reused_connection="connect_tcp.started" not in self.events,
+        )
+
+
+class TracedTransport(BaseTransport):
+    """
+    Самый внутренний слой транспорта: отмечает в RequestTracer запроса момент передачи запроса в пул httpcore.
+
+    Всё, что было до этой отметки, относится к клиенту, а от неё до первого события соединения — к ожиданию пула.
+    """
+
+    def __init__(self, transport: BaseTransport):
+        self.transport = transport
+
+    def handle_request(self, request: Request) -> Response:
+        # RequestTracer или обёртка над ним (DeadlineTrace из tools.http.timeouts)
+        if (mark := getattr(request.extensions.get("trace"), "mark", None)) is not None:
+            mark("transport.started")
+
+        return self.transport.handle_request(request)
+
+    def close(self):
+        self.transport.close()
+
+
+class RouteTimings:
+    """
+    Агрегаты одного маршрута: число запросов, новых соединений и гистограмма каждой фазы (в микросекундах).
+    """
+    __slots__ = ("count", "new_connections", "phases")
+
+    def __init__(self):
+        self.count = 0
+        self.new_connections = 0
+        self.phases = {phase: HdrHistogram(significant_digits=SUMMARY_SIGNIFICANT_DIGITS) for phase in TIMING_PHASES}
+
+
+class TimingsCollector:
+    """
+    Собирает разбивки запросов за сессию и строит сводку по маршрутам.
+
+    Сами разбивки не хранятся: каждая фаза маршрута копится в гистограмме, поэтому память
+    не растёт с числом запросов (soak- и нагрузочные прогоны делают их сотни тысяч).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: dict[tuple[str, str], RouteTimings] = {}
+
+    def add(self, timings: RequestTimingsSchema):
+        with self._lock:
+            if (route := self._routes.get((timings.method, timings.route))) is None:
+                route = self._routes[(timings.method, timings.route)] = RouteTimings()
+
+            route.count += 1
+            route.new_connections += not timings.reused_connection
+            for phase, histogram in route.phases.items():
+                histogram.record(round(getattr(timings, phase) * 1000))
+
+    def summary(self) -> str:
+        """
+        Возвращает сводку по маршрутам: число запросов, доля новых соединений,
+        медиана и p95 каждой фазы.
+        """
+        lines = []
+        with self._lock:
+            for (method, route), timings in sorted(self._routes.items()):
+                lines.append(f"{method} {route}: {timings.count} запросов, новых соединений: {timings.new_connections}")
+
+                for phase, histogram in timings.phases.items():
+                    median = histogram.value_at_percentile(50) / 1000
+                    p95 = histogram.value_at_percentile(95) / 1000
+                    lines.append(f"  {phase:<10} median={median:8.1f}ms  p95={p95:8.1f}ms")
+
+        return "\n".join(lines)
+
+
+timings_collector = TimingsCollector()
@@ -0,0 +1,97 @@
+import hashlib
+import io
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from pydantic import BaseModel, computed_field
+
+# Размер куска при чтении файлов с диска: память процесса не зависит от размера файла
+DEFAULT_CHUNK_SIZE: int = 1024 * 1024
+
+
+class TransferStatsSchema(BaseModel):
+    """
+    Итоги передачи файла: размер, контрольная сумма и скорость.
+    """
+    size: int
+    sha256: str
+    elapsed: float = 0.0
+
+    @computed_field
+    @property
+    def throughput(self) -> float:
+        """Скорость передачи в МБ/с."""
+        return self.size / (1024 * 1024) / self.elapsed if self.elapsed else 0.0
+
+    def render(self) -> str:
+        return f"{self.size} байт за {self.elapsed:.3f}s ({self.throughput:.2f} MB/s), sha256={self.sha256}"
+
+
+class TransferMeter:
+    """
+    Считает размер и SHA-256 данных по мере их прохождения, не накапливая сами данные.
+    """
+
+    def __init__(self):
+        self.size = 0
+        self._digest = hashlib.sha256()
+        self._started_at: float | None = None
+        self._finished_at: float | None = None
+
+    def update(self, chunk: bytes):
+        if self._started_at is None:
+            self._started_at = time.perf_counter()
+
+        self.size += len(chunk)
+        self._digest.update(chunk)
+        self._finished_at = time.perf_counter()
+
+    def stats(self) -> TransferStatsSchema:
+        elapsed = (self._finished_at - self._started_at) if self._started_at is not None else 0.0
+        return TransferStatsSchema(size=self.size, sha256=self._digest.hexdigest(), elapsed=elapsed)
+
+
+class ChunkReader(io.RawIOBase):
+    """
+    Файлоподобная обёртка над итератором байтовых кусков.
+
+    httpx читает файлы multipart-запроса порциями, поэтому загрузка из генератора
+    идёт потоково (Transfer-Encoding: chunked), а размер и SHA-256 считаются на лету.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        super().__init__()
+        self.meter = TransferMeter()
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+
+            self.meter.update(chunk)
+            self._pending = memoryview(chunk)
+
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def iter_file_chunks(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Читает файл с диска кусками фиксированного размера.
+
+    :param path: Путь к файлу.
+    :param chunk_size: Размер куска в байтах.
+    :return: Итератор по кускам файла.
+    """
+    with path.open("rb") as file:
+        while chunk := file.read(chunk_size):
+            yield chunk
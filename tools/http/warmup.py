@@ -0,0 +1,328 @@
+import socket
+import ssl
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+
+import httpcore
+import httpx
+from httpx import BaseTransport, Limits, Proxy, Request, Response, SyncByteStream, Timeout, URL, TransportError
+from httpx._types import CertTypes, ProxyTypes
+from pydantic import BaseModel
+
+from tools.http.timings import RequestTracer
+
+# Исключения httpcore и одноимённые исключения httpx, которые получает вызывающий код
+HTTPCORE_EXCEPTIONS: tuple[str, ...] = (
+    "TimeoutException", "ConnectTimeout", "ReadTimeout", "WriteTimeout", "PoolTimeout",
+    "NetworkError", "ConnectError", "ReadError", "WriteError",
+    "ProtocolError", "RemoteProtocolError", "LocalProtocolError", "ProxyError", "UnsupportedProtocol",
+)
+
+
+@contextmanager
+def map_httpcore_exceptions() -> Iterator[None]:
+    """
+    Превращает исключение httpcore в самое точное одноимённое исключение httpx.
+    """
+    try:
+        yield
+    except Exception as error:
+        matches = [name for name in HTTPCORE_EXCEPTIONS if isinstance(error, getattr(httpcore, name))]
+        if not matches:
+            raise
+
+        mapped = min((getattr(httpx, name) for name in matches), key=lambda exception: -len(exception.__mro__))
+        raise mapped(str(error)) from error
+
+
+class CachingResolverBackend(httpcore.SyncBackend):
+    """
+    Сетевой бэкенд httpcore, который кеширует адреса хоста на ttl секунд и подключается по адресу из кеша.
+
+    Если подключиться к адресу не удалось, пробуются остальные адреса из ответа DNS; удачный адрес
+    становится первым. Если не удалось подключиться ни к одному, запись кеша сбрасывается и следующее
+    соединение снова разрешает имя: долгий прогон переживает смену адреса стенда.
+
+    Имя хоста для SNI и проверки сертификата httpcore берёт из origin запроса, а не из connect_tcp,
+    поэтому подключение по IP не ломает TLS.
+    """
+
+    def __init__(self, ttl: float = 60.0):
+        """
+        :param ttl: Сколько секунд адреса хоста берутся из кеша.
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # (хост, порт) -> адреса в порядке попыток и момент устаревания по time.monotonic()
+        self._addresses: dict[tuple[str, int], tuple[list[str], float]] = {}
+
+    def resolve_all(self, host: str, port: int) -> tuple[list[str], float]:
+        """
+        Разрешает имя хоста во все адреса (из кеша, если запись ещё не устарела).
+
+        :return: Адреса и время разрешения в миллисекундах (0 для попадания в кеш).
+        """
+        with self._lock:
+            entry = self._addresses.get((host, port))
+            if entry is not None and entry[1] > time.monotonic():
+                return list(entry[0]), 0.0
+
+        started_at = time.perf_counter()
+        addresses = list(dict.fromkeys(
+            info[4][0] for info in socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        ))
+        elapsed = (time.perf_counter() - started_at) * 1000
+
+        with self._lock:
+            self._addresses[(host, port)] = (addresses, time.monotonic() + self.ttl)
+
+        return addresses, elapsed
+
+    def resolve(self, host: str, port: int) -> tuple[str, float]:
+        """
+        Разрешает имя хоста в адрес, по которому будет первая попытка подключения.
+
+        :return: Адрес и время разрешения в миллисекундах (0 для попадания в кеш).
+        """
+        addresses, elapsed = self.resolve_all(host, port)
+        return addresses[0], elapsed
+
+    def _promote(self, key: tuple[str, int], address: str):
+        with self._lock:
+            if (entry := self._addresses.get(key)) is not None and entry[0][0] != address:
+                addresses, expires_at = entry
+                self._addresses[key] = ([address, *(item for item in addresses if item != address)], expires_at)
+
+    def _invalidate(self, key: tuple[str, int]):
+        with self._lock:
+            self._addresses.pop(key, None)
+
+    def connect_tcp(
+            self,
+            host: str,
+            port: int,
+            timeout: float | None = None,
+            local_address: str | None = None,
+            socket_options: Iterable | None = None
+    ) -> httpcore.NetworkStream:
+        addresses, _ = self.resolve_all(host, port)
+        error: Exception | None = None
+
+        for address in addresses:
+            try:
+                stream = super().connect_tcp(address, port, timeout, local_address, socket_options)
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as exception:
+                error = exception
+                continue
+
+            self._promote((host, port), address)
+            return stream
+
+        self._invalidate((host, port))
+        raise error
+
+
+class PoolResponseStream(SyncByteStream):
+    """
+    Тело ответа из пула httpcore с исключениями httpx.
+    """
+
+    def __init__(self, stream: Iterable[bytes]):
+        self._stream = stream
+
+    def __iter__(self) -> Iterator[bytes]:
+        with map_httpcore_exceptions():
+            yield from self._stream
+
+    def close(self):
+        if hasattr(self._stream, "close"):
+            self._stream.close()
+
+
+class SharedTransport(BaseTransport):
+    """
+    Общий для всех клиентов пул соединений httpcore с кешем DNS (CachingResolverBackend).
+
+    Пул строится явно с сетевым бэкендом и лимитами из настроек; TLS (verify, cert, trust_env) и прокси
+    настраиваются теми же параметрами и с теми же значениями по умолчанию, что у httpx.HTTPTransport,
+    поэтому включение прогрева не меняет проверку сертификатов и маршрут до API. Запросы и ответы httpx
+    переводятся в httpcore и обратно так же, как в httpx.HTTPTransport.
+
+    httpx.Client закрывает свой транспорт при закрытии клиента; общий пул при этом остаётся открытым
+    и закрывается один раз в конце сессии через shutdown().
+    """
+
+    def __init__(
+            self,
+            limits: Limits | None = None,
+            dns_ttl: float = 60.0,
+            verify: ssl.SSLContext | str | bool = True,
+            cert: CertTypes | None = None,
+            trust_env: bool = True,
+            proxy: ProxyTypes | None = None
+    ):
+        """
+        :param limits: Лимиты пула; по умолчанию как у httpx (100 соединений, из них 20 keep-alive).
+        :param dns_ttl: Сколько секунд адреса хоста берутся из кеша.
+        :param verify: Проверка сертификатов, как в httpx.HTTPTransport.
+        :param cert: Клиентский сертификат, как в httpx.HTTPTransport.
+        :param trust_env: Брать ли SSL_CERT_FILE/SSL_CERT_DIR из окружения, как в httpx.HTTPTransport.
+        :param proxy: HTTP(S)-прокси, как в httpx.HTTPTransport.
+        """
+        limits = limits or Limits(max_connections=100, max_keepalive_connections=20)
+        ssl_context = httpx.create_ssl_context(verify=verify, cert=cert, trust_env=trust_env)
+        proxy = Proxy(url=proxy) if isinstance(proxy, (str, URL)) else proxy
+        self.resolver = CachingResolverBackend(ttl=dns_ttl)
+
+        options = dict(
+            ssl_context=ssl_context,
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            network_backend=self.resolver
+        )
+        if proxy is None:
+            self.pool = httpcore.ConnectionPool(**options)
+        elif proxy.url.scheme in ("http", "https"):
+            self.pool = httpcore.HTTPProxy(
+                proxy_url=httpcore.URL(
+                    scheme=proxy.url.raw_scheme,
+                    host=proxy.url.raw_host,
+                    port=proxy.url.port,
+                    target=proxy.url.raw_path
+                ),
+                proxy_auth=proxy.raw_auth,
+                proxy_headers=proxy.headers.raw,
+                proxy_ssl_context=proxy.ssl_context,
+                **options
+            )
+        else:
+            raise ValueError(f"Общий пул поддерживает только HTTP(S)-прокси, а не {proxy.url.scheme!r}")
+
+    def handle_request(self, request: Request) -> Response:
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions
+        )
+        with map_httpcore_exceptions():
+            core_response = self.pool.handle_request(core_request)
+
+        return Response(
+            status_code=core_response.status,
+            headers=core_response.headers,
+            stream=PoolResponseStream(core_response.stream),
+            extensions=core_response.extensions
+        )
+
+    def close(self):
+        pass
+
+    def shutdown(self):
+        self.pool.close()
+
+
+class ConnectionSetupSchema(BaseModel):
+    """
+    Установка одного соединения при прогреве, в миллисекундах.
+    """
+    connect: float
+    tls: float
+    status_code: int | None = None
+    error: str | None = None
+
+
+class WarmupReportSchema(BaseModel):
+    """
+    Итог прогрева: время DNS и установка соединений. Эти задержки не попадают в замеры запросов тестов.
+    """
+    url: str
+    dns: float
+    connections: list[ConnectionSetupSchema]
+    total: float
+
+    def render(self) -> str:
+        lines = [f"{self.url}: DNS {self.dns:.1f}ms, соединений открыто: {len(self.connections)}, всего {self.total:.1f}ms"]
+        for index, connection in enumerate(self.connections):
+            result = connection.error or f"HTTP {connection.status_code}"
+            lines.append(f"  #{index}: connect={connection.connect:.1f}ms, tls={connection.tls:.1f}ms ({result})")
+
+        return "\n".join(lines)
+
+
+def get_span(tracer: RequestTracer, event: str) -> float:
+    started, completed = tracer.events.get(f"{event}.started"), tracer.events.get(f"{event}.complete")
+    return (completed - started) * 1000 if started and completed else 0.0
+
+
+def warm_up(
+        transport: SharedTransport,
+        url: str,
+        connections: int,
+        path: str = "/",
+        timeout: float = 10.0
+) -> WarmupReportSchema:
+    """
+    Разрешает хост и открывает connections keep-alive соединений в общем пуле.
+
+    Соединения открываются одновременными HEAD-запросами на path: пока запросы в полёте,
+    пул не может переиспользовать соединение и открывает новые.
+
+    :param transport: Общий транспорт.
+    :param url: Базовый адрес API.
+    :param connections: Сколько соединений открыть (0 — только разрешить DNS).
+    :param path: Дешёвый путь для HEAD-запросов.
+    :param timeout: Таймаут каждой фазы запроса в секундах.
+    :return: Отчёт о прогреве.
+    """
+    started_at = time.perf_counter()
+    base_url = URL(url)
+    _, dns = transport.resolver.resolve(base_url.host, base_url.port or (443 if base_url.scheme == "https" else 80))
+
+    results: list[ConnectionSetupSchema | None] = [None] * connections
+    barrier = threading.Barrier(connections) if connections else None
+
+    def open_connection(index: int):
+        tracer = RequestTracer()
+        request = Request(
+            "HEAD",
+            base_url.join(path),
+            extensions={"trace": tracer, "timeout": Timeout(timeout).as_dict()}
+        )
+        barrier.wait()
+        try:
+            response = transport.handle_request(request)
+            response.read()
+            response.close()
+            status_code, error = response.status_code, None
+        except TransportError as exception:
+            status_code, error = None, f"{type(exception).__name__}: {exception}"
+
+        results[index] = ConnectionSetupSchema(
+            connect=get_span(tracer, "connect_tcp"),
+            tls=get_span(tracer, "start_tls"),
+            status_code=status_code,
+            error=error
+        )
+
+    threads = [threading.Thread(target=open_connection, args=(index,), daemon=True) for index in range(connections)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return WarmupReportSchema(
+        url=url,
+        dns=dns,
+        connections=[result for result in results if result is not None],
+        total=(time.perf_counter() - started_at) * 1000
+    )
@@ -0,0 +1,260 @@
+import logging
+import math
+import multiprocessing
+import time
+import traceback
+from multiprocessing.connection import Connection, wait
+
+from pydantic import BaseModel
+
+from tools.load.scheduler import LoadReport, OpenModelScheduler, Operation
+from tools.logger import get_logger
+from tools.soak import parse_duration
+
+logger = get_logger("LOAD_COORDINATOR")
+
+# Сколько ждать подготовки агентов (создание пользователей, логин, сид сценария)
+AGENT_READY_TIMEOUT: float = 120.0
+# Запас времени на завершение последних запросов после окончания расписания
+AGENT_FINISH_TIMEOUT: float = 60.0
+
+
+class LoadStageSchema(BaseModel):
+    """
+    Этап нагрузки: длительность в секундах и суммарная частота вызовов в секунду.
+    """
+    duration: float
+    rate: float
+
+
+class AgentConfigSchema(BaseModel):
+    """
+    Задание агенту: сценарий, его доля частоты на каждом этапе и число потоков.
+    """
+    name: str
+    scenario: str
+    stages: list[LoadStageSchema]
+    workers: int
+
+
+def parse_stages(value: str) -> list[LoadStageSchema]:
+    """
+    Разбирает этапы вида "30s:50,2m:200,30s:50" (длительность:частота).
+
+    :raises ValueError: Если этап не соответствует формату.
+    """
+    stages = []
+    for part in filter(None, (item.strip() for item in value.split(","))):
+        duration, _, rate = part.partition(":")
+        try:
+            stages.append(LoadStageSchema(duration=parse_duration(duration), rate=float(rate)))
+        except ValueError:
+            raise ValueError(f"Неверный этап нагрузки: '{part}'. Ожидается формат длительность:частота, например 2m:200")
+
+    if not stages:
+        raise ValueError("Не задано ни одного этапа нагрузки")
+
+    return stages
+
+
+def run_stages(
+        operations: dict[str, tuple[Operation, int]],
+        stages: list[LoadStageSchema],
+        workers: int,
+        worker_prefix: str = "worker",
+        start_at: float | None = None
+) -> list[LoadReport]:
+    """
+    Выполняет этапы в текущем процессе. Каждый этап начинается по расписанию от start_at,
+    а не после завершения предыдущего, поэтому этапы разных агентов совпадают по времени.
+
+    :return: Отчёты этапов.
+    """
+    start_at = start_at or time.time()
+    reports = []
+    for stage in stages:
+        scheduler = OpenModelScheduler(
+            operations,
+            rate=stage.rate,
+            duration=stage.duration,
+            workers=workers,
+            worker_prefix=worker_prefix
+        )
+        reports.append(scheduler.run(start_at=start_at))
+        start_at += stage.duration
+
+    return reports
+
+
+def use_lean_requests():
+    """
+    Переключает клиентов текущего процесса на лёгкий путь запроса: без логов каждого запроса, шагов и вложений
+    Allure, cURL, разбивки по фазам и проверки SLO. Задержки нагрузки считаются в гистограммах планировщика,
+    а эти накладные расходы ограничивали бы частоту одного процесса и копили бы память за весь прогон.
+    """
+    from clients.api_client import APIClient
+    from tools.allure.reporting import ReportingMode, reporter
+
+    logging.getLogger("HTTP_LOGGER").setLevel(logging.WARNING)
+    reporter.configure(ReportingMode.OFF)
+    APIClient.instrumented = False
+
+
+def run_agent(connection: Connection, config: dict):
+    """
+    Точка входа процесса-агента.
+
+    Агент собирает собственный стек клиентов (пул соединений, токены, транспорты), сообщает о готовности,
+    получает общий момент старта и выполняет этапы по расписанию, отсчитанному от него. Отчёты этапов
+    отправляются координатору одним сообщением.
+    """
+    # Импорт сценариев (и всего стека клиентов) выполняется уже в процессе агента
+    from tools.load.scenarios import SCENARIOS
+
+    use_lean_requests()
+
+    try:
+        config = AgentConfigSchema.model_validate(config)
+        operations = SCENARIOS[config.scenario]()
+        connection.send(("ready", None))
+
+        command, start_at = connection.recv()
+        if command != "start":
+            return
+
+        reports = run_stages(operations, config.stages, config.workers, config.name, start_at)
+        connection.send(("report", [report.to_dict() for report in reports]))
+    except Exception:
+        connection.send(("error", traceback.format_exc()))
+    finally:
+        connection.close()
+
+
+class LoadCoordinator:
+    """
+    Запускает нагрузку в нескольких процессах-агентах на одной машине.
+
+    Один процесс упирается в GIL и накладные расходы APIClient, Pydantic и event hooks, поэтому частота
+    и потоки делятся поровну между agents процессами. Агенты запускаются через spawn и не наследуют
+    клиентов и кешей координатора. Обмен идёт через Pipe: задание, готовность, общий момент старта
+    (этапы всех агентов отсчитываются от него), отчёты с гистограммами и ошибками.
+    """
+
+    def __init__(
+            self,
+            scenario: str,
+            stages: list[LoadStageSchema],
+            agents: int,
+            workers: int,
+            start_delay: float = 2.0
+    ):
+        """
+        :param scenario: Имя сценария из tools.load.scenarios.SCENARIOS.
+        :param stages: Этапы с суммарной частотой по всем агентам.
+        :param agents: Количество процессов-агентов.
+        :param workers: Суммарное количество потоков по всем агентам.
+        :param start_delay: Через сколько секунд после готовности всех агентов начинается нагрузка.
+        """
+        if agents <= 0:
+            raise ValueError("agents должно быть положительным")
+
+        self.scenario = scenario
+        self.stages = stages
+        self.agents = agents
+        self.workers = workers
+        self.start_delay = start_delay
+
+    def build_agent_config(self, index: int) -> AgentConfigSchema:
+        return AgentConfigSchema(
+            name=f"agent{index}",
+            scenario=self.scenario,
+            stages=[LoadStageSchema(duration=stage.duration, rate=stage.rate / self.agents) for stage in self.stages],
+            workers=max(1, math.ceil(self.workers / self.agents))
+        )
+
+    def run(self) -> list[LoadReport]:
+        """
+        Выполняет нагрузку.
+
+        :return: Отчёты этапов, объединённые по всем агентам.
+        :raises RuntimeError: Если агент упал или не ответил вовремя.
+        """
+        context = multiprocessing.get_context("spawn")
+        connections: list[Connection] = []
+        processes = []
+
+        for index in range(self.agents):
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=run_agent,
+                args=(child, self.build_agent_config(index).model_dump()),
+                name=f"load-agent{index}",
+                daemon=True
+            )
+            process.start()
+            child.close()
+            connections.append(parent)
+            processes.append(process)
+
+        try:
+            self._collect(connections, "ready", AGENT_READY_TIMEOUT)
+
+            start_at = time.time() + self.start_delay
+            logger.info(f"Агентов готово: {self.agents}, старт через {self.start_delay:g}s")
+            for connection in connections:
+                connection.send(("start", start_at))
+
+            total_duration = sum(stage.duration for stage in self.stages)
+            results = self._collect(connections, "report", self.start_delay + total_duration + AGENT_FINISH_TIMEOUT)
+        finally:
+            for connection in connections:
+                connection.close()
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+
+        stage_reports = [LoadReport() for _ in self.stages]
+        for reports in results:
+            for stage_report, report in zip(stage_reports, reports):
+                stage_report.merge(LoadReport.from_dict(report))
+
+        return stage_reports
+
+    def _collect(self, connections: list[Connection], expected: str, timeout: float) -> list:
+        """
+        Ждёт от каждого агента сообщение expected и возвращает их данные в порядке агентов.
+        """
+        deadline = time.monotonic() + timeout
+        pending = {connection: index for index, connection in enumerate(connections)}
+        results: list = [None] * len(connections)
+
+        while pending:
+            ready = wait(list(pending), timeout=max(0.0, deadline - time.monotonic()))
+            if not ready:
+                raise RuntimeError(f"Агенты {sorted(pending.values())} не прислали '{expected}' за {timeout:g}s")
+
+            for connection in ready:
+                index = pending.pop(connection)
+                try:
+                    message, payload = connection.recv()
+                except EOFError:
+                    raise RuntimeError(f"Агент {index} завершился, не прислав '{expected}'")
+
+                if message == "error":
+                    raise RuntimeError(f"Агент {index} упал:\n{payload}")
+
+                results[index] = payload
+
+        return results
+
+
+def combine_stages(stage_reports: list[LoadReport]) -> LoadReport:
+    """
+    Общий отчёт по всем этапам.
+    """
+    total = LoadReport()
+    for report in stage_reports:
+        total.merge(report, concurrent=False)
+
+    return total
@@ -0,0 +1,168 @@
+from array import array
+from typing import Any
+
+# Точность по умолчанию: 3 значащие цифры (относительная ошибка не больше 0.1%)
+DEFAULT_SIGNIFICANT_DIGITS: int = 3
+# Верхняя граница по умолчанию: 1 час в микросекундах
+DEFAULT_HIGHEST_VALUE: int = 3600 * 1_000_000
+
+REPORT_PERCENTILES: tuple[float, ...] = (50, 90, 99, 99.9, 99.99)
+
+
+class HdrHistogram:
+    """
+    Гистограмма задержек в духе HdrHistogram: лог-линейные корзины с фиксированной относительной точностью.
+
+    Значения (целые, в микросекундах) от 1 до highest_value хранятся с significant_digits значащими цифрами,
+    память постоянна и не зависит от числа замеров. Гистограммы с одинаковыми параметрами складываются
+    без потери точности (merge), поэтому процентили по нескольким потокам и процессам считаются честно,
+    а не усреднением процентилей.
+
+    Запись не потокобезопасна: у каждого потока своя гистограмма, которые объединяются в конце.
+    """
+
+    def __init__(
+            self,
+            highest_value: int = DEFAULT_HIGHEST_VALUE,
+            significant_digits: int = DEFAULT_SIGNIFICANT_DIGITS
+    ):
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits должно быть от 1 до 5")
+
+        self.highest_value = highest_value
+        self.significant_digits = significant_digits
+
+        # Столько линейных подкорзин нужно, чтобы различать значения с заданной точностью
+        largest_single_unit = 2 * 10 ** significant_digits
+        self._sub_bucket_magnitude = (largest_single_unit - 1).bit_length()
+        self._sub_bucket_half_magnitude = self._sub_bucket_magnitude - 1
+        self._sub_bucket_count = 1 << self._sub_bucket_magnitude
+        self._sub_bucket_half_count = self._sub_bucket_count >> 1
+        self._sub_bucket_mask = self._sub_bucket_count - 1
+
+        bucket_count = 1
+        smallest_untrackable = self._sub_bucket_count
+        while smallest_untrackable <= highest_value:
+            smallest_untrackable <<= 1
+            bucket_count += 1
+
+        self.counts = array("Q", bytes(8 * (bucket_count + 1) * self._sub_bucket_half_count))
+        self.total_count = 0
+        self.max_value = 0
+        self.min_value = 0
+        self.overflows = 0
+
+    def _get_index(self, value: int) -> int:
+        bucket_index = (value | self._sub_bucket_mask).bit_length() - self._sub_bucket_magnitude
+        sub_bucket_index = value >> bucket_index
+        return ((bucket_index + 1) << self._sub_bucket_half_magnitude) + sub_bucket_index - self._sub_bucket_half_count
+
+    def _get_value_range(self, index: int) -> tuple[int, int]:
+        """
+        Наименьшее и наибольшее значения, которые попадают в корзину index.
+        """
+        bucket_index = (index >> self._sub_bucket_half_magnitude) - 1
+        sub_bucket_index = (index & (self._sub_bucket_half_count - 1)) + self._sub_bucket_half_count
+        if bucket_index < 0:
+            sub_bucket_index -= self._sub_bucket_half_count
+            bucket_index = 0
+
+        lowest = sub_bucket_index << bucket_index
+        return lowest, lowest + (1 << bucket_index) - 1
+
+    def record(self, value: int, count: int = 1):
+        """
+        Записывает значение. Значения выше highest_value записываются как highest_value и считаются в overflows.
+
+        :param value: Значение в микросекундах.
+        :param count: Сколько раз записать значение.
+        """
+        value = max(0, int(value))
+        if value > self.highest_value:
+            self.overflows += count
+            value = self.highest_value
+
+        self.counts[self._get_index(value)] += count
+
+        if self.total_count == 0 or value < self.min_value:
+            self.min_value = value
+        self.max_value = max(self.max_value, value)
+        self.total_count += count
+
+    def merge(self, other: "HdrHistogram"):
+        """
+        Добавляет замеры другой гистограммы с теми же highest_value и significant_digits.
+        """
+        if (other.highest_value, other.significant_digits) != (self.highest_value, self.significant_digits):
+            raise ValueError("Складывать можно только гистограммы с одинаковыми параметрами")
+
+        if other.total_count == 0:
+            return
+
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+
+        self.min_value = other.min_value if self.total_count == 0 else min(self.min_value, other.min_value)
+        self.max_value = max(self.max_value, other.max_value)
+        self.total_count += other.total_count
+        self.overflows += other.overflows
+
+    def value_at_percentile(self, percentile: float) -> int:
+        """
+        Значение, не меньше которого percentile процентов замеров (верхняя граница корзины, но не больше max).
+        """
+        if self.total_count == 0:
+            return 0
+
+        target = max(1, round(self.total_count * min(percentile, 100) / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._get_value_range(index)[1], self.max_value)
+
+        return self.max_value
+
+    def mean(self) -> float:
+        if self.total_count == 0:
+            return 0.0
+
+        total = sum(
+            (sum(self._get_value_range(index)) / 2) * count
+            for index, count in enumerate(self.counts) if count
+        )
+        return total / self.total_count
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Компактное представление для передачи между процессами: только непустые корзины.
+        """
+        return {
+            "highest_value": self.highest_value,
+            "significant_digits": self.significant_digits,
+            "counts": {str(index): count for index, count in enumerate(self.counts) if count},
+            "total_count": self.total_count,
+            "min_value": self.min_value,
+            "max_value": self.max_value,
+            "overflows": self.overflows
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "HdrHistogram":
+        histogram = cls(highest_value=data["highest_value"], significant_digits=data["significant_digits"])
+        for index, count in data["counts"].items():
+            histogram.counts[int(index)] = count
+
+        histogram.total_count = data["total_count"]
+        histogram.min_value = data["min_value"]
+        histogram.max_value = data["max_value"]
+        histogram.overflows = data["overflows"]
+        return histogram
+
+    def summary(self, percentiles: tuple[float, ...] = REPORT_PERCENTILES) -> str:
+        """
+        Процентили в миллисекундах одной строкой.
+        """
+        values = ", ".join(f"p{percentile:g}={self.value_at_percentile(percentile) / 1000:.1f}" for percentile in percentiles)
+        return f"{values}, max={self.max_value / 1000:.1f}ms"
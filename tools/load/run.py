@@ -0,0 +1,80 @@
+import argparse
+import json
+
+from config import settings
+from tools.load.coordinator import (
+    LoadCoordinator, LoadStageSchema, combine_stages, parse_stages, run_stages, use_lean_requests
+)
+from tools.load.scenarios import SCENARIOS
+from tools.soak import parse_duration
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.load.run",
+        description="Нагрузка по открытой модели с задержками, скорректированными на coordinated omission"
+    )
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="read", help="Сценарий нагрузки")
+    parser.add_argument("--rate", type=float, default=None, help="Запланированная частота вызовов в секунду")
+    parser.add_argument("--duration", type=parse_duration, default="60s", help="Длительность (например, 60s, 5m)")
+    parser.add_argument(
+        "--stages",
+        type=parse_stages,
+        default=None,
+        help="Этапы вместо --rate/--duration, например 30s:50,2m:200,30s:50 (длительность:частота)"
+    )
+    parser.add_argument("--workers", type=int, default=16, help="Суммарное количество потоков (по умолчанию 16)")
+    parser.add_argument(
+        "--agents",
+        type=int,
+        default=1,
+        help="Количество процессов-агентов; частота и потоки делятся между ними поровну (по умолчанию 1)"
+    )
+    parser.add_argument(
+        "--report",
+        default=None,
+        help="Куда сохранить отчёт с гистограммами (по умолчанию allure-results/load-report.json)"
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.stages is None and args.rate is None:
+        parser.error("укажите --rate или --stages")
+
+    stages = args.stages or [LoadStageSchema(duration=args.duration, rate=args.rate)]
+
+    if args.agents > 1:
+        coordinator = LoadCoordinator(args.scenario, stages, agents=args.agents, workers=args.workers)
+        stage_reports = coordinator.run()
+    else:
+        # Журнал, отчёт и тайминги каждого запроса под нагрузкой сами становятся нагрузкой на генератор
+        use_lean_requests()
+        stage_reports = run_stages(SCENARIOS[args.scenario](), stages, args.workers)
+
+    report = combine_stages(stage_reports)
+
+    report_path = args.report or settings.allure_results_dir / "load-report.json"
+    with open(report_path, "w") as file:
+        json.dump({
+            "total": report.to_dict(),
+            "stages": [
+                {**stage.model_dump(), "report": stage_report.to_dict()}
+                for stage, stage_report in zip(stages, stage_reports)
+            ]
+        }, file)
+
+    if len(stages) > 1:
+        for index, (stage, stage_report) in enumerate(zip(stages, stage_reports), start=1):
+            total = stage_report.total(stage_report.combined()).corrected
+            print(f"Этап {index} ({stage.duration:g}s, {stage.rate:g}/s): {total.total_count} запросов, {total.summary()}")
+
+    print(report.summary())
+    print(f"Отчёт сохранён в {report_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+from typing import Callable
+
+from clients.courses.courses_client import get_courses_client
+from clients.courses.courses_schema import CreateCourseRequestSchema, GetCoursesQuerySchema
+from clients.exercises.exercises_client import get_exercises_client
+from clients.files.files_client import get_files_client
+from clients.files.files_schema import CreateFileRequestSchema
+from clients.private_http_builder import AuthenticationUserSchema
+from clients.users.private_users_client import get_private_users_client
+from clients.users.public_users_client import get_public_users_client
+from clients.users.users_schema import CreateUserRequestSchema
+from config import settings
+from tools.load.scheduler import Operation
+from tools.load.templates import (
+    counter,
+    unique_emails,
+    get_create_user_template,
+    get_create_course_template,
+    get_create_exercise_template
+)
+
+# Сценарий: подготовка данных и операции нагрузки вида имя -> (вызов, вес)
+Scenario = Callable[[], dict[str, tuple[Operation, int]]]
+
+
+def create_load_user() -> tuple[AuthenticationUserSchema, str]:
+    """
+    Создаёт пользователя, от имени которого выполняется нагрузка.
+
+    :return: Данные для аутентификации и id пользователя.
+    """
+    request = CreateUserRequestSchema()
+    response = get_public_users_client().create_user(request)
+    return AuthenticationUserSchema(email=request.email, password=request.password), response.user.id
+
+
+def read_scenario() -> dict[str, tuple[Operation, int]]:
+    """
+    Чтение: профиль текущего пользователя и список его курсов.
+    """
+    user, user_id = create_load_user()
+    users_client = get_private_users_client(user)
+    courses_client = get_courses_client(user)
+    query = GetCoursesQuerySchema(user_id=user_id)
+
+    return {
+        "get_user_me": (users_client.get_user_me_api, 1),
+        "get_courses": (lambda: courses_client.get_courses_api(query), 1),
+    }
+
+
+def write_scenario() -> dict[str, tuple[Operation, int]]:
+    """
+    Запись: регистрация пользователей, создание курсов и заданий. Тела собираются из шаблонов.
+    """
+    user, user_id = create_load_user()
+    public_users_client = get_public_users_client()
+    courses_client = get_courses_client(user)
+    exercises_client = get_exercises_client(user)
+
+    file = get_files_client(user).create_file(CreateFileRequestSchema(upload_file=settings.test_data.image_png_file))
+    course = courses_client.create_course_record(
+        CreateCourseRequestSchema(preview_file_id=file.file.id, created_by_user_id=user_id)
+    )
+
+    user_template = get_create_user_template()
+    course_template = get_create_course_template(file.file.id, user_id)
+    exercise_template = get_create_exercise_template()
+    emails = unique_emails()
+    order_index = counter()
+
+    return {
+        "create_user": (lambda: public_users_client.create_user_api(user_template.render(email=next(emails))), 1),
+        "create_course": (lambda: courses_client.create_course_api(course_template.render(title="Load")), 1),
+        "create_exercise": (
+            lambda: exercises_client.create_exercise_api(
+                exercise_template.render(course_id=course.id, order_index=order_index(), title="Load")
+            ),
+            3
+        ),
+    }
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "read": read_scenario,
+    "write": write_scenario,
+}
@@ -0,0 +1,260 @@
+import itertools
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable
+
+from httpx import Response
+
+from tools.load.histogram import HdrHistogram
+from tools.logger import get_logger
+
+logger = get_logger("LOAD")
+
+# Операция нагрузки: один вызов доменного клиента
+Operation = Callable[[], Any]
+
+
+class LatencyHistograms:
+    """
+    Пара гистограмм одной операции.
+
+    corrected — задержка от запланированного момента старта до конца ответа (то, что видит пользователь
+    открытой модели, включая ожидание, пока генератор или сервер были заняты);
+    uncorrected — от фактической отправки до конца ответа (то, что измерил бы закрытый цикл).
+    """
+
+    def __init__(self):
+        self.corrected = HdrHistogram()
+        self.uncorrected = HdrHistogram()
+
+    def merge(self, other: "LatencyHistograms"):
+        self.corrected.merge(other.corrected)
+        self.uncorrected.merge(other.uncorrected)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"corrected": self.corrected.to_dict(), "uncorrected": self.uncorrected.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LatencyHistograms":
+        histograms = cls()
+        histograms.corrected = HdrHistogram.from_dict(data["corrected"])
+        histograms.uncorrected = HdrHistogram.from_dict(data["uncorrected"])
+        return histograms
+
+
+class LoadReport:
+    """
+    Результат нагрузки: гистограммы по операциям для каждого воркера и ошибки.
+
+    Воркер — поток планировщика. Отчёты разных процессов и этапов объединяются через merge():
+    гистограммы воркеров с одинаковыми именами складываются, поэтому имена воркеров разных процессов
+    должны различаться (например, префиксом агента).
+    """
+
+    def __init__(self):
+        self.workers: dict[str, dict[str, LatencyHistograms]] = {}
+        self.errors: Counter[str] = Counter()
+        self.max_schedule_lag: int = 0
+        self.duration: float = 0.0
+
+    def combined(self) -> dict[str, LatencyHistograms]:
+        """
+        Гистограммы по операциям, объединённые по всем воркерам.
+        """
+        combined: dict[str, LatencyHistograms] = {}
+        for operations in self.workers.values():
+            for name, histograms in operations.items():
+                combined.setdefault(name, LatencyHistograms()).merge(histograms)
+
+        return combined
+
+    def total(self, operations: dict[str, LatencyHistograms]) -> LatencyHistograms:
+        total = LatencyHistograms()
+        for histograms in operations.values():
+            total.merge(histograms)
+
+        return total
+
+    def merge(self, other: "LoadReport", concurrent: bool = True):
+        """
+        Добавляет замеры другого отчёта.
+
+        :param other: Отчёт другого процесса или этапа.
+        :param concurrent: Отчёты сняты одновременно (разные агенты) — длительность не суммируется;
+        False — последовательно (этапы одного прогона).
+        """
+        for worker, operations in other.workers.items():
+            merged = self.workers.setdefault(worker, {})
+            for name, histograms in operations.items():
+                merged.setdefault(name, LatencyHistograms()).merge(histograms)
+
+        self.errors.update(other.errors)
+        self.max_schedule_lag = max(self.max_schedule_lag, other.max_schedule_lag)
+        self.duration = max(self.duration, other.duration) if concurrent else self.duration + other.duration
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "workers": {
+                worker: {name: histograms.to_dict() for name, histograms in operations.items()}
+                for worker, operations in self.workers.items()
+            },
+            "errors": dict(self.errors),
+            "max_schedule_lag": self.max_schedule_lag,
+            "duration": self.duration
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LoadReport":
+        report = cls()
+        report.workers = {
+            worker: {name: LatencyHistograms.from_dict(histograms) for name, histograms in operations.items()}
+            for worker, operations in data["workers"].items()
+        }
+        report.errors.update(data["errors"])
+        report.max_schedule_lag = data["max_schedule_lag"]
+        report.duration = data["duration"]
+        return report
+
+    def summary(self) -> str:
+        combined = self.combined()
+        total = self.total(combined)
+        count = total.corrected.total_count
+        throughput = count / self.duration if self.duration else 0.0
+
+        lines = [
+            f"Запросов: {count} за {self.duration:.1f}s ({throughput:.1f}/s), ошибок: {sum(self.errors.values())}, "
+            f"максимальное отставание от расписания: {self.max_schedule_lag / 1000:.1f}ms"
+        ]
+        for name, histograms in sorted(combined.items()):
+            lines.append(f"{name} ({histograms.corrected.total_count}):")
+            lines.append(f"  corrected:   {histograms.corrected.summary()}")
+            lines.append(f"  uncorrected: {histograms.uncorrected.summary()}")
+
+        lines.append("По воркерам (corrected, все операции):")
+        for worker, operations in sorted(self.workers.items()):
+            worker_total = self.total(operations).corrected
+            lines.append(f"  {worker} ({worker_total.total_count}): {worker_total.summary()}")
+
+        for error, error_count in self.errors.most_common():
+            lines.append(f"ОШИБКА {error}: {error_count}")
+
+        return "\n".join(lines)
+
+
+class OpenModelScheduler:
+    """
+    Планировщик открытой модели нагрузки.
+
+    Вызовы запускаются по фиксированному расписанию (start + i / rate) независимо от того, как быстро отвечает
+    сервер: если все воркеры заняты, очередной вызов стартует с опозданием, и это опоздание входит
+    в задержку (coordinated omission не скрывает хвост). Операции чередуются по весам.
+    """
+
+    def __init__(
+            self,
+            operations: dict[str, tuple[Operation, int]],
+            rate: float,
+            duration: float,
+            workers: int = 16,
+            worker_prefix: str = "worker"
+    ):
+        """
+        :param operations: Имя операции -> (вызов, вес).
+        :param rate: Запланированная частота вызовов в секунду.
+        :param duration: Длительность нагрузки в секундах.
+        :param workers: Количество потоков (максимальная конкурентность).
+        :param worker_prefix: Префикс имён воркеров в отчёте.
+        """
+        if rate <= 0 or duration <= 0 or workers <= 0:
+            raise ValueError("rate, duration и workers должны быть положительными")
+
+        self.operations = operations
+        self.rate = rate
+        self.duration = duration
+        self.workers = workers
+        self.worker_prefix = worker_prefix
+
+        # Порядок операций по весам: для слота i выполняется schedule[i % len(schedule)]
+        self._schedule = [name for name, (_, weight) in operations.items() for _ in range(weight)]
+        if not self._schedule:
+            raise ValueError("Не задано ни одной операции с положительным весом")
+
+        self._lock = threading.Lock()
+
+    def run(self, start_at: float | None = None) -> LoadReport:
+        """
+        Выполняет нагрузку и возвращает отчёт.
+
+        :param start_at: Момент старта по time.time() (для синхронного старта нескольких процессов);
+        по умолчанию — сейчас.
+        """
+        logger.info(
+            f"Нагрузка: {self.rate:g} вызовов/s в течение {self.duration:g}s, воркеров: {self.workers}, "
+            f"операции: {', '.join(self.operations)}"
+        )
+
+        report = LoadReport()
+        slots = itertools.count()
+        interval = 1 / self.rate
+        total_slots = int(self.duration * self.rate)
+
+        # Расписание считается в perf_counter, а общий момент старта задаётся по часам. Если момент старта
+        # уже прошёл (предыдущий этап затянулся), опоздавшие слоты попадают в задержку, а не сдвигают расписание
+        start = time.perf_counter() + ((start_at or time.time()) - time.time())
+
+        threads = [
+            threading.Thread(
+                target=self._work,
+                args=(f"{self.worker_prefix}-{index}", report, slots, start, interval, total_slots),
+                daemon=True
+            )
+            for index in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        report.duration = time.perf_counter() - start
+        return report
+
+    def _work(
+            self,
+            worker: str,
+            report: LoadReport,
+            slots: itertools.count,
+            start: float,
+            interval: float,
+            total_slots: int
+    ):
+        histograms = {name: LatencyHistograms() for name in self.operations}
+        errors: Counter[str] = Counter()
+        max_lag = 0
+
+        # next у itertools.count атомарен: каждый слот расписания достаётся ровно одному воркеру
+        while (slot := next(slots)) < total_slots:
+            name = self._schedule[slot % len(self._schedule)]
+            operation, _ = self.operations[name]
+
+            intended = start + slot * interval
+            if (delay := intended - time.perf_counter()) > 0:
+                time.sleep(delay)
+
+            sent = time.perf_counter()
+            try:
+                result = operation()
+                if isinstance(result, Response) and result.is_error:
+                    errors[f"{name}: HTTP {result.status_code}"] += 1
+            except Exception as error:
+                errors[f"{name}: {type(error).__name__}"] += 1
+            finished = time.perf_counter()
+
+            histograms[name].corrected.record(int((finished - intended) * 1_000_000))
+            histograms[name].uncorrected.record(int((finished - sent) * 1_000_000))
+            max_lag = max(max_lag, int((sent - intended) * 1_000_000))
+
+        with self._lock:
+            report.workers[worker] = histograms
+            report.errors.update(errors)
+            report.max_schedule_lag = max(report.max_schedule_lag, max_lag)
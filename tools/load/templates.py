@@ -0,0 +1,165 @@
+import itertools
+import json
+import threading
+import uuid
+from functools import lru_cache
+from typing import Any, Callable, Iterator
+
+from pydantic import BaseModel
+
+from clients.courses.courses_schema import CreateCourseRequestSchema
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema
+from clients.users.users_schema import CreateUserRequestSchema
+
+# Сколько тел в среднем приходится на одну выборочную проверку схемой
+DEFAULT_SPOT_CHECK_EVERY: int = 1000
+
+
+class TemplateMismatchError(AssertionError):
+    """
+    Тело, собранное из шаблона, не прошло выборочную проверку схемой.
+    """
+
+
+class RequestTemplate:
+    """
+    Скомпилированный шаблон JSON-тела запроса.
+
+    Модель сериализуется один раз; значения полей-слотов заменяются уникальными маркерами,
+    по которым сериализованное тело режется на неизменяемые куски. render() склеивает куски
+    с JSON-представлениями значений слотов — без валидации Pydantic, alias-генерации и Faker.
+
+    Каждое spot_check_every-е тело проверяется схемой (model_validate_json) и сравнивается
+    со значениями слотов, чтобы шаблон не разошёлся со схемой незаметно.
+    """
+
+    def __init__(
+            self,
+            schema: type[BaseModel],
+            slots: tuple[str, ...],
+            spot_check_every: int = DEFAULT_SPOT_CHECK_EVERY,
+            **fixed: Any
+    ):
+        """
+        :param schema: Модель запроса.
+        :param slots: Поля модели (по имени в Python), значения которых задаются при каждом render().
+        :param spot_check_every: Проверять схемой каждое N-е тело (0 — не проверять).
+        :param fixed: Значения неизменяемых полей; остальные берутся из значений по умолчанию модели.
+        """
+        self.schema = schema
+        self.slots = slots
+        self.spot_check_every = spot_check_every
+        self.spot_checks = 0
+
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+        self._parts, self._order = self._compile(fixed)
+
+    def _compile(self, fixed: dict[str, Any]) -> tuple[list[bytes], list[str]]:
+        sample = self.schema(**fixed)
+
+        markers: dict[bytes, str] = {}
+        values = sample.model_dump()
+        for index, slot in enumerate(self.slots):
+            if slot not in self.schema.model_fields:
+                raise ValueError(f"У модели {self.schema.__name__} нет поля '{slot}'")
+
+            if isinstance(values[slot], int):
+                marker = 7_300_000_000_000 + index
+                markers[str(marker).encode()] = slot
+            else:
+                marker = f"__slot_{index}_{uuid.uuid4().hex}__"
+                markers[f'"{marker}"'.encode()] = slot
+
+            values[slot] = marker
+
+        # model_construct не валидирует маркеры (например, маркер в поле EmailStr)
+        body = self.schema.model_construct(**values).model_dump_json(by_alias=True).encode()
+
+        for marker, slot in markers.items():
+            if body.count(marker) != 1:
+                raise ValueError(f"Не удалось однозначно найти слот '{slot}' в теле {self.schema.__name__}")
+
+        parts: list[bytes] = []
+        order: list[str] = []
+        for marker, slot in sorted(markers.items(), key=lambda item: body.index(item[0])):
+            head, _, body = body.partition(marker)
+            parts.append(head)
+            order.append(slot)
+
+        parts.append(body)
+        return parts, order
+
+    def render(self, **values: Any) -> bytes:
+        """
+        Собирает тело запроса.
+
+        :param values: Значения всех слотов шаблона.
+        :return: JSON-тело в байтах.
+        """
+        chunks = [self._parts[0]]
+        for slot, part in zip(self._order, self._parts[1:]):
+            chunks.append(json.dumps(values[slot], ensure_ascii=False).encode())
+            chunks.append(part)
+
+        body = b"".join(chunks)
+
+        if self.spot_check_every and next(self._counter) % self.spot_check_every == 0:
+            self.spot_check(body, values)
+
+        return body
+
+    def spot_check(self, body: bytes, values: dict[str, Any]):
+        """
+        Проверяет тело схемой и сравнивает значения слотов.
+
+        :raises TemplateMismatchError: Если тело не проходит валидацию или значения разошлись.
+        """
+        with self._lock:
+            self.spot_checks += 1
+
+        try:
+            model = self.schema.model_validate_json(body)
+        except ValueError as error:
+            raise TemplateMismatchError(f"Тело из шаблона {self.schema.__name__} не прошло валидацию: {error}")
+
+        for slot in self.slots:
+            if (actual := getattr(model, slot)) != values[slot]:
+                raise TemplateMismatchError(
+                    f"Слот '{slot}' шаблона {self.schema.__name__}: ожидалось {values[slot]!r}, получено {actual!r}"
+                )
+
+
+def unique_emails(prefix: str = "load") -> Iterator[str]:
+    """
+    Бесконечная последовательность уникальных в пределах прогона email.
+    """
+    run_id = uuid.uuid4().hex[:8]
+    return (f"{prefix}.{run_id}.{number}@example.com" for number in itertools.count())
+
+
+def counter(start: int = 0) -> Callable[[], int]:
+    """
+    Потокобезопасный счётчик (next у itertools.count атомарен под GIL).
+    """
+    return itertools.count(start).__next__
+
+
+@lru_cache(maxsize=None)
+def get_create_user_template() -> RequestTemplate:
+    return RequestTemplate(CreateUserRequestSchema, slots=("email",))
+
+
+@lru_cache(maxsize=None)
+def get_create_course_template(preview_file_id: str, created_by_user_id: str) -> RequestTemplate:
+    return RequestTemplate(
+        CreateCourseRequestSchema,
+        slots=("title",),
+        preview_file_id=preview_file_id,
+        created_by_user_id=created_by_user_id
+    )
+
+
+@lru_cache(maxsize=None)
+def get_create_exercise_template() -> RequestTemplate:
+    return RequestTemplate(CreateExerciseRequestSchema, slots=("course_id", "order_index", "title"))
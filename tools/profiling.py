@@ -0,0 +1,303 @@
+import cProfile
+import heapq
+import io
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from enum import Enum
+from pathlib import Path
+from types import FrameType
+
+from tools.logger import get_logger
+
+logger = get_logger("PROFILING")
+
+# Интервал опроса стеков в режиме сэмплирования, в секундах
+SAMPLING_INTERVAL: float = 0.005
+
+# Группы модулей, по которым строится сводка горячих точек сессии
+HOT_SPOT_GROUPS: dict[str, tuple[str, ...]] = {
+    "network": ("httpx", "httpcore", "h11", "socket", "_socket", "ssl", "_ssl", "selectors", "select"),
+    "pydantic": ("pydantic", "pydantic_core"),
+    "jsonschema": ("jsonschema", "referencing", "rpds"),
+    "allure": ("allure", "allure_commons", "allure_pytest"),
+    "faker": ("faker",),
+    "coverage": ("swagger_coverage_tool",),
+    "clients": ("clients",),
+    "tools": ("tools",),
+}
+
+
+class ProfileFormat(str, Enum):
+    PSTATS = "pstats"
+    COLLAPSED = "collapsed"
+
+    def __str__(self):
+        return self.value
+
+
+def parse_profile_option(value: str) -> int:
+    """
+    Разбирает значение опции --profile-tests.
+
+    :param value: Строка вида "slowest:10".
+    :return: Количество самых медленных тестов, профили которых нужно сохранить.
+    :raises ValueError: Если значение не соответствует формату.
+    """
+    match = re.fullmatch(r"slowest:(\d+)", value.strip())
+    if not match or int(match.group(1)) < 1:
+        raise ValueError(f"Неверное значение --profile-tests: '{value}'. Ожидается формат slowest:N")
+
+    return int(match.group(1))
+
+
+def get_module_group(location: str) -> str:
+    """
+    Определяет группу модуля (сеть, pydantic, jsonschema, allure и т.д.).
+
+    :param location: Путь к файлу с исходным кодом функции или полное имя модуля.
+    :return: Название группы или "other".
+    """
+    parts = {part.removesuffix(".py") for part in Path(location).parts} | {location.split(".")[0]}
+    for group, packages in HOT_SPOT_GROUPS.items():
+        if parts.intersection(packages):
+            return group
+
+    return "other"
+
+
+def get_entry_group(filename: str, name: str) -> str:
+    """
+    Определяет группу модуля для записи pstats.
+
+    У функций на C (recv_into сокета, read SSL, validate_json pydantic-core) filename равен "~",
+    а модуль есть только в имени: "<method 'recv_into' of '_socket.socket' objects>"
+    или "<built-in method _socket.getaddrinfo>".
+
+    :param filename: Первое поле ключа pstats.
+    :param name: Третье поле ключа pstats (имя функции).
+    :return: Название группы или "other".
+    """
+    if filename != "~":
+        return get_module_group(filename)
+
+    match = re.fullmatch(r"<method '\w+' of '([\w.]+)' objects>|<built-in method ([\w.]+)>", name)
+    if match is None:
+        return "other"
+
+    qualname = match.group(1) or match.group(2).rpartition(".")[0]
+    return get_module_group(qualname) if qualname else "other"
+
+
+class StackSampler:
+    """
+    Сэмплирующий профилировщик: периодически снимает стек указанного потока
+    и копит его в виде collapsed stacks (формат, который принимает flamegraph.pl и speedscope).
+    """
+
+    def __init__(self, thread_id: int, interval: float = SAMPLING_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    @staticmethod
+    def _collapse(frame: FrameType | None) -> str:
+        names: list[str] = []
+        while frame is not None:
+            names.append(f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}")
+            frame = frame.f_back
+
+        return ";".join(reversed(names))
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[self._collapse(frame)] += 1
+
+    def enable(self):
+        self._thread.start()
+
+    def disable(self):
+        self._stop_event.set()
+        self._thread.join()
+
+    def dump(self) -> str:
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common())
+
+
+class ItemProfile:
+    """
+    Профиль одного теста: накрывает настройку фикстур и тело теста.
+    """
+
+    def __init__(self, nodeid: str, profile_format: ProfileFormat):
+        self.nodeid = nodeid
+        self.profile_format = profile_format
+        self.duration: float = 0.0
+        self.path: Path | None = None
+
+        self._started_at: float = 0.0
+        self._profiler: cProfile.Profile | StackSampler = (
+            cProfile.Profile()
+            if profile_format == ProfileFormat.PSTATS
+            else StackSampler(threading.get_ident())
+        )
+
+    def start(self):
+        self._started_at = time.perf_counter()
+        self._profiler.enable()
+
+    def stop(self):
+        self._profiler.disable()
+        self.duration = time.perf_counter() - self._started_at
+
+    @property
+    def stats(self) -> pstats.Stats | None:
+        if isinstance(self._profiler, cProfile.Profile):
+            return pstats.Stats(self._profiler)
+
+        return None
+
+    @property
+    def stacks(self) -> Counter[str]:
+        if isinstance(self._profiler, StackSampler):
+            return self._profiler.stacks
+
+        return Counter()
+
+    def render_top(self, limit: int = 30) -> str:
+        """
+        Возвращает человекочитаемый топ функций для вложения в Allure.
+        """
+        if stats := self.stats:
+            stream = io.StringIO()
+            stats.stream = stream
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+            return stream.getvalue()
+
+        return "\n".join(f"{count:>6} {stack.split(';')[-1]}" for stack, count in self.stacks.most_common(limit))
+
+    def dump(self, directory: Path) -> Path:
+        """
+        Сохраняет профиль на диск в формате pstats или collapsed stacks.
+
+        :param directory: Каталог для профилей.
+        :return: Путь к сохранённому файлу.
+        """
+        filename = re.sub(r"[^\w.-]+", "_", self.nodeid).strip("_")
+        self.path = directory.joinpath(f"{filename}.{self.profile_format}")
+
+        if isinstance(self._profiler, cProfile.Profile):
+            self._profiler.dump_stats(self.path)
+        else:
+            self.path.write_text(self._profiler.dump())
+
+        return self.path
+
+
+class SessionProfiler:
+    """
+    Собирает профили тестов за сессию, хранит в каталоге profiles только N самых медленных
+    и агрегирует горячие точки по всем тестам.
+
+    Профиль, попавший в N самых медленных, сразу прикрепляется к своему тесту; копия во вложении
+    остаётся, даже если позже профиль вытеснен более медленным — удаляется только рабочий файл в profiles.
+    """
+
+    def __init__(self, limit: int, results_dir: Path, profile_format: ProfileFormat = ProfileFormat.PSTATS):
+        self.limit = limit
+        self.profile_format = profile_format
+        self.profiles_dir = results_dir.joinpath("profiles")
+
+        self._slowest: list[tuple[float, str, Path]] = []
+        self._active: dict[str, ItemProfile] = {}
+        self._session_stats: pstats.Stats | None = None
+        self._session_stacks: Counter[str] = Counter()
+        self._group_totals: Counter[str] = Counter()
+
+    def start(self, nodeid: str):
+        profile = ItemProfile(nodeid, self.profile_format)
+        self._active[nodeid] = profile
+        profile.start()
+
+    def is_active(self, nodeid: str) -> bool:
+        return nodeid in self._active
+
+    def stop(self, nodeid: str) -> ItemProfile | None:
+        """
+        Останавливает профилирование теста и учитывает его в сводке сессии.
+
+        :param nodeid: Идентификатор теста pytest.
+        :return: Профиль теста, если он попал в N самых медленных, иначе None.
+        """
+        profile = self._active.pop(nodeid, None)
+        if profile is None:
+            return None
+
+        profile.stop()
+        self._collect(profile)
+
+        if len(self._slowest) >= self.limit and profile.duration <= self._slowest[0][0]:
+            return None
+
+        self.profiles_dir.mkdir(parents=True, exist_ok=True)
+        path = profile.dump(self.profiles_dir)
+
+        if len(self._slowest) >= self.limit:
+            _, evicted_nodeid, evicted_path = heapq.heapreplace(self._slowest, (profile.duration, nodeid, path))
+            evicted_path.unlink(missing_ok=True)
+            logger.debug(f"Профиль теста {evicted_nodeid} вытеснен более медленным {nodeid}")
+        else:
+            heapq.heappush(self._slowest, (profile.duration, nodeid, path))
+
+        return profile
+
+    def _collect(self, profile: ItemProfile):
+        if stats := profile.stats:
+            for (filename, _, name), (_, _, tottime, _, _) in stats.stats.items():
+                self._group_totals[get_entry_group(filename, name)] += tottime
+
+            if self._session_stats is None:
+                self._session_stats = stats
+            else:
+                self._session_stats.add(stats)
+
+        for stack, count in profile.stacks.items():
+            leaf = stack.rsplit(";", 1)[-1]
+            self._session_stacks[leaf] += count
+            self._group_totals[get_module_group(leaf.split(":", 1)[0])] += count * SAMPLING_INTERVAL
+
+    def summary(self, limit: int = 15) -> str:
+        """
+        Формирует сводку сессии: самые медленные тесты, время по группам модулей
+        и самые горячие функции.
+        """
+        lines = [f"Самые медленные тесты (профили в {self.profiles_dir}):"]
+        for duration, nodeid, _ in sorted(self._slowest, reverse=True):
+            lines.append(f"  {duration:8.3f}s  {nodeid}")
+
+        lines.append("Собственное время по группам модулей:")
+        for group, total in self._group_totals.most_common():
+            lines.append(f"  {total:8.3f}s  {group}")
+
+        lines.append("Горячие точки:")
+        if self._session_stats is not None:
+            hot_spots = sorted(
+                self._session_stats.stats.items(),
+                key=lambda item: item[1][2],
+                reverse=True
+            )[:limit]
+            for (filename, line, name), (_, calls, tottime, _, _) in hot_spots:
+                lines.append(f"  {tottime:8.3f}s  {calls:>8} calls  {name} ({Path(filename).name}:{line})")
+
+        for leaf, count in self._session_stacks.most_common(limit):
+            lines.append(f"  {count:>8} samples  {leaf}")
+
+        return "\n".join(lines)
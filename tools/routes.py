@@ -1,4 +1,6 @@
+import re
 from enum import Enum
+from functools import lru_cache
 
 
 class APIRoutes(str, Enum):
@@ -10,3 +12,41 @@ class APIRoutes(str, Enum):
 
     def __str__(self):
         return self.value
+
+
+# Шаблоны маршрутов API в порядке приоритета сопоставления (статичные сегменты раньше параметров)
+ROUTE_TEMPLATES: tuple[str, ...] = (
+    f"{APIRoutes.AUTHENTICATION}/login",
+    f"{APIRoutes.AUTHENTICATION}/refresh",
+    f"{APIRoutes.USERS}/me",
+    f"{APIRoutes.USERS}/{{user_id}}",
+    f"{APIRoutes.USERS}",
+    f"{APIRoutes.FILES}/{{file_id}}",
+    f"{APIRoutes.FILES}",
+    f"{APIRoutes.COURSES}/{{course_id}}",
+    f"{APIRoutes.COURSES}",
+    f"{APIRoutes.EXERCISES}/{{exercise_id}}",
+    f"{APIRoutes.EXERCISES}",
+)
+
+_ROUTE_PATTERNS: tuple[tuple[re.Pattern, str], ...] = tuple(
+    (re.compile("^" + re.sub(r"\{\w+}", "[^/]+", template) + "/?$"), template)
+    for template in ROUTE_TEMPLATES
+)
+
+
+@lru_cache(maxsize=4096)
+def get_route_template(path: str) -> str:
+    """
+    Возвращает шаблон маршрута для фактического пути запроса.
+
+    Пример: /api/v1/exercises/3f1c... -> /api/v1/exercises/{exercise_id}
+
+    :param path: Путь запроса без query-параметров.
+    :return: Шаблон маршрута или исходный путь, если шаблон не найден.
+    """
+    for pattern, template in _ROUTE_PATTERNS:
+        if pattern.match(path):
+            return template
+
+    return path
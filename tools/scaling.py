@@ -0,0 +1,104 @@
+import math
+import statistics
+from http import HTTPStatus
+from typing import Callable
+
+from httpx import Response
+from pydantic import BaseModel
+
+from tools.assertions.base import assert_status_code, assert_equal
+
+# Размеры наборов данных, на которых снимается зависимость задержки от N
+DEFAULT_SCALING_SIZES: tuple[int, ...] = (10, 25, 50, 100, 150, 200)
+# Сколько раз повторяется запрос на каждом размере
+DEFAULT_SCALING_REPEATS: int = 5
+# Показатель роста выше этого значения считаем сверхлинейным (O(n^2) и хуже)
+MAX_GROWTH_EXPONENT: float = 1.5
+# Сетка показателей роста, по которой подбирается зависимость latency ~ a + b * N^k
+GROWTH_EXPONENT_GRID: tuple[float, ...] = tuple(step / 20 for step in range(1, 61))
+# Прирост задержки на всём диапазоне N меньше этой доли от минимальной задержки считается шумом
+NEGLIGIBLE_GROWTH: float = 0.1
+
+
+class ScalingPointSchema(BaseModel):
+    """
+    Замер списочного эндпоинта на одном размере набора данных.
+    """
+    size: int
+    latency: float
+    payload_size: int
+
+
+def measure_list_endpoint(
+        size: int,
+        call: Callable[[], Response],
+        items: str,
+        repeats: int = DEFAULT_SCALING_REPEATS
+) -> ScalingPointSchema:
+    """
+    Замеряет медианную задержку и размер ответа списочного эндпоинта.
+
+    Каждый ответ проверяется: статус 200 и ровно size элементов в списке. Иначе ошибка
+    или обрезанный список дали бы «линейную» задержку и ложно прошли бы проверку.
+
+    :param size: Количество элементов в наборе данных.
+    :param call: Функция, выполняющая запрос (например, lambda: client.get_courses_api(query)).
+    :param items: Ключ списка в теле ответа (например, "courses").
+    :param repeats: Количество повторов запроса.
+    :return: Объект ScalingPointSchema (задержка в миллисекундах, размер в байтах).
+    """
+    latencies: list[float] = []
+    payload_size = 0
+
+    for _ in range(repeats):
+        response = call()
+        assert_status_code(response.status_code, HTTPStatus.OK)
+        assert_equal(len(response.json()[items]), size, f"количество {items}")
+
+        latencies.append(response.elapsed.total_seconds() * 1000)
+        payload_size = len(response.content)
+
+    return ScalingPointSchema(size=size, latency=statistics.median(latencies), payload_size=payload_size)
+
+
+def estimate_growth_exponent(points: list[ScalingPointSchema]) -> float:
+    """
+    Оценивает показатель k в зависимости latency ~ a + b * size^k.
+
+    Постоянные накладные расходы a (сеть, аутентификация) подбираются вместе с k, поэтому они
+    не маскируют квадратичный рост на малых N, и кривая строится по всем точкам: одна шумная медиана
+    не решает результат. k перебирается по сетке GROWTH_EXPONENT_GRID, для каждого a и b находятся
+    методом наименьших квадратов. Рост меньше NEGLIGIBLE_GROWTH от базовой задержки считается отсутствием роста.
+
+    :param points: Замеры на разных размерах (не меньше трёх).
+    :return: Показатель роста: ~0 без роста, ~1 для линейной зависимости, ~2 для квадратичной.
+    """
+    sizes = [point.size for point in points]
+    latencies = [point.latency for point in points]
+
+    best_error, best_exponent, best_growth = math.inf, 0.0, 0.0
+    for exponent in GROWTH_EXPONENT_GRID:
+        xs = [size ** exponent for size in sizes]
+        slope, intercept = statistics.linear_regression(xs, latencies)
+        if slope < 0:
+            continue
+
+        error = sum((latency - intercept - slope * x) ** 2 for x, latency in zip(xs, latencies))
+        if error < best_error:
+            best_error, best_exponent, best_growth = error, exponent, slope * (max(xs) - min(xs))
+
+    if best_growth < NEGLIGIBLE_GROWTH * min(latencies):
+        return 0.0
+
+    return best_exponent
+
+
+def render_scaling_table(points: list[ScalingPointSchema]) -> str:
+    lines = [f"{'N':>8} {'latency, ms':>12} {'payload, bytes':>15} {'bytes/item':>11}"]
+    for point in points:
+        lines.append(
+            f"{point.size:>8} {point.latency:>12.1f} {point.payload_size:>15} "
+            f"{point.payload_size / point.size:>11.1f}"
+        )
+
+    return "\n".join(lines)
@@ -0,0 +1,207 @@
+import hashlib
+import itertools
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from httpx import HTTPError
+from pydantic import BaseModel, ValidationError
+
+from clients.courses.courses_client import get_courses_client
+from clients.courses.courses_schema import CreateCourseRequestSchema, GetCoursesQuerySchema
+from clients.exercises.exercises_client import get_exercises_client
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema, GetExercisesQuerySchema
+from clients.files.files_client import get_files_client
+from clients.files.files_schema import CreateFileRequestSchema
+from clients.private_http_builder import AuthenticationUserSchema
+from clients.users.private_users_client import get_private_users_client
+from clients.users.public_users_client import get_public_users_client
+from clients.users.users_schema import CreateUserRequestSchema
+from config import settings
+from tools.allure.reporting import step
+from tools.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: воркеры проверяют и досоздают сид без блокировки
+    fcntl = None
+
+logger = get_logger("SEED")
+
+
+class SeedUserSchema(BaseModel):
+    id: str
+    email: str
+    password: str
+
+    @property
+    def authentication_user(self) -> AuthenticationUserSchema:
+        return AuthenticationUserSchema(email=self.email, password=self.password)
+
+
+class SeedCourseSchema(BaseModel):
+    id: str
+    exercise_ids: list[str] = []
+
+
+class SeedManifestSchema(BaseModel):
+    """
+    Долгоживущий сид одного стенда: пользователь, его файл превью, курсы и задания курсов.
+
+    Хранится между сессиями; при старте проверяется дешёвыми GET-запросами,
+    и пересоздаётся только то, чего на стенде больше нет.
+    """
+    url: str
+    user: SeedUserSchema | None = None
+    file_id: str | None = None
+    courses: list[SeedCourseSchema] = []
+
+
+def get_free_order_indexes(used: Iterable[int], count: int) -> list[int]:
+    """
+    Наименьшие свободные order_index: пропуски после удалённых заданий заполняются первыми,
+    поэтому новые задания не совпадают по order_index с оставшимися.
+
+    :param used: order_index заданий, которые уже есть в курсе.
+    :param count: Сколько индексов нужно.
+    """
+    used = set(used)
+    return list(itertools.islice((index for index in itertools.count() if index not in used), count))
+
+
+class SeedStore:
+    """
+    Манифест сида на диске: <directory>/seed-<хеш адреса API>.json.
+
+    Проверка и досоздание выполняются под файловой блокировкой: воркеры xdist стартуют одновременно,
+    но сид строит один из них, а остальные получают уже проверенный манифест.
+    """
+
+    def __init__(self, directory: Path, url: str, courses: int, exercises: int):
+        """
+        :param directory: Каталог манифестов.
+        :param url: Адрес API стенда.
+        :param courses: Сколько курсов должно быть в сиде.
+        :param exercises: Сколько заданий должно быть в каждом курсе.
+        """
+        self.url = url
+        self.courses = courses
+        self.exercises = exercises
+
+        directory.mkdir(parents=True, exist_ok=True)
+        self.file = directory / f"seed-{hashlib.sha256(url.encode()).hexdigest()[:12]}.json"
+
+    def load(self) -> SeedManifestSchema:
+        try:
+            manifest = SeedManifestSchema.model_validate_json(self.file.read_bytes())
+        except (OSError, ValidationError):
+            return SeedManifestSchema(url=self.url)
+
+        return manifest if manifest.url == self.url else SeedManifestSchema(url=self.url)
+
+    def save(self, manifest: SeedManifestSchema):
+        # Запись через временный файл: читатель никогда не увидит наполовину записанный манифест
+        temporary = self.file.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_text(manifest.model_dump_json(indent=2))
+        temporary.replace(self.file)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+
+        with open(self.file.with_suffix(".lock"), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def ensure(self) -> SeedManifestSchema:
+        """
+        Проверяет манифест на стенде, досоздаёт недостающее и сохраняет результат.
+
+        :return: Актуальный манифест.
+        """
+        with self._locked(), step("Проверить и досоздать сид стенда"):
+            manifest = self.load()
+
+            if manifest.user is None or not self._is_user_alive(manifest.user):
+                manifest = SeedManifestSchema(url=self.url, user=self._create_user())
+
+            user = manifest.user.authentication_user
+            files_client = get_files_client(user)
+            if manifest.file_id is None or files_client.get_file_api(manifest.file_id).is_error:
+                logger.info("Файл превью сида не найден, загружаем заново")
+                request = CreateFileRequestSchema(upload_file=settings.test_data.image_png_file)
+                manifest.file_id = files_client.create_file(request).file.id
+
+            self._ensure_courses(manifest)
+            for course in manifest.courses:
+                self._ensure_exercises(manifest, course)
+
+            self.save(manifest)
+            return manifest
+
+    @staticmethod
+    def _is_user_alive(user: SeedUserSchema) -> bool:
+        try:
+            response = get_private_users_client(user.authentication_user).get_user_me_api()
+        except (HTTPError, ValidationError):
+            # Логин не удался: пользователя нет или пароль больше не подходит
+            return False
+
+        if response.is_error or response.json()["user"]["id"] != user.id:
+            logger.info(f"Пользователь сида {user.email} больше не существует, сид строится заново")
+            return False
+
+        return True
+
+    @staticmethod
+    def _create_user() -> SeedUserSchema:
+        request = CreateUserRequestSchema()
+        response = get_public_users_client().create_user(request)
+        return SeedUserSchema(id=response.user.id, email=request.email, password=request.password)
+
+    def _ensure_courses(self, manifest: SeedManifestSchema):
+        courses_client = get_courses_client(manifest.user.authentication_user)
+
+        table = courses_client.get_courses_table(GetCoursesQuerySchema(user_id=manifest.user.id))
+        existing = set(table["id"])
+        manifest.courses = [course for course in manifest.courses if course.id in existing]
+
+        if (missing := self.courses - len(manifest.courses)) > 0:
+            logger.info(f"Досоздаём {missing} курсов сида")
+            for _ in range(missing):
+                request = CreateCourseRequestSchema(preview_file_id=manifest.file_id, created_by_user_id=manifest.user.id)
+                manifest.courses.append(SeedCourseSchema(id=courses_client.create_course_record(request).id))
+
+    def _ensure_exercises(self, manifest: SeedManifestSchema, course: SeedCourseSchema):
+        exercises_client = get_exercises_client(manifest.user.authentication_user)
+
+        table = exercises_client.get_exercises_table(GetExercisesQuerySchema(course_id=course.id))
+        existing = set(table["id"])
+        course.exercise_ids = [exercise_id for exercise_id in course.exercise_ids if exercise_id in existing]
+
+        if (missing := self.exercises - len(course.exercise_ids)) > 0:
+            logger.info(f"Досоздаём {missing} заданий курса сида {course.id}")
+            for order_index in get_free_order_indexes(table["order_index"], missing):
+                request = CreateExerciseRequestSchema(course_id=course.id, order_index=order_index)
+                course.exercise_ids.append(exercises_client.create_exercise_record(request).id)
+
+
+@lru_cache(maxsize=None)
+def get_seed() -> SeedManifestSchema:
+    """
+    Возвращает проверенный сид стенда; проверка выполняется один раз за процесс.
+    """
+    store = SeedStore(
+        directory=settings.seed.directory,
+        url=settings.http_client.client_url,
+        courses=settings.seed.courses,
+        exercises=settings.seed.exercises
+    )
+    return store.ensure()
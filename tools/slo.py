@@ -0,0 +1,159 @@
+import threading
+from collections import defaultdict
+from typing import Any
+
+from pydantic import BaseModel
+
+from tools.http.timings import RequestTimingsSchema
+from tools.load.histogram import HdrHistogram
+from tools.routes import APIRoutes
+
+
+class SLOSchema(BaseModel):
+    """
+    Бюджет эндпоинта: p95 задержки в миллисекундах и максимальный размер ответа в байтах.
+    """
+    max_p95: float
+    max_response_size: int
+
+
+# Бюджеты по шаблонам маршрутов. Ключ — "МЕТОД шаблон" или только шаблон (для всех методов);
+# бюджет с методом имеет приоритет
+ROUTE_SLOS: dict[str, SLOSchema] = {
+    f"POST {APIRoutes.AUTHENTICATION}/login": SLOSchema(max_p95=500, max_response_size=4 * 1024),
+    f"POST {APIRoutes.AUTHENTICATION}/refresh": SLOSchema(max_p95=500, max_response_size=4 * 1024),
+    f"{APIRoutes.USERS}/me": SLOSchema(max_p95=300, max_response_size=4 * 1024),
+    f"{APIRoutes.USERS}/{{user_id}}": SLOSchema(max_p95=300, max_response_size=4 * 1024),
+    f"{APIRoutes.USERS}": SLOSchema(max_p95=500, max_response_size=4 * 1024),
+    f"{APIRoutes.FILES}/{{file_id}}": SLOSchema(max_p95=300, max_response_size=4 * 1024),
+    f"POST {APIRoutes.FILES}": SLOSchema(max_p95=2000, max_response_size=4 * 1024),
+    f"{APIRoutes.COURSES}/{{course_id}}": SLOSchema(max_p95=300, max_response_size=16 * 1024),
+    f"GET {APIRoutes.COURSES}": SLOSchema(max_p95=1000, max_response_size=4 * 1024 * 1024),
+    f"{APIRoutes.COURSES}": SLOSchema(max_p95=500, max_response_size=16 * 1024),
+    f"{APIRoutes.EXERCISES}/{{exercise_id}}": SLOSchema(max_p95=300, max_response_size=16 * 1024),
+    f"GET {APIRoutes.EXERCISES}": SLOSchema(max_p95=1000, max_response_size=4 * 1024 * 1024),
+    f"{APIRoutes.EXERCISES}": SLOSchema(max_p95=500, max_response_size=16 * 1024),
+}
+
+
+def get_route_slo(method: str, route: str) -> SLOSchema | None:
+    return ROUTE_SLOS.get(f"{method} {route}") or ROUTE_SLOS.get(route)
+
+
+def get_p95(histogram: HdrHistogram) -> float:
+    """
+    p95 задержки маршрута в миллисекундах (гистограмма хранит микросекунды).
+    """
+    return histogram.value_at_percentile(95) / 1000
+
+
+class SLOTracker:
+    """
+    Проверяет запросы на соответствие бюджетам ROUTE_SLOS.
+
+    Каждый запрос сравнивается с бюджетом сразу (размер ответа и задержка выше p95-бюджета),
+    а p95 по маршруту считается по всей сессии, включая результаты воркеров xdist. Задержки маршрута
+    копятся в HdrHistogram: память не зависит от числа запросов, а гистограммы воркеров складываются
+    без потери точности.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latencies: dict[tuple[str, str], HdrHistogram] = defaultdict(HdrHistogram)
+        self._oversized: dict[tuple[str, str], int] = defaultdict(int)
+        self._max_sizes: dict[tuple[str, str], int] = defaultdict(int)
+
+    def check(self, timings: RequestTimingsSchema, response_size: int) -> list[str]:
+        """
+        Учитывает запрос и возвращает нарушения его бюджета.
+
+        :param timings: Разбивка времени запроса.
+        :param response_size: Размер тела ответа в байтах.
+        :return: Описания нарушений (пустой список, если бюджет соблюдён или не задан).
+        """
+        slo = get_route_slo(timings.method, timings.route)
+        if slo is None:
+            return []
+
+        key = (timings.method, timings.route)
+        violations = []
+
+        with self._lock:
+            self._latencies[key].record(round(timings.total * 1000))
+            self._max_sizes[key] = max(self._max_sizes[key], response_size)
+
+            if response_size > slo.max_response_size:
+                self._oversized[key] += 1
+                violations.append(
+                    f"{timings.method} {timings.route}: размер ответа {response_size} байт "
+                    f"при бюджете {slo.max_response_size}"
+                )
+
+        if timings.total > slo.max_p95:
+            violations.append(
+                f"{timings.method} {timings.route}: задержка {timings.total:.1f}ms выше p95-бюджета {slo.max_p95:.0f}ms"
+            )
+
+        return violations
+
+    def dump(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                " ".join(key): {
+                    "latencies": latencies.to_dict(),
+                    "oversized": self._oversized[key],
+                    "max_size": self._max_sizes[key]
+                }
+                for key, latencies in self._latencies.items()
+            }
+
+    def merge(self, results: dict[str, Any]):
+        """
+        Добавляет замеры, собранные другим процессом (воркером xdist).
+        """
+        with self._lock:
+            for name, result in results.items():
+                key = tuple(name.split(" ", 1))
+                self._latencies[key].merge(HdrHistogram.from_dict(result["latencies"]))
+                self._oversized[key] += result["oversized"]
+                self._max_sizes[key] = max(self._max_sizes[key], result["max_size"])
+
+    def breaches(self) -> list[str]:
+        """
+        Нарушения бюджетов на уровне сессии: p95 маршрута выше бюджета или хотя бы один слишком большой ответ.
+        """
+        breaches = []
+        with self._lock:
+            for (method, route), latencies in sorted(self._latencies.items()):
+                slo = get_route_slo(method, route)
+                p95 = get_p95(latencies)
+
+                if p95 > slo.max_p95:
+                    breaches.append(f"{method} {route}: p95={p95:.1f}ms при бюджете {slo.max_p95:.0f}ms")
+
+                if oversized := self._oversized[(method, route)]:
+                    breaches.append(
+                        f"{method} {route}: {oversized} ответов больше {slo.max_response_size} байт "
+                        f"(максимум {self._max_sizes[(method, route)]})"
+                    )
+
+        return breaches
+
+    def summary(self) -> str:
+        lines = []
+        with self._lock:
+            for (method, route), latencies in sorted(self._latencies.items()):
+                slo = get_route_slo(method, route)
+                p95 = get_p95(latencies)
+                status = "OK" if p95 <= slo.max_p95 and not self._oversized[(method, route)] else "BREACH"
+
+                lines.append(
+                    f"{status:<6} {method} {route}: {latencies.total_count} запросов, "
+                    f"p95={p95:.1f}/{slo.max_p95:.0f}ms, "
+                    f"max size={self._max_sizes[(method, route)]}/{slo.max_response_size}"
+                )
+
+        return "\n".join(lines)
+
+
+slo_tracker = SLOTracker()
@@ -0,0 +1,245 @@
+import csv
+import gc
+import json
+import os
+import re
+import resource
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+import httpx
+from pydantic import BaseModel
+
+from tools.logger import get_logger
+
+logger = get_logger("SOAK")
+
+# Метрики, для которых можно задать допустимый наклон (прирост в минуту)
+SOAK_METRICS: tuple[str, ...] = ("rss_mb", "open_fds", "http_clients", "traced_mb")
+# Доля первых замеров, которые не учитываются в наклоне: кеши, пулы соединений и сид ещё прогреваются
+WARMUP_FRACTION: float = 0.2
+# Минимальное число замеров после прогрева, при котором наклон считается
+MIN_SLOPE_SAMPLES: int = 3
+
+_DURATION_UNITS: dict[str, int] = {"s": 1, "m": 60, "h": 3600}
+
+
+class ResourceSampleSchema(BaseModel):
+    """
+    Один замер ресурсов процесса во время soak-прогона.
+    """
+    elapsed: float
+    iterations: int
+    rss_mb: float
+    open_fds: int
+    http_clients: int
+    traced_mb: float
+    top_allocations: list[str] = []
+
+
+class SlopeViolationSchema(BaseModel):
+    metric: str
+    slope: float
+    max_slope: float
+
+    def render(self) -> str:
+        return f"{self.metric}: {self.slope:+.3f}/мин при допустимых {self.max_slope:+.3f}/мин"
+
+
+def parse_duration(value: str) -> float:
+    """
+    Разбирает длительность вида "90", "90s", "30m" или "2h".
+
+    :return: Длительность в секундах.
+    :raises ValueError: Если значение не соответствует формату.
+    """
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([smh]?)", value.strip())
+    if not match:
+        raise ValueError(f"Неверная длительность: '{value}'. Ожидается число секунд или формат 30s/30m/2h")
+
+    number, unit = match.groups()
+    return float(number) * _DURATION_UNITS[unit or "s"]
+
+
+def parse_max_slopes(value: str) -> dict[str, float]:
+    """
+    Разбирает допустимые наклоны вида "rss_mb:5,open_fds:1,http_clients:0.5".
+
+    :return: Словарь метрика -> допустимый прирост в минуту.
+    :raises ValueError: Если указана неизвестная метрика или значение не число.
+    """
+    slopes = {}
+    for part in filter(None, (item.strip() for item in value.split(","))):
+        metric, _, number = part.partition(":")
+        if metric not in SOAK_METRICS:
+            raise ValueError(f"Неизвестная метрика soak-прогона: '{metric}'. Доступны: {', '.join(SOAK_METRICS)}")
+
+        try:
+            slopes[metric] = float(number)
+        except ValueError:
+            raise ValueError(f"Неверный допустимый наклон для '{metric}': '{number}'")
+
+    return slopes
+
+
+def get_rss_mb() -> float:
+    """
+    Текущий RSS процесса в мегабайтах. Вне Linux возвращается пиковый RSS (ru_maxrss).
+    """
+    try:
+        with open("/proc/self/statm") as file:
+            pages = int(file.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except (OSError, ValueError, IndexError):
+        # На macOS ru_maxrss в байтах, на Linux — в килобайтах
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 / 1024
+
+
+def count_open_fds() -> int:
+    for path in ("/proc/self/fd", "/dev/fd"):
+        try:
+            return len(os.listdir(path))
+        except OSError:
+            continue
+
+    return -1
+
+
+def count_http_clients() -> int:
+    """
+    Количество живых httpx.Client (включая закрытые, но ещё не собранные сборщиком мусора).
+    """
+    gc.collect()
+    return sum(1 for item in gc.get_objects() if isinstance(item, httpx.Client))
+
+
+class SoakMonitor:
+    """
+    Снимает временной ряд ресурсов процесса во время soak-прогона и проверяет их рост.
+
+    Рост оценивается наклоном линейной регрессии (прирост в минуту) по замерам после прогрева.
+    """
+
+    def __init__(self, interval: float, max_slopes: dict[str, float], top_allocations: int = 10):
+        self.interval = interval
+        self.max_slopes = max_slopes
+        self.top_allocations = top_allocations
+        self.samples: list[ResourceSampleSchema] = []
+
+        self._started_at = time.monotonic()
+        self._next_sample_at = self._started_at
+
+    def start(self):
+        tracemalloc.start()
+        self._started_at = time.monotonic()
+        self._next_sample_at = self._started_at
+        self.sample(iterations=0, force=True)
+
+    def stop(self, iterations: int):
+        self.sample(iterations=iterations, force=True)
+        tracemalloc.stop()
+
+    def sample(self, iterations: int, force: bool = False):
+        """
+        Снимает замер, если прошёл интервал (или принудительно).
+
+        :param iterations: Сколько тестов выполнено с начала прогона.
+        :param force: Снять замер независимо от интервала.
+        """
+        now = time.monotonic()
+        if not force and now < self._next_sample_at:
+            return
+
+        self._next_sample_at = now + self.interval
+
+        snapshot = tracemalloc.take_snapshot()
+        top = snapshot.statistics("lineno")[:self.top_allocations]
+        traced, _ = tracemalloc.get_traced_memory()
+
+        sample = ResourceSampleSchema(
+            elapsed=now - self._started_at,
+            iterations=iterations,
+            rss_mb=get_rss_mb(),
+            open_fds=count_open_fds(),
+            http_clients=count_http_clients(),
+            traced_mb=traced / 1024 / 1024,
+            top_allocations=[str(stat) for stat in top]
+        )
+        self.samples.append(sample)
+
+        logger.info(
+            f"soak {sample.elapsed:.0f}s, тестов: {iterations}, rss={sample.rss_mb:.1f}MB, "
+            f"fds={sample.open_fds}, httpx.Client={sample.http_clients}, traced={sample.traced_mb:.1f}MB"
+        )
+
+    def slopes(self) -> dict[str, float]:
+        """
+        Наклон каждой метрики (прирост в минуту) по замерам после прогрева.
+        """
+        samples = self.samples[int(len(self.samples) * WARMUP_FRACTION):]
+        if len(samples) < MIN_SLOPE_SAMPLES:
+            return {}
+
+        minutes = [sample.elapsed / 60 for sample in samples]
+        if len(set(minutes)) < 2:
+            return {}
+
+        return {
+            metric: statistics.linear_regression(minutes, [getattr(sample, metric) for sample in samples]).slope
+            for metric in SOAK_METRICS
+        }
+
+    def violations(self) -> list[SlopeViolationSchema]:
+        slopes = self.slopes()
+        return [
+            SlopeViolationSchema(metric=metric, slope=slopes[metric], max_slope=max_slope)
+            for metric, max_slope in self.max_slopes.items()
+            if metric in slopes and slopes[metric] > max_slope
+        ]
+
+    def save(self, results_dir: Path) -> Path:
+        """
+        Сохраняет временной ряд в soak-report.csv и полные замеры (с топом аллокаций) в soak-report.json.
+
+        :return: Путь к CSV-файлу.
+        """
+        csv_path = results_dir / "soak-report.csv"
+        with open(csv_path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["elapsed", "iterations", *SOAK_METRICS])
+            for sample in self.samples:
+                writer.writerow([
+                    f"{sample.elapsed:.1f}", sample.iterations,
+                    *(getattr(sample, metric) for metric in SOAK_METRICS)
+                ])
+
+        (results_dir / "soak-report.json").write_text(json.dumps({
+            "slopes": self.slopes(),
+            "max_slopes": self.max_slopes,
+            "samples": [sample.model_dump() for sample in self.samples]
+        }, indent=2, ensure_ascii=False))
+
+        return csv_path
+
+    def summary(self) -> str:
+        if not self.samples:
+            return "Нет замеров"
+
+        first, last = self.samples[0], self.samples[-1]
+        lines = [f"Длительность: {last.elapsed:.0f}s, тестов: {last.iterations}, замеров: {len(self.samples)}"]
+
+        slopes = self.slopes()
+        for metric in SOAK_METRICS:
+            slope = f"{slopes[metric]:+.3f}/мин" if metric in slopes else "мало замеров"
+            lines.append(f"  {metric:<13} {getattr(first, metric):>10.1f} -> {getattr(last, metric):>10.1f}  {slope}")
+
+        if last.top_allocations:
+            lines.append("Топ аллокаций на конец прогона:")
+            lines.extend(f"  {allocation}" for allocation in last.top_allocations)
+
+        for violation in self.violations():
+            lines.append(f"ПРЕВЫШЕН НАКЛОН {violation.render()}")
+
+        return "\n".join(lines)
@@ -0,0 +1,103 @@
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from pydantic import BaseModel
+
+# Корень репозитория: отсюда запускаются тесты и ищутся conftest.py и tests/
+DEFAULT_ROOT = Path(__file__).resolve().parent.parent
+
+_IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+class ImportTimeSchema(BaseModel):
+    """
+    Время импорта одного модуля по данным `python -X importtime`, в миллисекундах.
+    """
+    module: str
+    self_time: float
+    cumulative: float
+    depth: int
+
+
+def discover_startup_modules(root: Path = DEFAULT_ROOT) -> list[str]:
+    """
+    Возвращает модули, импортируемые при сборе тестов: плагины из conftest.py и тестовые модули.
+
+    :param root: Корень репозитория.
+    """
+    conftest = (root / "conftest.py").read_text()
+    plugins = re.findall(r"[\"']((?:fixtures)\.[\w.]+)[\"']", conftest)
+
+    tests = [
+        ".".join(path.relative_to(root).with_suffix("").parts)
+        for path in sorted((root / "tests").rglob("test_*.py"))
+    ]
+
+    return ["conftest", *plugins, *tests]
+
+
+def profile_imports(modules: list[str], root: Path = DEFAULT_ROOT) -> list[ImportTimeSchema]:
+    """
+    Импортирует модули в отдельном интерпретаторе с `-X importtime` и разбирает его отчёт.
+
+    Замер выполняется в новом процессе, поэтому отражает холодный старт воркера.
+
+    :param modules: Импортируемые модули.
+    :param root: Каталог, из которого запускается интерпретатор.
+    :return: Список ImportTimeSchema в порядке завершения импорта.
+    """
+    code = "\n".join(f"import {module}" for module in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if match := _IMPORT_TIME_LINE.match(line):
+            self_time, cumulative, indent, module = match.groups()
+            entries.append(ImportTimeSchema(
+                module=module,
+                self_time=int(self_time) / 1000,
+                cumulative=int(cumulative) / 1000,
+                depth=(len(indent) - 1) // 2
+            ))
+
+    return entries
+
+
+def render_import_report(entries: list[ImportTimeSchema], top: int = 20) -> str:
+    """
+    Строит отчёт: общее время импорта и самые дорогие модули по накопленному и собственному времени.
+    """
+    total = sum(entry.cumulative for entry in entries if entry.depth == 0)
+    lines = [f"Общее время импорта: {total:.1f}ms, модулей: {len(entries)}", "", "По накопленному времени:"]
+
+    for entry in sorted(entries, key=lambda item: item.cumulative, reverse=True)[:top]:
+        lines.append(f"  {entry.cumulative:9.1f}ms  {entry.module}")
+
+    lines += ["", "По собственному времени:"]
+    for entry in sorted(entries, key=lambda item: item.self_time, reverse=True)[:top]:
+        lines.append(f"  {entry.self_time:9.1f}ms  {entry.module}")
+
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Профиль времени импорта при старте тестов")
+    parser.add_argument("modules", nargs="*", help="Модули (по умолчанию — плагины из conftest.py и тесты)")
+    parser.add_argument("--top", type=int, default=20, help="Сколько модулей показать")
+    args = parser.parse_args()
+
+    entries = profile_imports(args.modules or discover_startup_modules())
+    print(render_import_report(entries, top=args.top))
+
+
+if __name__ == "__main__":
+    main()
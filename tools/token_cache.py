@@ -0,0 +1,204 @@
+import base64
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from http import HTTPStatus
+from pathlib import Path
+from typing import Callable, Generator, Iterator
+
+from httpx import Auth, ByteStream, Request, Response
+
+try:
+    import fcntl
+except ImportError:  # Windows: блокировка между процессами недоступна, остаётся блокировка внутри процесса
+    fcntl = None
+
+# Количество байтовых диапазонов в файле блокировок: ключи с одинаковым остатком делят блокировку
+_LOCK_SLOTS: int = 4096
+
+
+def get_token_expiry(access_token: str) -> float | None:
+    """
+    Время истечения токена из claim exp, если токен — JWT. None, если срок определить нельзя.
+    """
+    try:
+        payload = access_token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, ValueError, KeyError, TypeError):
+        return None
+
+
+class TokenCache:
+    """
+    Кеш access-токенов в SQLite, общий для воркеров xdist и сохраняемый между сессиями.
+
+    Ключ — хеш адреса API, email и пароля: сам пароль не хранится, а смена пароля или стенда
+    не приводит к использованию чужого токена. Срок жизни берётся из exp токена (JWT) или из ttl.
+
+    Логин одного и того же пользователя сериализуется межпроцессной блокировкой (fcntl на байтовый
+    диапазон файла <file>.lock): пока один воркер логинится, остальные ждут и получают его токен
+    из кеша, вместо того чтобы одновременно идти в login.
+
+    Токен, который сервер отклонил (сброс базы, смена секрета, logout), заменяется через refresh.
+    """
+
+    def __init__(self, file: Path, ttl: float, min_remaining: float):
+        """
+        :param file: Файл базы SQLite.
+        :param ttl: Срок жизни токена, если его нельзя определить из самого токена, в секундах.
+        :param min_remaining: Токен, который истекает раньше чем через min_remaining секунд, считается устаревшим.
+        """
+        self.file = file
+        self.ttl = ttl
+        self.min_remaining = min_remaining
+        self.stats: Counter[str] = Counter()
+
+        self._lock = threading.Lock()
+        self.file.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS tokens (key TEXT PRIMARY KEY, access_token TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def build_key(base_url: str, email: str, password: str) -> str:
+        return hashlib.sha256(f"{base_url}\n{email}\n{password}".encode()).hexdigest()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # with sqlite3.Connection только фиксирует транзакцию, поэтому соединение закрывается явно
+        connection = sqlite3.connect(self.file, timeout=30)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @contextmanager
+    def _locked(self, key: str) -> Iterator[None]:
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+
+            offset = int(key[:8], 16) % _LOCK_SLOTS
+            fd = os.open(f"{self.file}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.lockf(fd, fcntl.LOCK_EX, 1, offset)
+                yield
+            finally:
+                os.close(fd)
+
+    def get(self, key: str) -> str | None:
+        with self._connect() as connection:
+            row = connection.execute("SELECT access_token, expires_at FROM tokens WHERE key = ?", (key,)).fetchone()
+
+        if row is None:
+            return None
+
+        access_token, expires_at = row
+        return access_token if expires_at - self.min_remaining > time.time() else None
+
+    def put(self, key: str, access_token: str):
+        expires_at = get_token_expiry(access_token) or time.time() + self.ttl
+        with self._connect() as connection:
+            connection.execute("INSERT OR REPLACE INTO tokens VALUES (?, ?, ?)", (key, access_token, expires_at))
+
+    def invalidate(self, key: str):
+        with self._connect() as connection:
+            connection.execute("DELETE FROM tokens WHERE key = ?", (key,))
+
+    def get_or_login(self, key: str, login: Callable[[], str]) -> str:
+        """
+        Возвращает токен из кеша или выполняет login и сохраняет его результат.
+
+        :param key: Ключ пользователя (build_key).
+        :param login: Функция логина, возвращающая access-токен.
+        """
+        if (token := self.get(key)) is not None:
+            self.stats["hit"] += 1
+            return token
+
+        with self._locked(key):
+            # Пока ждали блокировку, другой воркер мог уже залогиниться
+            if (token := self.get(key)) is not None:
+                self.stats["hit"] += 1
+                return token
+
+            token = login()
+            self.put(key, token)
+            self.stats["login"] += 1
+            return token
+
+    def refresh(self, key: str, rejected_token: str, login: Callable[[], str]) -> str:
+        """
+        Заменяет отклонённый сервером токен: удаляет его из кеша и выполняет login.
+
+        Если другой воркер уже заменил токен, возвращается его токен без повторного логина.
+
+        :param key: Ключ пользователя (build_key).
+        :param rejected_token: Токен, на который сервер ответил 401.
+        :param login: Функция логина, возвращающая access-токен.
+        """
+        with self._locked(key):
+            if (token := self.get(key)) is not None and token != rejected_token:
+                self.stats["hit"] += 1
+                return token
+
+            self.invalidate(key)
+            self.stats["rejected"] += 1
+
+            token = login()
+            self.put(key, token)
+            self.stats["login"] += 1
+            return token
+
+    def summary(self) -> str:
+        return ", ".join(f"{name}={count}" for name, count in sorted(self.stats.items()))
+
+
+class TokenCacheAuth(Auth):
+    """
+    Аутентификация httpx токеном из TokenCache.
+
+    На ответ 401 отклонённый токен удаляется из кеша, выполняется новый логин, и запрос повторяется
+    один раз с новым токеном. Запросы с потоковым телом не повторяются (тело уже прочитано):
+    они возвращают 401, но следующий запрос клиента уже идёт с новым токеном.
+    """
+
+    def __init__(self, cache: TokenCache, key: str, login: Callable[[], str]):
+        """
+        :param cache: Кеш токенов.
+        :param key: Ключ пользователя (TokenCache.build_key).
+        :param login: Функция логина, возвращающая access-токен.
+        """
+        self.cache = cache
+        self.key = key
+        self.login = login
+        self.access_token = cache.get_or_login(key, login)
+
+        self._lock = threading.Lock()
+
+    def auth_flow(self, request: Request) -> Generator[Request, Response, None]:
+        token = self.access_token
+        request.headers["Authorization"] = f"Bearer {token}"
+        response = yield request
+
+        if response.status_code != HTTPStatus.UNAUTHORIZED:
+            return
+
+        with self._lock:
+            # Пока ждали блокировку, другой поток клиента мог уже заменить токен
+            if self.access_token == token:
+                self.access_token = self.cache.refresh(self.key, token, self.login)
+
+        if isinstance(request.stream, ByteStream):
+            request.headers["Authorization"] = f"Bearer {self.access_token}"
+            yield request